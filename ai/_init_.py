@@ -1,5 +1,4 @@
-from ai.preprocessor import build_risk_score
-from ai.model import classify_zone
+from ai.risk import build_risk_score, classify_zone
 
 def predict_zone(issue: dict) -> dict:
     score = build_risk_score(issue)
@@ -0,0 +1,51 @@
+# ai/backfill_predictions.py
+"""
+Fills ai_category / ai_severity for issues that never got a prediction.
+
+Streams un-predicted rows in id order, classifies each chunk with one
+vectorized predict (ai.model.predict_issues_batch) and writes it back with one
+executemany, committing the chunk together with the job watermark. Safe to
+stop at any point; the next run resumes after the last committed id.
+
+    python -m ai.backfill_predictions                 # resume
+    python -m ai.backfill_predictions --restart       # from the first issue
+"""
+import argparse
+import time
+
+from ai.model import predict_issues_batch
+from backend.utils import db_utils
+
+JOB = "ai_predictions"
+
+
+def backfill(chunk: int = 1000, restart: bool = False, verbose: bool = True) -> int:
+    after_id = 0 if restart else db_utils.get_watermark(JOB)
+    done = 0
+    t0 = time.perf_counter()
+    for rows in db_utils.iter_unpredicted_issues(after_id=after_id, chunk=chunk):
+        preds = predict_issues_batch([(title, desc) for _, title, desc in rows])
+        db_utils.update_ai_fields_many(
+            [(cat, sev, issue_id) for (issue_id, _, _), (cat, sev, _) in zip(rows, preds)],
+            job=JOB,
+            last_id=rows[-1][0],
+        )
+        done += len(rows)
+        if verbose:
+            rate = done / max(time.perf_counter() - t0, 1e-9)
+            print(f"→ {done} issues predicted (up to id {rows[-1][0]}, {rate:,.0f}/s)")
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill ai_category / ai_severity")
+    parser.add_argument("--chunk", type=int, default=1000)
+    parser.add_argument("--restart", action="store_true", help="ignore the saved watermark")
+    args = parser.parse_args()
+
+    done = backfill(chunk=args.chunk, restart=args.restart)
+    print(f"✅ Backfilled {done} issue(s)" if done else "✅ Nothing to backfill")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# ai/compact.py
+"""
+Shrinks a trained bundle and reports what it costs.
+
+Most of an 8000-term unigram+bigram vocabulary carries next to no weight
+in the linear models. For a registry bundle this keeps only the top-k
+vocabulary terms, ranked by
+  - coef: largest |coefficient| over every class of every model in the bundle
+  - chi2: largest chi-square score against each model's training labels
+then slices the models' coefficient columns to match, optionally stores
+them (and the TF-IDF rows) as float32 and/or sparse (the smallest fraction
+zeroed), and drops the fitted vectorizer's stop_words_ (every term
+max_features cut; only needed for introspection). Nothing is refit: a
+report's TF-IDF row is re-normalized over the smaller vocabulary, which is
+what the accuracy column measures.
+
+Every variant is written to ai/artifacts/compact/<bundle>/<variant>/ with
+the bundle's usual file names (point AI_ARTIFACT_DIR at it to serve it)
+and evaluated on the held-out split of ai/data the trainers use:
+accuracy delta per model, artifact bytes, load time and per-request
+latency (one transform + predict_proba of every model).
+
+    python -m ai.compact --bundle shared
+    python -m ai.compact --bundle veracity --method chi2 --keep 4000 2000 1000 --float32 --sparse 0.5
+"""
+import argparse
+import copy
+import json
+import os
+import statistics
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_selection import chi2
+from sklearn.model_selection import train_test_split
+
+from ai import registry
+
+OUT_DIR = os.path.join(registry.ART_DIR, "compact")
+DATA_DIR = "ai/data"
+KEEP = [0.5, 0.25, 0.1]       # <= 1: fraction of the vocabulary, else a term count
+
+LATENCY_TEXTS = 200
+LOAD_ROUNDS = 5
+
+VERACITY_LABELS = {"legit": 0, "fake": 1, "spam": 2}
+
+
+# ---------- DATA ----------
+def _veracity_split(data_dir):
+    ver = pd.read_csv(os.path.join(data_dir, "veracity_1500.csv"))
+    ver["text"] = ver["text"].fillna("").astype(str)
+    ver["label"] = ver["label"].astype(str).str.strip().str.lower().map(VERACITY_LABELS)
+    ver = ver.dropna(subset=["label"])
+    y = ver["label"].astype(int)
+    return train_test_split(ver["text"], y, test_size=0.2, random_state=42, stratify=y)
+
+
+def datasets(bundle, data_dir=DATA_DIR) -> dict:
+    """
+    {model key: (train texts, train labels, test texts, test labels)}, split
+    as the bundle's trainer splits them (ai/train_veracity.py fits on every
+    row, so its "held-out" rows were seen in training).
+    """
+    training_csv = os.path.join(data_dir, "training_data.csv")
+    if bundle == "issue":
+        from ai.preprocess import preprocess
+        X_tr, X_te, cat_tr, cat_te, sev_tr, sev_te = preprocess(training_csv)
+        return {"category": (X_tr, cat_tr, X_te, cat_te), "severity": (X_tr, sev_tr, X_te, sev_te)}
+    if bundle == "fraud":
+        df = pd.read_csv(os.path.join(data_dir, "fraud_training_data.csv"))
+        text, y = df["text"].fillna("").astype(str), df["label"].astype(int)
+        X_tr, X_te, y_tr, y_te = train_test_split(text, y, test_size=0.2, random_state=42, stratify=y)
+        return {"model": (X_tr, y_tr, X_te, y_te)}
+    if bundle == "veracity":
+        X_tr, X_te, y_tr, y_te = _veracity_split(data_dir)
+        return {"model": (X_tr, y_tr, X_te, y_te)}
+    if bundle == "shared":
+        from ai.train_shared import _load_frames
+        df, ver = _load_frames(training_csv, os.path.join(data_dir, "veracity_1500.csv"))
+        tr, te = train_test_split(df, test_size=0.2, random_state=42)
+        ver_tr, ver_te = train_test_split(ver, test_size=0.2, random_state=42, stratify=ver["label"])
+        civic_tr, civic_te = tr[tr["category"].str.lower() != "spam"], te[te["category"].str.lower() != "spam"]
+        return {
+            "category": (civic_tr["text"], civic_tr["category"], civic_te["text"], civic_te["category"]),
+            "severity": (civic_tr["text"], civic_tr["severity"].astype(int),
+                         civic_te["text"], civic_te["severity"].astype(int)),
+            "fraud": (tr["text"], tr["fraud"], te["text"], te["fraud"]),
+            "veracity": (ver_tr["text"], ver_tr["label"], ver_te["text"], ver_te["label"]),
+        }
+    raise ValueError(f"no evaluation data for bundle {bundle!r}")
+
+
+# ---------- COMPACTION ----------
+def importance(method, vectorizer, models, data) -> np.ndarray:
+    """
+    One score per vocabulary column, each model's scores scaled to [0, 1]
+    and the max taken over models, so a term any model relies on is kept.
+    """
+    scores = []
+    for key, model in models.items():
+        if method == "coef":
+            s = np.abs(model.coef_).max(axis=0)
+        else:
+            X_tr, y_tr = data[key][0], data[key][1]
+            s = np.nan_to_num(chi2(vectorizer.transform(X_tr), y_tr)[0])
+        scores.append(s / (s.max() or 1.0))
+    return np.max(scores, axis=0)
+
+
+def prune_vectorizer(vectorizer, keep):
+    """
+    Copy of a fitted TfidfVectorizer with only the `keep` columns (old
+    indices, ascending), renumbered in order.
+    """
+    out = copy.deepcopy(vectorizer)
+    terms = np.empty(len(vectorizer.vocabulary_), dtype=object)
+    for term, col in vectorizer.vocabulary_.items():
+        terms[col] = term
+    out.vocabulary_ = {terms[old]: new for new, old in enumerate(keep)}
+    out.idf_ = vectorizer.idf_[keep]
+    out._tfidf.n_features_in_ = len(keep)
+    if hasattr(out, "stop_words_"):
+        del out.stop_words_
+    return out
+
+
+def compact_model(model, keep, float32=False, sparse=0.0):
+    """
+    sparse: fraction of the smallest |coef| to zero before storing coef_ as a
+    scipy.sparse matrix (0 keeps it dense).
+    """
+    out = copy.deepcopy(model)
+    coef = model.coef_[:, keep]
+    if float32:
+        coef = coef.astype(np.float32)
+        out.intercept_ = out.intercept_.astype(np.float32)
+    if sparse:
+        coef = coef.copy()
+        coef[np.abs(coef) < np.quantile(np.abs(coef), sparse)] = 0
+    out.coef_ = coef
+    out.n_features_in_ = len(keep)
+    if sparse:
+        out.sparsify()
+    return out
+
+
+# ---------- MEASUREMENTS ----------
+def _write(path, files, objects) -> int:
+    os.makedirs(path, exist_ok=True)
+    total = 0
+    for key, fname in files.items():
+        fpath = os.path.join(path, fname)
+        joblib.dump(objects[key], fpath)
+        total += os.path.getsize(fpath)
+    return total
+
+
+def _load_ms(path, files) -> float:
+    times = []
+    for _ in range(LOAD_ROUNDS):
+        t0 = time.perf_counter()
+        for fname in files.values():
+            joblib.load(os.path.join(path, fname))
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def _latency_us(vectorizer, models, texts) -> float:
+    times = []
+    for text in texts:
+        t0 = time.perf_counter()
+        X = vectorizer.transform([text])
+        for model in models.values():
+            model.predict_proba(X)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1e6
+
+
+def _accuracy(vectorizer, models, data) -> dict:
+    out = {}
+    for key, model in models.items():
+        _, _, X_te, y_te = data[key]
+        out[key] = float((model.predict(vectorizer.transform(X_te)) == np.asarray(y_te)).mean())
+    return out
+
+
+def _measure(name, path, files, vectorizer, models, data, texts, baseline=None) -> dict:
+    objects = {"vectorizer": vectorizer, **models}
+    acc = _accuracy(vectorizer, models, data)
+    return {
+        "variant": name,
+        "terms": len(vectorizer.vocabulary_),
+        "bytes": _write(path, files, objects),
+        "load_ms": round(_load_ms(path, files), 2),
+        "latency_us": round(_latency_us(vectorizer, models, texts), 1),
+        "accuracy": {k: round(v, 4) for k, v in acc.items()},
+        "accuracy_delta": {k: round(v - baseline[k], 4) for k, v in acc.items()} if baseline else None,
+        "path": path,
+    }
+
+
+# ---------- RUN ----------
+def compact(bundle="shared", method="coef", keep=KEEP, float32=False, sparse=0.0,
+            art_dir=None, out_dir=OUT_DIR, data_dir=DATA_DIR) -> list[dict]:
+    """
+    Writes the original and every compacted variant under out_dir/<bundle>/
+    and returns one measurement row per variant.
+    """
+    art_dir = art_dir or registry.ART_DIR
+    files = registry.BUNDLES[bundle]
+    objects = {key: joblib.load(os.path.join(art_dir, fname)) for key, fname in files.items()}
+    vectorizer = objects.pop("vectorizer")
+    models = objects
+    data = datasets(bundle, data_dir)
+    texts = list(next(iter(data.values()))[2])[:LATENCY_TEXTS]
+    root = os.path.join(out_dir, bundle)
+
+    rows = [_measure("original", os.path.join(root, "original"), files, vectorizer, models, data, texts)]
+    baseline = rows[0]["accuracy"]
+
+    n_terms = len(vectorizer.vocabulary_)
+    scores = importance(method, vectorizer, models, data)
+    variants = [("slim", n_terms)]    # every term kept: only stop_words_ dropped
+    for k in keep:
+        count = int(round(k * n_terms)) if k <= 1 else int(k)
+        variants.append((f"{method}{min(count, n_terms)}", min(count, n_terms)))
+
+    for label, count in variants:
+        cols = np.sort(np.argsort(-scores, kind="stable")[:count])
+        vect = prune_vectorizer(vectorizer, cols)
+        suffix = ("-f32" if float32 else "") + (f"-sparse{sparse:g}" if sparse else "")
+        rows.append(_measure(label, os.path.join(root, label), files, vect,
+                             {key: compact_model(m, cols) for key, m in models.items()}, data, texts, baseline))
+        if suffix:
+            if float32:
+                # float32 rows too: a sparse coef_ must match X's dtype
+                vect = copy.deepcopy(vect)
+                vect.set_params(dtype=np.float32)
+            small = {key: compact_model(m, cols, float32, sparse) for key, m in models.items()}
+            rows.append(_measure(label + suffix, os.path.join(root, label + suffix), files, vect, small, data,
+                                 texts, baseline))
+    return rows
+
+
+def print_table(rows):
+    keys = list(rows[0]["accuracy"])
+    head = "".join(f" {('Δ' + k)[:10]:>10}" for k in keys)
+    print(f"{'variant':<22} {'terms':>6} {'bytes':>10} {'load':>8} {'latency':>9}{head}")
+    base = rows[0]
+    for r in rows:
+        if r["accuracy_delta"] is None:
+            cells = "".join(f" {r['accuracy'][k]:>10.3f}" for k in keys)
+        else:
+            cells = "".join(f" {r['accuracy_delta'][k]:>+10.3f}" for k in keys)
+        ratio = f"({r['bytes'] / base['bytes']:.0%})" if r is not base else ""
+        print(f"{r['variant']:<22} {r['terms']:>6} {r['bytes']:>10,} {r['load_ms']:>6.1f}ms "
+              f"{r['latency_us']:>7.0f}µs{cells} {ratio}")
+    print("(original: accuracy on the held-out split; others: change vs original)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Prune and compact a trained bundle")
+    ap.add_argument("--bundle", default="shared", choices=sorted(set(registry.BUNDLES) - registry.SKLEARN_ONLY))
+    ap.add_argument("--method", default="coef", choices=("coef", "chi2"))
+    ap.add_argument("--keep", type=float, nargs="+", default=KEEP,
+                    help="terms to keep: fractions (<= 1) or counts")
+    ap.add_argument("--float32", action="store_true", help="also write float32 coefficients")
+    ap.add_argument("--sparse", type=float, default=0.0,
+                    help="also write sparse coefficients with this fraction of the smallest zeroed")
+    ap.add_argument("--data", default=DATA_DIR)
+    ap.add_argument("--out", default=OUT_DIR)
+    args = ap.parse_args()
+
+    rows = compact(args.bundle, args.method, args.keep, args.float32, args.sparse,
+                   out_dir=args.out, data_dir=args.data)
+    print_table(rows)
+    path = os.path.join(args.out, args.bundle, "report.json")
+    with open(path, "w") as f:
+        json.dump(rows, f, indent=2)
+    print(f"✅ Variants and report written to {os.path.dirname(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+# ai/evaluate.py
+"""
+Offline evaluation and inference benchmark for the served predictors.
+
+Runs every predictor over its labeled CSV in ai/data with the artifacts the
+app would load (registry, AI_ARTIFACT_DIR / AI_RUNTIME apply), one batch
+size at a time:
+
+  issue            ai.model.predict_issue / predict_issues_batch        training_data.csv
+  fraud            ai.fraud.predict_fraud / predict_fraud_batch          fraud_training_data.csv
+  fraud_standalone ai.predict_fraud.predict_fraud (no batch API)         fraud_training_data.csv
+  veracity         ai.veracity.predict_veracity / predict_veracity_batch veracity_1500.csv
+
+Batch size 1 calls the single-report function; larger sizes call the batch
+function (or loop over the single one when there is none). Each run reports
+p50 / p95 / p99 latency per call, throughput and peak RSS; accuracy and the
+confusion matrix come from the batch-size-1 predictions, and
+batch_agreement checks the batch path gives the same labels.
+
+Results go to ai/artifacts/eval/<timestamp>.json together with the registry
+version and a hash of every artifact file, so runs of different model
+versions can be compared:
+
+    python -m ai.evaluate                                  # every predictor
+    python -m ai.evaluate --predictor veracity --batch-sizes 1 16 128 --limit 500
+    python -m ai.evaluate --compare ai/artifacts/eval/20250101-120000.json
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+from ai import registry
+from ai.feature_store import file_hash
+
+DATA_DIR = "ai/data"
+OUT_DIR = os.path.join(registry.ART_DIR, "eval")
+BATCH_SIZES = [1, 8, 32, 128]
+LIMIT = 2000
+
+VERACITY_LABELS = ["legit", "fake", "spam"]
+
+
+# ---------- DATASETS ----------
+def _issue_rows(data_dir):
+    df = pd.read_csv(os.path.join(data_dir, "training_data.csv"))
+    df = df[df["category"].astype(str).str.lower() != "spam"]
+    pairs = list(zip(df["title"].fillna("").astype(str), df["description"].fillna("").astype(str)))
+    return pairs, list(zip(df["category"].astype(str), df["severity"].astype(int)))
+
+
+def _fraud_rows(data_dir):
+    df = pd.read_csv(os.path.join(data_dir, "fraud_training_data.csv"))
+    # one text column: it goes in as the title, as ai/test.py did
+    return [(t, "") for t in df["text"].fillna("").astype(str)], [bool(v) for v in df["label"].astype(int)]
+
+
+def _veracity_rows(data_dir):
+    df = pd.read_csv(os.path.join(data_dir, "veracity_1500.csv"))
+    df["label"] = df["label"].astype(str).str.strip().str.lower()
+    df = df[df["label"].isin(VERACITY_LABELS)]
+    return [(t, "") for t in df["text"].fillna("").astype(str)], df["label"].tolist()
+
+
+# ---------- PREDICTORS ----------
+def _predictors() -> dict:
+    """
+    {name: (load rows, single fn, batch fn | None, {target: label of one output})}
+    """
+    from ai import fraud, model, predict_fraud, veracity
+
+    return {
+        "issue": (
+            _issue_rows, lambda t, d: model.predict_issue(t, d), model.predict_issues_batch,
+            {"category": lambda out, y: (str(out[0]), y[0]), "severity": lambda out, y: (int(out[1]), y[1])},
+        ),
+        "fraud": (
+            _fraud_rows, lambda t, d: fraud.predict_fraud(t, d), fraud.predict_fraud_batch,
+            {"spam": lambda out, y: (bool(out[0]), y)},
+        ),
+        "fraud_standalone": (
+            _fraud_rows, lambda t, d: predict_fraud.predict_fraud(t, d), None,
+            {"fraud": lambda out, y: (bool(out[0]), y)},
+        ),
+        "veracity": (
+            _veracity_rows, lambda t, d: veracity.predict_veracity(t, d), veracity.predict_veracity_batch,
+            {"verdict": lambda out, y: (out[0], y)},
+        ),
+    }
+
+
+# ---------- MEASUREMENTS ----------
+def _reset_peak_rss():
+    # "5" resets VmHWM (Linux); elsewhere the peak covers the whole process
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentile(sorted_ms, q) -> float:
+    idx = min(len(sorted_ms) - 1, max(0, round(q / 100 * len(sorted_ms)) - 1))
+    return sorted_ms[idx]
+
+
+def _confusion(pairs) -> dict:
+    """
+    pairs: [(predicted, expected)] -> accuracy + {expected: {predicted: count}}
+    """
+    matrix = {}
+    for pred, true in pairs:
+        row = matrix.setdefault(str(true), {})
+        row[str(pred)] = row.get(str(pred), 0) + 1
+    labels = sorted(set(matrix) | {p for row in matrix.values() for p in row})
+    return {
+        "accuracy": round(sum(p == t for p, t in pairs) / len(pairs), 4),
+        "labels": labels,
+        "matrix": {t: {p: matrix.get(t, {}).get(p, 0) for p in labels} for t in labels if t in matrix},
+    }
+
+
+def run_predictor(name, spec, data_dir=DATA_DIR, batch_sizes=BATCH_SIZES, limit=LIMIT) -> dict:
+    load_rows, single, batch, targets = spec
+    pairs, labels = load_rows(data_dir)
+    pairs, labels = pairs[:limit], labels[:limit]
+
+    single(*pairs[0])        # load the models outside the timings
+    runs, outputs = [], {}
+    for size in batch_sizes:
+        _reset_peak_rss()
+        call_ms, outs = [], []
+        t_start = time.perf_counter()
+        for i in range(0, len(pairs), size):
+            chunk = pairs[i:i + size]
+            t0 = time.perf_counter()
+            if size == 1:
+                res = [single(*chunk[0])]
+            elif batch is not None:
+                res = batch(chunk)
+            else:
+                res = [single(t, d) for t, d in chunk]
+            call_ms.append((time.perf_counter() - t0) * 1000)
+            outs += res
+        total_s = time.perf_counter() - t_start
+        call_ms.sort()
+        outputs[size] = outs
+        runs.append({
+            "batch_size": size,
+            "calls": len(call_ms),
+            "p50_ms": round(_percentile(call_ms, 50), 3),
+            "p95_ms": round(_percentile(call_ms, 95), 3),
+            "p99_ms": round(_percentile(call_ms, 99), 3),
+            "mean_ms": round(statistics.fmean(call_ms), 3),
+            "per_report_ms": round(total_s * 1000 / len(pairs), 4),
+            "throughput_per_s": round(len(pairs) / total_s, 1),
+            "peak_rss_mb": round(_peak_rss_mb(), 1),
+            "batched": size > 1 and batch is not None,
+        })
+
+    reference = outputs[batch_sizes[0]]
+    metrics = {}
+    for target, pick in targets.items():
+        metrics[target] = _confusion([pick(out, y) for out, y in zip(reference, labels)])
+        metrics[target]["batch_agreement"] = {
+            str(size): round(sum(pick(a, y)[0] == pick(b, y)[0] for a, b, y in zip(reference, outs, labels))
+                             / len(labels), 4)
+            for size, outs in outputs.items() if size != batch_sizes[0]
+        }
+    return {"rows": len(pairs), "runs": runs, "metrics": metrics}
+
+
+# ---------- REPORT ----------
+def _artifacts() -> dict:
+    out = {}
+    for name, files in registry.BUNDLES.items():
+        for fname in files.values():
+            path = os.path.join(registry.ART_DIR, fname)
+            if os.path.exists(path):
+                out[fname] = file_hash(path)
+    return out
+
+
+def evaluate(names=None, data_dir=DATA_DIR, batch_sizes=BATCH_SIZES, limit=LIMIT, verbose=True) -> dict:
+    predictors = _predictors()
+    results = {}
+    for name in names or predictors:
+        try:
+            results[name] = run_predictor(name, predictors[name], data_dir, batch_sizes, limit)
+        except FileNotFoundError as e:
+            results[name] = {"skipped": str(e)}
+        if verbose:
+            print_predictor(name, results[name])
+    return {
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "data_dir": data_dir,
+        "registry": {"runtime": registry.RUNTIME, "artifact_dir": registry.ART_DIR, "version": registry.version()},
+        "artifacts": _artifacts(),
+        "predictors": results,
+    }
+
+
+def print_predictor(name, res):
+    if "skipped" in res:
+        print(f"\n⚠️ {name}: skipped ({res['skipped']})")
+        return
+    print(f"\n{name} ({res['rows']} rows)")
+    print(f"  {'batch':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'per report':>11} {'reports/s':>10} {'peak RSS':>9}")
+    for r in res["runs"]:
+        print(f"  {r['batch_size']:>5} {r['p50_ms']:>7.2f}ms {r['p95_ms']:>7.2f}ms {r['p99_ms']:>7.2f}ms "
+              f"{r['per_report_ms']:>9.3f}ms {r['throughput_per_s']:>10,.0f} {r['peak_rss_mb']:>7.0f}MB")
+    for target, m in res["metrics"].items():
+        agree = ", ".join(f"b{k}: {v:.1%}" for k, v in m["batch_agreement"].items())
+        print(f"  {target}: accuracy {m['accuracy']:.3f}" + (f" (batch agreement {agree})" if agree else ""))
+        labels = m["labels"]
+        print("    " + " " * 12 + "".join(f" {p[:9]:>9}" for p in labels) + "   ← predicted")
+        for t, row in m["matrix"].items():
+            print(f"    {t[:12]:>12}" + "".join(f" {row[p]:>9}" for p in labels))
+
+
+def print_comparison(old, new):
+    print(f"\nvs {old['created_at']} (registry {old['registry']['version']})")
+    changed = sorted(k for k in set(old["artifacts"]) | set(new["artifacts"])
+                     if old["artifacts"].get(k) != new["artifacts"].get(k))
+    print(f"  artifacts changed: {', '.join(changed) or 'none'}")
+    for name, res in new["predictors"].items():
+        prev = old["predictors"].get(name)
+        if not prev or "skipped" in res or "skipped" in prev:
+            continue
+        for target, m in res["metrics"].items():
+            if target in prev["metrics"]:
+                delta = m["accuracy"] - prev["metrics"][target]["accuracy"]
+                print(f"  {name}/{target}: accuracy {m['accuracy']:.3f} ({delta:+.3f})")
+        prev_runs = {r["batch_size"]: r for r in prev["runs"]}
+        for r in res["runs"]:
+            p = prev_runs.get(r["batch_size"])
+            if p:
+                print(f"  {name} batch {r['batch_size']}: p50 {r['p50_ms']:.2f}ms ({r['p50_ms'] / p['p50_ms']:.2f}x), "
+                      f"{r['throughput_per_s']:,.0f}/s ({r['throughput_per_s'] / p['throughput_per_s']:.2f}x)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Evaluate and benchmark the AI predictors on ai/data")
+    ap.add_argument("--predictor", action="append", choices=("issue", "fraud", "fraud_standalone", "veracity"),
+                    help="only this predictor (repeatable)")
+    ap.add_argument("--batch-sizes", type=int, nargs="+", default=BATCH_SIZES)
+    ap.add_argument("--limit", type=int, default=LIMIT, help="rows per predictor")
+    ap.add_argument("--data", default=DATA_DIR)
+    ap.add_argument("--out", default=OUT_DIR)
+    ap.add_argument("--compare", help="earlier result JSON to compare against")
+    args = ap.parse_args()
+
+    report = evaluate(args.predictor, args.data, sorted(set(args.batch_sizes)), args.limit)
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(json.load(f), report)
+    print(f"\n✅ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
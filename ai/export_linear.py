@@ -0,0 +1,209 @@
+# ai/export_linear.py
+"""
+Exports the pickled TF-IDF + LogisticRegression bundles to plain .npy arrays
+for the NumPy runtime (ai/linear_runtime.py), and checks that both give the
+same predict_proba.
+
+    python -m ai.export_linear              # every trained bundle
+    python -m ai.export_linear --check      # parity vs scikit-learn on ai/data
+
+Layout, per bundle:
+    ai/artifacts/numpy/<bundle>/manifest.json
+    ai/artifacts/numpy/<bundle>/<version>/<key>/{terms,columns,idf}.npy   vectorizer
+    ai/artifacts/numpy/<bundle>/<version>/<key>/{coef,intercept,classes}.npy  model
+
+Every export goes into a fresh <version> directory and the manifest is
+swapped in last with os.replace, so a serving process that has the previous
+arrays memory-mapped keeps reading them until the registry reloads.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import joblib
+import numpy as np
+
+from ai import registry
+from ai.linear_runtime import FORMAT, MANIFEST, load_bundle
+
+PARITY_TOL = 1e-9
+
+
+def _export_tfidf(vect, path) -> dict:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    if not isinstance(vect, TfidfVectorizer):
+        raise ValueError(f"only TfidfVectorizer can be exported, got {type(vect).__name__}")
+    if vect.analyzer != "word" or vect.tokenizer is not None or vect.preprocessor is not None:
+        raise ValueError("only the built-in word analyzer can be exported")
+    if vect.strip_accents not in (None, "unicode", "ascii"):
+        raise ValueError(f"strip_accents={vect.strip_accents!r} can't be exported")
+
+    terms = np.array(sorted(vect.vocabulary_))
+    columns = np.array([vect.vocabulary_[t] for t in terms], dtype=np.int64)
+    idf = vect.idf_ if vect.use_idf else np.ones(len(terms))
+    stop = vect.get_stop_words()
+
+    os.makedirs(path)
+    np.save(os.path.join(path, "terms.npy"), terms)
+    np.save(os.path.join(path, "columns.npy"), columns)
+    np.save(os.path.join(path, "idf.npy"), np.asarray(idf, dtype=np.float64))
+    return {
+        "kind": "tfidf",
+        "n_features": len(terms),
+        "lowercase": bool(vect.lowercase),
+        "strip_accents": vect.strip_accents,
+        "token_pattern": vect.token_pattern,
+        "stop_words": sorted(stop) if stop else None,
+        "ngram_range": list(vect.ngram_range),
+        "binary": bool(vect.binary),
+        "sublinear_tf": bool(vect.sublinear_tf),
+        "norm": vect.norm,
+        "dtype": np.dtype(vect.dtype).name,
+    }
+
+
+def _export_logistic(model, path) -> dict:
+    from sklearn.linear_model import LogisticRegression
+
+    if not isinstance(model, LogisticRegression):
+        raise ValueError(f"only LogisticRegression can be exported, got {type(model).__name__}")
+
+    coef = model.coef_.toarray() if hasattr(model.coef_, "toarray") else model.coef_   # sparsify()'d, ai/compact.py
+    os.makedirs(path)
+    np.save(os.path.join(path, "coef.npy"), np.ascontiguousarray(coef, dtype=np.float64))
+    np.save(os.path.join(path, "intercept.npy"), np.asarray(model.intercept_, dtype=np.float64))
+    classes = np.asarray(model.classes_)
+    if classes.dtype == object:
+        classes = classes.astype(str)      # string labels; .npy can't hold objects without pickle
+    np.save(os.path.join(path, "classes.npy"), classes)
+    return {"kind": "logistic", "n_classes": len(model.classes_)}
+
+
+def export_bundle(name, art_dir=None, out_dir=None) -> str:
+    """
+    Exports one trained bundle; returns its directory.
+    """
+    art_dir = art_dir or registry.ART_DIR
+    out_dir = out_dir or registry.NUMPY_DIR
+    files = registry.BUNDLES[name]
+    bundle_dir = os.path.join(out_dir, name)
+    version = time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+    version_dir = os.path.join(bundle_dir, version)
+
+    objects = {}
+    for key, fname in files.items():
+        obj = joblib.load(os.path.join(art_dir, fname))
+        path = os.path.join(version_dir, key)
+        if key == "vectorizer":
+            objects[key] = _export_tfidf(obj, path)
+        else:
+            objects[key] = _export_logistic(obj, path)
+
+    manifest = {"format": FORMAT, "bundle": name, "version": version, "source": files, "objects": objects}
+    tmp = os.path.join(bundle_dir, MANIFEST + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, os.path.join(bundle_dir, MANIFEST))
+
+    # unlinking is safe for processes that still have the old arrays mapped
+    for entry in os.listdir(bundle_dir):
+        old = os.path.join(bundle_dir, entry)
+        if entry != version and os.path.isdir(old):
+            shutil.rmtree(old, ignore_errors=True)
+    return bundle_dir
+
+
+def export_all(art_dir=None, out_dir=None) -> list[str]:
+    art_dir = art_dir or registry.ART_DIR
+    done = []
+    for name, files in registry.BUNDLES.items():
+        if name in registry.SKLEARN_ONLY:
+            continue
+        if not all(os.path.exists(os.path.join(art_dir, f)) for f in files.values()):
+            continue
+        export_bundle(name, art_dir, out_dir)
+        done.append(name)
+    return done
+
+
+# ---------- PARITY ----------
+def _texts(data_dir="ai/data") -> list[str]:
+    import pandas as pd
+
+    texts = []
+    path = os.path.join(data_dir, "training_data.csv")
+    if os.path.exists(path):
+        df = pd.read_csv(path)
+        df.columns = [c.strip().lower() for c in df.columns]
+        texts += (df["title"].fillna("").astype(str) + " " + df["description"].fillna("").astype(str)).tolist()
+    for fname in ("veracity_1500.csv", "fraud_training_data.csv"):
+        path = os.path.join(data_dir, fname)
+        if os.path.exists(path):
+            texts += pd.read_csv(path)["text"].fillna("").astype(str).tolist()
+    return texts
+
+
+def check_parity(texts, art_dir=None, out_dir=None) -> dict:
+    """
+    {bundle: {model key: (max |proba diff|, predict agreement)}} for every
+    exported bundle, scikit-learn pickles vs the NumPy runtime.
+    """
+    art_dir = art_dir or registry.ART_DIR
+    out_dir = out_dir or registry.NUMPY_DIR
+    report = {}
+    for name, files in registry.BUNDLES.items():
+        bundle_dir = os.path.join(out_dir, name)
+        if not os.path.exists(os.path.join(bundle_dir, MANIFEST)):
+            continue
+        ref = {key: joblib.load(os.path.join(art_dir, f)) for key, f in files.items()}
+        fast = load_bundle(bundle_dir)
+        X_ref = ref["vectorizer"].transform(texts)
+        X_fast = fast["vectorizer"].transform(texts)
+        report[name] = {}
+        for key in files:
+            if key == "vectorizer":
+                continue
+            p_ref = ref[key].predict_proba(X_ref)
+            p_fast = fast[key].predict_proba(X_fast)
+            agree = float(np.mean(ref[key].predict(X_ref) == fast[key].predict(X_fast)))
+            report[name][key] = (float(np.abs(p_ref - p_fast).max()), agree)
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--bundle", action="append", choices=sorted(set(registry.BUNDLES) - registry.SKLEARN_ONLY),
+                    help="export only this bundle (repeatable)")
+    ap.add_argument("--check", action="store_true", help="compare against scikit-learn on --data")
+    ap.add_argument("--data", default="ai/data")
+    args = ap.parse_args()
+
+    if args.check:
+        texts = _texts(args.data)
+        if not texts:
+            sys.exit(f"No CSVs with report text in {args.data}")
+        report = check_parity(texts)
+        if not report:
+            sys.exit("Nothing exported yet. Run: python -m ai.export_linear")
+        ok = True
+        print(f"Parity on {len(texts)} texts (tolerance {PARITY_TOL:g}):")
+        for name, models in report.items():
+            for key, (diff, agree) in models.items():
+                good = diff <= PARITY_TOL and agree == 1.0
+                ok &= good
+                print(f"  {'✅' if good else '⚠️'} {name}/{key}: max |Δp| = {diff:.2e}, predict agreement {agree:.2%}")
+        sys.exit(0 if ok else 1)
+
+    names = args.bundle or None
+    done = [n for n in names if export_bundle(n)] if names else export_all()
+    if not done:
+        sys.exit("No trained bundles found. Run: python -m ai.train_shared")
+    print(f"✅ Exported {', '.join(done)} to {registry.NUMPY_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# ai/feature_store.py
+"""
+On-disk cache of vectorized training sets.
+
+Every trainer reads its CSVs with pandas, rebuilds the text column and fits
+TF-IDF from scratch, even when neither the data nor the settings changed.
+load_or_build() keys a trainer's output (the fitted vectorizer, its sparse
+matrices and label arrays) by a content hash of the source CSVs plus the
+vectorizer's parameters and the trainer's own params (split, filters), and
+on a hit loads it instead of calling build(): no parsing, no fitting.
+
+Layout, one directory per entry, written to a temp dir and renamed in:
+    ai/artifacts/feature_store/<name>-<key>/vectorizer.pkl
+    ai/artifacts/feature_store/<name>-<key>/<matrix>.npz      scipy.sparse
+    ai/artifacts/feature_store/<name>-<key>/arrays.npz        labels
+    ai/artifacts/feature_store/<name>-<key>/meta.json
+
+Bump a trainer's params (e.g. "recipe": 2) when its preprocessing code
+changes; FEATURE_STORE=0 turns the cache off.
+
+    python -m ai.feature_store              # list entries
+    python -m ai.feature_store --clear
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import joblib
+import numpy as np
+import scipy.sparse as sp
+
+from ai import registry
+
+FORMAT = 1
+STORE_DIR = os.getenv("AI_FEATURE_STORE_DIR", os.path.join(registry.ART_DIR, "feature_store"))
+ENABLED = os.getenv("FEATURE_STORE", "1") != "0"
+KEEP = 3                        # entries kept per trainer + vectorizer settings
+
+_HASH_CHUNK = 1 << 20
+
+
+def file_hash(path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _vectorizer_config(vectorizer) -> dict:
+    params = {k: repr(v) for k, v in sorted(vectorizer.get_params().items())}
+    return {"class": type(vectorizer).__qualname__, "params": params}
+
+
+def entry_key(name, sources, vectorizer, params=None) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    h.update(json.dumps({
+        "format": FORMAT,
+        "name": name,
+        "sources": [file_hash(p) for p in sources],
+        "vectorizer": _vectorizer_config(vectorizer),
+        "params": params or {},
+    }, sort_keys=True, default=repr).encode())
+    return h.hexdigest()
+
+
+# ---------- READ / WRITE ----------
+def _plain(a):
+    a = np.asarray(a)
+    return a.astype(str) if a.dtype == object else a    # no pickled objects in the .npz
+
+
+def _save(path, vectorizer, matrices, arrays, meta):
+    tmp = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    joblib.dump(vectorizer, os.path.join(tmp, "vectorizer.pkl"))
+    for key, X in matrices.items():
+        sp.save_npz(os.path.join(tmp, f"{key}.npz"), X, compressed=False)
+    np.savez(os.path.join(tmp, "arrays.npz"), **{k: _plain(a) for k, a in arrays.items()})
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)   # a concurrent build got there first
+
+
+def _load(path):
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    vectorizer = joblib.load(os.path.join(path, "vectorizer.pkl"))
+    matrices = {key: sp.load_npz(os.path.join(path, f"{key}.npz")) for key in meta["matrices"]}
+    with np.load(os.path.join(path, "arrays.npz"), allow_pickle=False) as npz:
+        # str labels back to object arrays, as pandas hands them out
+        arrays = {key: npz[key].astype(object) if npz[key].dtype.kind == "U" else npz[key] for key in npz.files}
+    return vectorizer, matrices, arrays
+
+
+def _prune(store_dir, name, config):
+    # older data versions of the same trainer + vectorizer settings
+    entries = []
+    for d in os.listdir(store_dir):
+        meta_path = os.path.join(store_dir, d, "meta.json")
+        if d.rsplit("-", 1)[0] != name or not os.path.exists(meta_path):
+            continue
+        with open(meta_path) as f:
+            if json.load(f)["vectorizer"] == config:
+                entries.append(d)
+    entries.sort(key=lambda d: os.path.getmtime(os.path.join(store_dir, d)))
+    for old in entries[:-KEEP]:
+        shutil.rmtree(os.path.join(store_dir, old), ignore_errors=True)
+
+
+# ---------- API ----------
+def load_or_build(name, sources, vectorizer, build, params=None, store_dir=None, verbose=True):
+    """
+    (vectorizer, {matrix name: csr_matrix}, {array name: ndarray}) for a
+    training set, from the store when the source files, the vectorizer
+    settings and params are unchanged.
+
+    build(vectorizer) reads the sources, fits the (unfitted) vectorizer and
+    returns (matrices, arrays); string labels are stored as str and come back
+    as object arrays either way.
+    """
+    store_dir = store_dir or STORE_DIR
+    key = entry_key(name, sources, vectorizer, params)
+    path = os.path.join(store_dir, f"{name}-{key}")
+
+    if ENABLED and os.path.exists(os.path.join(path, "meta.json")):
+        t0 = time.perf_counter()
+        out = _load(path)
+        os.utime(path)      # most recently used survives _prune
+        if verbose:
+            print(f"→ feature store hit: {name}-{key} ({(time.perf_counter() - t0) * 1000:.0f}ms)")
+        return out
+
+    t0 = time.perf_counter()
+    matrices, arrays = build(vectorizer)
+    build_s = time.perf_counter() - t0
+    # same types a hit returns
+    matrices = {k: sp.csr_matrix(X) for k, X in matrices.items()}
+    arrays = {k: np.asarray(a) for k, a in arrays.items()}
+    if not ENABLED:
+        return vectorizer, matrices, arrays
+    os.makedirs(store_dir, exist_ok=True)
+    _save(path, vectorizer, matrices, arrays, {
+        "name": name,
+        "key": key,
+        "sources": {p: file_hash(p) for p in sources},
+        "params": params or {},
+        "vectorizer": _vectorizer_config(vectorizer),
+        "matrices": {k: list(X.shape) for k, X in matrices.items()},
+        "build_s": round(build_s, 3),
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    })
+    _prune(store_dir, name, _vectorizer_config(vectorizer))
+    if verbose:
+        print(f"→ feature store miss: {name}-{key} built in {build_s:.2f}s")
+    return vectorizer, matrices, arrays
+
+
+def entries(store_dir=None) -> list[dict]:
+    store_dir = store_dir or STORE_DIR
+    if not os.path.isdir(store_dir):
+        return []
+    out = []
+    for d in sorted(os.listdir(store_dir)):
+        meta_path = os.path.join(store_dir, d, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                out.append(json.load(f))
+    return out
+
+
+def clear(store_dir=None):
+    shutil.rmtree(store_dir or STORE_DIR, ignore_errors=True)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Cached training features")
+    ap.add_argument("--clear", action="store_true", help="delete every entry")
+    args = ap.parse_args()
+
+    if args.clear:
+        clear()
+        print(f"✅ Cleared {STORE_DIR}")
+        return
+    rows = entries()
+    if not rows:
+        print(f"No cached features in {STORE_DIR}")
+    for e in rows:
+        shapes = ", ".join(f"{k} {r}x{c}" for k, (r, c) in e["matrices"].items())
+        print(f"{e['name']}-{e['key']}  {e['created_at']}  built in {e['build_s']}s  {shapes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# ai/features.py
+"""
+Shared feature stage for every text classifier.
+
+Each report is tokenized and TF-IDF vectorized once; the same sparse row then
+feeds the category, severity, fraud and veracity models of the "shared"
+registry bundle (trained together by ai/train_shared.py on one vocabulary).
+Until that bundle exists featurize() returns None and callers fall back to
+their own per-model vectorizers.
+"""
+from ai import registry
+
+BUNDLE = "shared"
+
+
+class Features:
+    __slots__ = ("text", "X", "models")
+
+    def __init__(self, text, X, models):
+        self.text = text        # str, or list[str] for a batch
+        self.X = X              # n_reports x n_features sparse matrix
+        self.models = models    # the registry bundle X was built with
+
+
+def make_vectorizer():
+    # same settings the per-model vectorizers were trained with
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    return TfidfVectorizer(stop_words="english", ngram_range=(1, 2), max_features=8000)
+
+
+def report_text(title, description) -> str:
+    return f"{title or ''} {description or ''}".strip()
+
+
+def featurize(title, description):
+    """
+    Features for one report, or None if the shared bundle isn't trained.
+    """
+    try:
+        models = registry.get(BUNDLE)
+    except FileNotFoundError:
+        return None
+    text = report_text(title, description)
+    with registry.timed(BUNDLE):
+        X = models["vectorizer"].transform([text])
+    return Features(text, X, models)
+
+
+def featurize_batch(pairs):
+    """
+    Features for many (title, description) pairs in one transform: X has one
+    row per pair. None if the shared bundle isn't trained.
+    """
+    try:
+        models = registry.get(BUNDLE)
+    except FileNotFoundError:
+        return None
+    texts = [report_text(t, d) for t, d in pairs]
+    with registry.timed(BUNDLE):
+        X = models["vectorizer"].transform(texts)
+    return Features(texts, X, models)
+
+
+def select(features, rows):
+    """
+    Features for a subset of a batch: rows are positions in features.X.
+    """
+    if features is None:
+        return None
+    rows = list(rows)
+    if rows == list(range(features.X.shape[0])):
+        return features
+    return Features([features.text[i] for i in rows], features.X[rows], features.models)
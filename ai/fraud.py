@@ -1,126 +1,122 @@
 # ai/fraud.py
 import os
-import joblib
-import re
+
+from ai import registry
+from ai.features import featurize, featurize_batch
+from ai.text_stats import is_spam_text
 
 ART_DIR = "ai/artifacts"
 MODEL_PATH = os.path.join(ART_DIR, "fraud_model.pkl")
 VECT_PATH = os.path.join(ART_DIR, "fraud_vectorizer.pkl")
+DATA_PATH = "ai/data/fraud_training_data.csv"   # written by ai/split_training_data.py
 
-SPAM_PATTERNS = [
-    r"\bfree\s+money\b",
-    r"\bclick\s+now\b",
-    r"\bwin\s+\$?\d+\b",
-    r"\bclaim\b",
-    r"\bpromo\b",
-    r"\bbonus\b",
-    r"http[s]?://",
-    r"\bwhatsapp\b",
-    r"\btelegram\b",
-    r"\bcall\s+now\b",
-]
-
-def _looks_like_gibberish(text: str) -> bool:
-    """
-    Flags random junk like: fsdhgfsdeh, asdfghjkl, qwertyuiop
-    BUT won't flag real sentences.
-    """
-    t = (text or "").strip().lower()
-    if not t:
-        return True
-
-    # If it's basically one "word" and long -> likely junk
-    tokens = re.findall(r"[a-zA-Z]+", t)
-    if len(tokens) == 1:
-        w = tokens[0]
-        if len(w) >= 9:
-            vowels = sum(1 for c in w if c in "aeiou")
-            vowel_ratio = vowels / max(len(w), 1)
-
-            # very low vowels = common in random strings
-            if vowel_ratio < 0.22:
-                return True
-
-            # long consonant run like "fsdhgfsd"
-            if re.search(r"[bcdfghjklmnpqrstvwxyz]{6,}", w):
-                return True
-
-    # Too many non-letter symbols compared to letters
-    letters = sum(ch.isalpha() for ch in t)
-    nonspace = sum(not ch.isspace() for ch in t)
-    if nonspace > 0 and letters / nonspace < 0.55:
-        return True
-
-    return False
-
-def _basic_spam_heuristic(text: str) -> bool:
-    t = (text or "").lower().strip()
-
-    # 0) Empty or whitespace-only text
-    if not t:
-        return True
-
-    # 1) Explicit spam keywords / links
-    for pat in SPAM_PATTERNS:
-        if re.search(pat, t):
-            return True
-
-    # 2) Repeated characters like "aaaaaaa" or "!!!!!!"
-    if re.search(r"(.)\1{5,}", t):
-        return True
-
-    # 3) Gibberish detection (consonant soup)
-    letters = re.sub(r"[^a-z]", "", t)
-
-    if len(letters) >= 10:
-        vowels = sum(1 for c in letters if c in "aeiou")
-        vowel_ratio = vowels / len(letters)
-
-        # very low vowel ratio → random mash
-        if vowel_ratio < 0.25:
-            return True
-
-        # long consonant streak
-        if re.search(r"[bcdfghjklmnpqrstvwxyz]{7,}", letters):
-            return True
-
-    # 4) Single long meaningless word
-    words = re.findall(r"[a-z]+", t)
-    if len(words) == 1 and len(words[0]) >= 10:
-        return True
 
-    # 5) Very short + no structure
-    if len(t) < 12 and len(words) <= 1:
-        return True
-
-    return False
-
-
-def predict_fraud(title: str, description: str, threshold: float = 0.65):
+def predict_fraud(title: str, description: str, threshold: float = 0.65, features=None):
     """
     Returns: (is_spam: bool, spam_prob: float)
-    - Uses ML if available
+    - Uses ML if available (the shared feature row once ai.train_shared ran)
     - Falls back to heuristic if not
     """
     text = f"{title or ''} {description or ''}".strip()
 
-    heuristic_hit = _basic_spam_heuristic(text)
+    heuristic_hit = is_spam_text(text)
 
-    # if model not available, trust heuristic
-    if not (os.path.exists(MODEL_PATH) and os.path.exists(VECT_PATH)):
-        return (heuristic_hit, 1.0 if heuristic_hit else 0.0)
+    if features is None:
+        features = featurize(title, description)
+    if features is not None:
+        model, X_vec = features.models["fraud"], features.X
+    else:
+        try:
+            models = registry.get("fraud")
+        except FileNotFoundError:
+            # if model not available, trust heuristic
+            return (heuristic_hit, 1.0 if heuristic_hit else 0.0)
+        model, X_vec = models["model"], None
 
     try:
-        model = joblib.load(MODEL_PATH)
-        vectorizer = joblib.load(VECT_PATH)
+        with registry.timed("fraud"):
+            if X_vec is None:
+                X_vec = models["vectorizer"].transform([text])
 
-        X_vec = vectorizer.transform([text])
-
-        # prob(class=1) for spam
-        prob_spam = float(model.predict_proba(X_vec)[0][1])
+            # prob(class=1) for spam
+            prob_spam = float(model.predict_proba(X_vec)[0][1])
 
         is_spam = heuristic_hit or (prob_spam >= threshold)
         return (is_spam, prob_spam)
 
     except Exception:
         return (heuristic_hit, 1.0 if heuristic_hit else 0.0)
+
+
+def predict_fraud_batch(pairs, threshold: float = 0.65, features=None):
+    """
+    [(title, description), ...] -> [(is_spam, spam_prob), ...], same rules as
+    predict_fraud with one transform + predict_proba for the whole batch.
+    """
+    if not pairs:
+        return []
+    texts = [f"{t or ''} {d or ''}".strip() for t, d in pairs]
+    hits = [is_spam_text(t) for t in texts]
+    heuristic_only = [(h, 1.0 if h else 0.0) for h in hits]
+
+    if features is None:
+        features = featurize_batch(pairs)
+    try:
+        with registry.timed("fraud"):
+            if features is not None:
+                probs = features.models["fraud"].predict_proba(features.X)[:, 1]
+            else:
+                try:
+                    models = registry.get("fraud")
+                except FileNotFoundError:
+                    return heuristic_only
+                probs = models["model"].predict_proba(models["vectorizer"].transform(texts))[:, 1]
+    except Exception:
+        return heuristic_only
+
+    return [(h or float(p) >= threshold, float(p)) for h, p in zip(hits, probs)]
+
+
+def train_fraud_model(csv_path: str = DATA_PATH, threshold: float = 0.65):
+    """
+    Trains the standalone spam model (text,label CSV; label 1 = spam).
+    The shared-feature version is trained by ai/train_shared.py.
+    """
+    import joblib
+    import pandas as pd
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import classification_report
+    from sklearn.model_selection import train_test_split
+
+    from ai import feature_store
+    from ai.features import make_vectorizer
+
+    os.makedirs(ART_DIR, exist_ok=True)
+
+    def build(vectorizer):
+        df = pd.read_csv(csv_path)
+        X_text = df["text"].fillna("").astype(str)
+        y = df["label"].astype(int)
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            X_text, y, test_size=0.2, random_state=42, stratify=y
+        )
+        matrices = {"train": vectorizer.fit_transform(X_train), "test": vectorizer.transform(X_test)}
+        return matrices, {"train": y_train, "test": y_test}
+
+    # reused while the CSV is unchanged (ai/feature_store.py)
+    vectorizer, X, y = feature_store.load_or_build(
+        "fraud", [csv_path], make_vectorizer(), build, params={"test_size": 0.2, "random_state": 42}
+    )
+    X_train_vec, X_test_vec, y_train, y_test = X["train"], X["test"], y["train"], y["test"]
+
+    model = LogisticRegression(max_iter=2000, class_weight="balanced")
+    model.fit(X_train_vec, y_train)
+
+    prob = model.predict_proba(X_test_vec)[:, 1]
+    print(f"Fraud model @ threshold {threshold}:")
+    print(classification_report(y_test, (prob >= threshold).astype(int), digits=3))
+
+    joblib.dump(model, MODEL_PATH)
+    joblib.dump(vectorizer, VECT_PATH)
+    print("✅ Fraud model saved:", MODEL_PATH, VECT_PATH)
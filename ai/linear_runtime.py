@@ -0,0 +1,204 @@
+# ai/linear_runtime.py
+"""
+NumPy-only scorer for the arrays written by ai/export_linear.py.
+
+Loads a bundle exported from TfidfVectorizer + LogisticRegression pickles and
+serves the same interface the registry callers use (vectorizer.transform,
+model.predict_proba / predict / classes_) without importing scikit-learn,
+SciPy or joblib. Every array is opened with mmap_mode="r", so the vocabulary
+and coefficients live in the page cache and are shared by every worker
+process instead of being unpickled into each one.
+
+    AI_RUNTIME=numpy uvicorn backend.main:app
+"""
+import json
+import os
+import re
+import unicodedata
+
+import numpy as np
+
+FORMAT = 1
+MANIFEST = "manifest.json"
+
+
+class SparseRows:
+    """
+    Minimal CSR matrix: what NumpyTfidf.transform returns and
+    NumpyLogistic.predict_proba consumes.
+    """
+    __slots__ = ("indptr", "indices", "data", "shape")
+
+    def __init__(self, indptr, indices, data, n_features):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = (len(indptr) - 1, n_features)
+
+    def __getitem__(self, rows):
+        """
+        X[[i, j, ...]]: the given rows, like scipy's CSR row indexing.
+        """
+        indices, data, indptr = [], [], [0]
+        for i in rows:
+            start, end = self.indptr[i], self.indptr[i + 1]
+            indices.append(self.indices[start:end])
+            data.append(self.data[start:end])
+            indptr.append(indptr[-1] + end - start)
+        return SparseRows(
+            np.asarray(indptr, dtype=np.int64),
+            np.concatenate(indices) if indices else self.indices[:0],
+            np.concatenate(data) if data else self.data[:0],
+            self.shape[1],
+        )
+
+
+# ---------- VECTORIZER ----------
+def _strip_accents_unicode(s):
+    normalized = unicodedata.normalize("NFKD", s)
+    if normalized == s:
+        return s
+    return "".join(c for c in normalized if not unicodedata.combining(c))
+
+
+def _strip_accents_ascii(s):
+    return unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("ASCII")
+
+
+_ACCENTS = {None: None, "unicode": _strip_accents_unicode, "ascii": _strip_accents_ascii}
+
+
+class NumpyTfidf:
+    """
+    TfidfVectorizer(analyzer="word").transform: same tokens, n-grams, stop
+    words, tf weighting, idf and normalisation. The vocabulary is a sorted
+    string array searched with np.searchsorted instead of a Python dict.
+    """
+
+    def __init__(self, path, meta):
+        self.terms = np.load(os.path.join(path, "terms.npy"), mmap_mode="r")
+        self.columns = np.load(os.path.join(path, "columns.npy"), mmap_mode="r")
+        self.idf = np.load(os.path.join(path, "idf.npy"), mmap_mode="r")
+        self.n_features = int(meta["n_features"])
+        self.lowercase = meta["lowercase"]
+        self.strip_accents = _ACCENTS[meta["strip_accents"]]
+        self.token_re = re.compile(meta["token_pattern"])
+        self.stop_words = frozenset(meta["stop_words"] or ())
+        self.min_n, self.max_n = meta["ngram_range"]
+        self.binary = meta["binary"]
+        self.sublinear_tf = meta["sublinear_tf"]
+        self.norm = meta["norm"]
+        self.dtype = np.dtype(meta["dtype"])
+
+    def _analyze(self, doc):
+        if self.lowercase:
+            doc = doc.lower()
+        if self.strip_accents is not None:
+            doc = self.strip_accents(doc)
+        tokens = [t for t in self.token_re.findall(doc) if t not in self.stop_words]
+        min_n, max_n = self.min_n, self.max_n
+        if max_n == 1:
+            return tokens
+        # sklearn's _word_ngrams, including its n-gram order
+        original, n_orig = tokens, len(tokens)
+        tokens = list(original) if min_n == 1 else []
+        if min_n == 1:
+            min_n += 1
+        for n in range(min_n, min(max_n + 1, n_orig + 1)):
+            for i in range(n_orig - n + 1):
+                tokens.append(" ".join(original[i:i + n]))
+        return tokens
+
+    def _lookup(self, grams):
+        if not grams:
+            return np.empty(0, dtype=np.int64)
+        grams = np.asarray(grams)
+        pos = np.searchsorted(self.terms, grams)
+        pos[pos == len(self.terms)] = 0
+        hit = self.terms[pos] == grams
+        return self.columns[pos[hit]].astype(np.int64)
+
+    def transform(self, docs) -> SparseRows:
+        indptr, indices, data = [0], [], []
+        for doc in docs:
+            cols, counts = np.unique(self._lookup(self._analyze(doc)), return_counts=True)
+            tf = counts.astype(self.dtype)
+            if self.binary:
+                tf[:] = 1
+            if self.sublinear_tf:
+                tf = np.log(tf) + 1
+            values = tf * self.idf[cols]
+            if self.norm == "l2":
+                scale = np.sqrt(np.dot(values, values))
+            elif self.norm == "l1":
+                scale = np.abs(values).sum()
+            else:
+                scale = 0.0
+            if scale > 0:
+                values = values / scale
+            indices.append(cols)
+            data.append(values)
+            indptr.append(indptr[-1] + len(cols))
+        return SparseRows(
+            np.asarray(indptr, dtype=np.int64),
+            np.concatenate(indices) if indices else np.empty(0, dtype=np.int64),
+            np.concatenate(data) if data else np.empty(0, dtype=self.dtype),
+            self.n_features,
+        )
+
+
+# ---------- MODEL ----------
+class NumpyLogistic:
+    """
+    LogisticRegression.predict_proba: a sigmoid for two classes, a softmax of
+    the decision function otherwise.
+    """
+
+    def __init__(self, path):
+        self.coef = np.load(os.path.join(path, "coef.npy"), mmap_mode="r")
+        self.intercept = np.load(os.path.join(path, "intercept.npy"))
+        self.classes_ = np.load(os.path.join(path, "classes.npy"))
+
+    def decision_function(self, X: SparseRows) -> np.ndarray:
+        n = X.shape[0]
+        scores = np.empty((n, self.coef.shape[0]), dtype=np.float64)
+        for i in range(n):
+            start, end = X.indptr[i], X.indptr[i + 1]
+            scores[i] = self.coef[:, X.indices[start:end]] @ X.data[start:end]
+        scores += self.intercept
+        return scores[:, 0] if scores.shape[1] == 1 else scores
+
+    def predict_proba(self, X: SparseRows) -> np.ndarray:
+        scores = self.decision_function(X)
+        if scores.ndim == 1:
+            p = 1.0 / (1.0 + np.exp(-scores))
+            return np.column_stack([1 - p, p])
+        scores = scores - scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def predict(self, X: SparseRows) -> np.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+# ---------- LOADING ----------
+def load_bundle(bundle_dir) -> dict:
+    """
+    {key: NumpyTfidf | NumpyLogistic} for one exported bundle directory.
+    The manifest names the version subdirectory holding the arrays.
+    """
+    with open(os.path.join(bundle_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT:
+        raise ValueError(f"{bundle_dir}: unsupported export format {manifest.get('format')!r}")
+    objects = {}
+    for key, meta in manifest["objects"].items():
+        path = os.path.join(bundle_dir, manifest["version"], key)
+        if meta["kind"] == "tfidf":
+            objects[key] = NumpyTfidf(path, meta)
+        elif meta["kind"] == "logistic":
+            objects[key] = NumpyLogistic(path)
+        else:
+            raise ValueError(f"{bundle_dir}/{key}: unknown kind {meta['kind']!r}")
+    return objects
@@ -1,9 +1,8 @@
 # ai/model.py
 import os
-import joblib
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score
+
+from ai import registry
+from ai.features import featurize, featurize_batch
 
 ART_DIR = "ai/artifacts"
 VECT_PATH = os.path.join(ART_DIR, "vectorizer.pkl")
@@ -11,20 +10,34 @@ CAT_PATH  = os.path.join(ART_DIR, "category_model.pkl")
 SEV_PATH  = os.path.join(ART_DIR, "severity_model.pkl")
 
 def train_models():
-    from ai.preprocess import preprocess
+    # training-only imports: serving with AI_RUNTIME=numpy never loads sklearn
+    import joblib
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score
+
+    from ai import feature_store
+    from ai.preprocess import TRAINING_CSV, preprocess
 
     os.makedirs(ART_DIR, exist_ok=True)
 
-    X_train, X_test, y_cat_train, y_cat_test, y_sev_train, y_sev_test = preprocess()
+    def build(vectorizer):
+        X_train, X_test, y_cat_train, y_cat_test, y_sev_train, y_sev_test = preprocess(TRAINING_CSV)
+        matrices = {"train": vectorizer.fit_transform(X_train), "test": vectorizer.transform(X_test)}
+        labels = {"cat_train": y_cat_train, "cat_test": y_cat_test, "sev_train": y_sev_train, "sev_test": y_sev_test}
+        return matrices, labels
 
     vectorizer = TfidfVectorizer(
         stop_words="english",
         ngram_range=(1,2),
         max_features=8000
     )
-
-    X_train_vec = vectorizer.fit_transform(X_train)
-    X_test_vec  = vectorizer.transform(X_test)
+    # parsed + vectorized once per version of the CSV (ai/feature_store.py)
+    vectorizer, M, y = feature_store.load_or_build(
+        "issue", [TRAINING_CSV], vectorizer, build, params={"test_size": 0.2, "random_state": 42, "drop": "spam"}
+    )
+    X_train_vec, X_test_vec = M["train"], M["test"]
+    y_cat_train, y_cat_test, y_sev_train, y_sev_test = y["cat_train"], y["cat_test"], y["sev_train"], y["sev_test"]
 
     # Category model
     cat_model = LogisticRegression(max_iter=1500, class_weight="balanced")
@@ -43,21 +56,63 @@ def train_models():
     joblib.dump(sev_model, SEV_PATH)
     print("AI models saved:", VECT_PATH, CAT_PATH, SEV_PATH)
 
-def predict_issue(title: str, description: str):
-    if not (os.path.exists(VECT_PATH) and os.path.exists(CAT_PATH) and os.path.exists(SEV_PATH)):
-        raise FileNotFoundError("AI models not trained. Run: python -m ai.model")
+def predict_issue(title: str, description: str, features=None):
+    """
+    features: ai.features.featurize() output, reused instead of re-vectorizing.
+    """
+    if features is None:
+        features = featurize(title, description)
+    if features is not None:
+        cat_model, sev_model = features.models["category"], features.models["severity"]
+        X = features.X
+    else:
+        try:
+            models = registry.get("issue")
+        except FileNotFoundError:
+            raise FileNotFoundError("AI models not trained. Run: python -m ai.train_shared")
+        cat_model, sev_model = models["category"], models["severity"]
+        X = None
 
-    vectorizer = joblib.load(VECT_PATH)
-    cat_model  = joblib.load(CAT_PATH)
-    sev_model  = joblib.load(SEV_PATH)
+    with registry.timed("issue"):
+        if X is None:
+            X = models["vectorizer"].transform([f"{title} {description}"])
+        category = cat_model.predict(X)[0]
+        severity = int(sev_model.predict(X)[0])
 
-    text = f"{title} {description}"
-    X = vectorizer.transform([text])
+    return category, severity
 
-    category = cat_model.predict(X)[0]
-    severity = int(sev_model.predict(X)[0])
+def predict_issues_batch(pairs, features=None):
+    """
+    [(title, description), ...] -> [(category, severity, category_confidence), ...]
+    One transform and one predict_proba per model for the whole batch.
+    features: ai.features.featurize_batch() output for the same pairs
+    """
+    if not pairs:
+        return []
+    if features is None:
+        features = featurize_batch(pairs)
+    if features is not None:
+        vectorizer, cat_model, sev_model = None, features.models["category"], features.models["severity"]
+    else:
+        try:
+            models = registry.get("issue")
+        except FileNotFoundError:
+            raise FileNotFoundError("AI models not trained. Run: python -m ai.train_shared")
+        vectorizer, cat_model, sev_model = models["vectorizer"], models["category"], models["severity"]
 
-    return category, severity
+    with registry.timed("issue"):
+        X = features.X if features is not None else vectorizer.transform([f"{t} {d}" for t, d in pairs])
+        cat_proba = cat_model.predict_proba(X)
+        sev_proba = sev_model.predict_proba(X)
+
+    cat_idx = cat_proba.argmax(axis=1)
+    categories = cat_model.classes_[cat_idx]
+    severities = sev_model.classes_[sev_proba.argmax(axis=1)]
+    confidence = cat_proba[range(len(pairs)), cat_idx]
+    return [
+        (str(c), int(s), float(p))
+        for c, s, p in zip(categories, severities, confidence)
+    ]
 
 if __name__ == "__main__":
     train_models()
@@ -1,7 +1,5 @@
 # ai/fraud.py
-import os
-import joblib
-import numpy as np
+from ai import registry
 
 MODEL_PATH = "ai/artifacts/fraud_model.pkl"
 VECT_PATH  = "ai/artifacts/fraud_vectorizer.pkl"
@@ -11,11 +9,13 @@ def predict_fraud(title: str, description: str, threshold: float = 0.55):
     Returns (is_fraud: bool, fraud_confidence: float)
     fraud_confidence is P(label==1)
     """
-    if not os.path.exists(MODEL_PATH) or not os.path.exists(VECT_PATH):
+    try:
+        models = registry.get("fraud")
+    except FileNotFoundError:
         raise FileNotFoundError("Fraud model not trained. Run: python -m ai.train_fraud")
 
-    model = joblib.load(MODEL_PATH)
-    vectorizer = joblib.load(VECT_PATH)
+    model = models["model"]
+    vectorizer = models["vectorizer"]
 
     text = f"{title} {description}"
     X = vectorizer.transform([text])
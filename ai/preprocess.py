@@ -2,9 +2,10 @@
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
+TRAINING_CSV = "ai/data/training_data.csv"
 REQUIRED = {"title", "description", "category", "severity"}
 
-def preprocess(csv_path="ai/data/training_data.csv"):
+def preprocess(csv_path=TRAINING_CSV):
     df = pd.read_csv(csv_path)
 
     missing = REQUIRED - set(df.columns)
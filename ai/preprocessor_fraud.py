@@ -3,22 +3,31 @@ import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from ai import feature_store
+
 def load_and_vectorize(csv_path="ai/data/training_data.csv"):
     """
     Load CSV, clean text, and vectorize for ML model.
     Expects columns: title, description, label (0=legit, 1=fraud)
     """
-    df = pd.read_csv(csv_path)
-    df['text'] = df['title'].astype(str) + " " + df['description'].astype(str)
-    X = df['text'].values
-    y = df['label'].values
+    def build(vectorizer):
+        df = pd.read_csv(csv_path)
+        df['text'] = df['title'].astype(str) + " " + df['description'].astype(str)
+        X = df['text'].values
+        y = df['label'].values
+
+        X_vec = vectorizer.fit_transform(X)
+
+        # Split
+        X_train, X_test, y_train, y_test = train_test_split(
+            X_vec, y, test_size=0.2, random_state=42, stratify=y
+        )
+        return {"train": X_train, "test": X_test}, {"train": y_train, "test": y_test}
 
     # TF-IDF Vectorizer
     vectorizer = TfidfVectorizer(stop_words='english', max_features=5000)
-    X_vec = vectorizer.fit_transform(X)
-
-    # Split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_vec, y, test_size=0.2, random_state=42, stratify=y
+    # reused while the CSV is unchanged (ai/feature_store.py)
+    vectorizer, X, y = feature_store.load_or_build(
+        "fraud_preprocessed", [csv_path], vectorizer, build, params={"test_size": 0.2, "random_state": 42}
     )
-    return X_train, X_test, y_train, y_test, vectorizer
+    return X["train"], X["test"], y["train"], y["test"], vectorizer
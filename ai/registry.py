@@ -0,0 +1,223 @@
+# ai/registry.py
+"""
+Process-wide registry for the pickled artifacts in ai/artifacts.
+
+Artifacts are grouped into bundles that must be used together (a vectorizer
+and the models fitted on its vocabulary). A bundle is loaded once and shared
+by every request; get() re-stats its files at most every CHECK_S seconds and,
+when one changed, loads the whole bundle again and swaps the reference in one
+assignment, so a request sees either the old or the new bundle, never a mix.
+A half-written retrain (files younger than SETTLE_S) is left for the next
+check, and a failed reload keeps serving the previous bundle.
+
+With AI_RUNTIME=numpy the bundles are read from the arrays written by
+`python -m ai.export_linear` (ai/linear_runtime.py) instead of the pickles,
+so serving needs neither scikit-learn nor joblib.
+
+    from ai import registry
+    issue = registry.get("issue")
+    X = issue["vectorizer"].transform([text])
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+ART_DIR = os.getenv("AI_ARTIFACT_DIR", "ai/artifacts")
+NUMPY_DIR = os.path.join(ART_DIR, "numpy")
+RUNTIME = os.getenv("AI_RUNTIME", "sklearn")    # sklearn | numpy
+CHECK_S = float(os.getenv("AI_RELOAD_CHECK_S", "2"))
+SETTLE_S = float(os.getenv("AI_RELOAD_SETTLE_S", "1"))
+
+BUNDLES = {
+    "issue": {
+        "vectorizer": "vectorizer.pkl",
+        "category": "category_model.pkl",
+        "severity": "severity_model.pkl",
+    },
+    "fraud": {
+        "model": "fraud_model.pkl",
+        "vectorizer": "fraud_vectorizer.pkl",
+    },
+    "veracity": {
+        "model": "veracity_model.pkl",
+        "vectorizer": "veracity_vectorizer.pkl",
+    },
+    # one vocabulary for every classifier, see ai/features.py
+    "shared": {
+        "vectorizer": "shared_vectorizer.pkl",
+        "category": "shared_category_model.pkl",
+        "severity": "shared_severity_model.pkl",
+        "fraud": "shared_fraud_model.pkl",
+        "veracity": "shared_veracity_model.pkl",
+    },
+    # hashing features + SGD, updated from admin decisions by ai/train_veracity_online.py
+    "veracity_online": {
+        "model": "veracity_online_model.pkl",
+        "vectorizer": "veracity_online_vectorizer.pkl",
+    },
+}
+
+# no NumPy export (ai/export_linear.py); never available with AI_RUNTIME=numpy
+SKLEARN_ONLY = {"veracity_online"}
+
+
+class _Bundle:
+    def __init__(self, name: str, files: dict):
+        self.name = name
+        if RUNTIME == "numpy":
+            # the manifest is replaced last by an export, so it's the only file to watch
+            self.paths = {"manifest": os.path.join(NUMPY_DIR, name, "manifest.json")}
+        else:
+            self.paths = {key: os.path.join(ART_DIR, fname) for key, fname in files.items()}
+        self.objects = None        # {key: loaded object}, replaced wholesale
+        self.stamp = None          # ((mtime_ns, size), ...) of the loaded files
+        self.version = 0
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+        self.stats = {
+            "loads": 0, "load_ms": 0.0, "loaded_at": None, "last_error": None,
+            "calls": 0, "total_ms": 0.0, "last_ms": 0.0, "max_ms": 0.0,
+        }
+
+    def _stat(self):
+        out = []
+        for path in self.paths.values():
+            st = os.stat(path)
+            out.append((st.st_mtime_ns, st.st_size))
+        return tuple(out)
+
+    def _load(self, stamp):
+        t0 = time.perf_counter()
+        if RUNTIME == "numpy":
+            from ai.linear_runtime import load_bundle
+            objects = load_bundle(os.path.dirname(self.paths["manifest"]))
+        else:
+            import joblib
+            objects = {key: joblib.load(path) for key, path in self.paths.items()}
+        self.objects, self.stamp = objects, stamp     # the swap
+        self.version += 1
+        self.stats["loads"] += 1
+        self.stats["load_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        self.stats["loaded_at"] = time.time()
+        self.stats["last_error"] = None
+
+    def get(self) -> dict:
+        now = time.monotonic()
+        if self.objects is not None and now - self.checked_at < CHECK_S:
+            return self.objects
+
+        with self.lock:
+            if self.objects is not None and now - self.checked_at < CHECK_S:
+                return self.objects
+            self.checked_at = now
+            try:
+                stamp = self._stat()
+            except FileNotFoundError:
+                if self.objects is not None:
+                    return self.objects    # artifact being replaced; keep serving
+                raise FileNotFoundError(
+                    f"AI artifacts for '{self.name}' not found. Expected: {list(self.paths.values())}"
+                )
+            if stamp == self.stamp:
+                return self.objects
+
+            newest = max(mtime for mtime, _ in stamp) / 1e9
+            if self.objects is not None and time.time() - newest < SETTLE_S:
+                return self.objects        # retrain still writing; try next check
+
+            try:
+                self._load(stamp)
+            except Exception as e:
+                self.stats["last_error"] = repr(e)
+                if self.objects is None:
+                    raise
+            return self.objects
+
+    def describe(self) -> dict:
+        s = dict(self.stats)
+        total_ms = s.pop("total_ms")
+        s["mean_ms"] = round(total_ms / s["calls"], 3) if s["calls"] else 0.0
+        s["last_ms"] = round(s["last_ms"], 3)
+        s["max_ms"] = round(s["max_ms"], 3)
+        return {
+            "loaded": self.objects is not None,
+            "version": self.version,
+            "files": {k: os.path.basename(p) for k, p in self.paths.items()},
+            **s,
+        }
+
+
+_bundles = {name: _Bundle(name, files) for name, files in BUNDLES.items()}
+
+
+# ---------- API ----------
+def get(name: str) -> dict:
+    """
+    Loaded objects of a bundle, e.g. get("fraud")["model"].
+    Raises FileNotFoundError if the bundle was never trained.
+    """
+    return _bundles[name].get()
+
+
+def available(name: str) -> bool:
+    try:
+        get(name)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Records inference latency for a bundle: `with registry.timed("issue"): ...`
+    """
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        s = _bundles[name].stats
+        s["calls"] += 1
+        s["total_ms"] += ms
+        s["last_ms"] = ms
+        s["max_ms"] = max(s["max_ms"], ms)
+
+
+def version(refresh: bool = False) -> str:
+    """
+    Changes whenever any bundle is (re)loaded; used to key prediction caches.
+    refresh: re-check the loaded bundles' files first (at most every CHECK_S),
+    for callers that may not call get() themselves, e.g. on a cache hit.
+    """
+    if refresh:
+        for bundle in _bundles.values():
+            if bundle.objects is not None:
+                bundle.get()
+    return ".".join(str(b.version) for b in _bundles.values())
+
+
+def warm() -> dict:
+    """
+    Loads every trained bundle now so the first request doesn't pay for it.
+    Returns {bundle: loaded?}; a broken artifact is reported, not raised.
+    """
+    out = {}
+    for name, bundle in _bundles.items():
+        try:
+            bundle.get()
+            out[name] = True
+        except Exception as e:
+            bundle.stats["last_error"] = repr(e)
+            out[name] = False
+    return out
+
+
+def stats() -> dict:
+    return {
+        "artifact_dir": ART_DIR,
+        "runtime": RUNTIME,
+        "version": version(),
+        "bundles": {name: b.describe() for name, b in _bundles.items()},
+    }
@@ -0,0 +1,229 @@
+# ai/risk.py
+"""
+Red-zone risk engine.
+
+Issues are bucketed into ~RISK_CELL_KM grid cells. Each cell keeps an
+exponentially time-decayed sum of severity weights, so density, severity and
+recency are folded into one number that can be updated in O(1) per issue:
+
+    cell_score(t) = sum_i  (severity_i / 5) * exp(-ln2 * (t - t_i) / half_life)
+
+An area's risk score is its own cell plus half of each of its 8 neighbours.
+Hot spots are found DBSCAN-style on the grid: cells whose area score reaches
+the orange threshold are "core" cells and 8-connected core cells form one
+cluster. Scores only rise on insert, so the set of hot cells is maintained
+incrementally (checked for the touched cell + neighbours on every insert) and
+lazily pruned as it decays; reading the zones never touches the issue table.
+"""
+import math
+import os
+import threading
+import time
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = math.pi * EARTH_RADIUS_KM / 180.0
+
+CELL_KM = float(os.getenv("RISK_CELL_KM", "0.5"))
+HALF_LIFE_DAYS = float(os.getenv("RISK_HALF_LIFE_DAYS", "14"))
+NEIGHBOUR_WEIGHT = 0.5
+
+RED_THRESHOLD = float(os.getenv("RISK_RED_THRESHOLD", "6"))
+ORANGE_THRESHOLD = float(os.getenv("RISK_ORANGE_THRESHOLD", "2.5"))
+
+_NEIGHBOURS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+
+
+def classify_zone(score: float) -> str:
+    if score >= RED_THRESHOLD:
+        return "red"
+    if score >= ORANGE_THRESHOLD:
+        return "orange"
+    return "green"
+
+
+def severity_weight(severity) -> float:
+    try:
+        sev = int(severity or 1)
+    except (TypeError, ValueError):
+        sev = 1
+    return max(1, min(sev, 5)) / 5.0
+
+
+class RiskEngine:
+    def __init__(self, cell_km: float = CELL_KM, half_life_days: float = HALF_LIFE_DAYS):
+        self.cell_deg = cell_km / KM_PER_DEG_LAT
+        self.decay = math.log(2) / (half_life_days * 86400.0)   # per second
+        self._cells = {}    # key -> [score at ref_t, ref_t, issue count]
+        self._issues = {}   # issue_id -> (key, weight, t)
+        self._hot = set()   # cells whose area score reached ORANGE_THRESHOLD
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._issues)
+
+    def _key(self, lat, lng):
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    def _cell_score(self, key, now):
+        cell = self._cells.get(key)
+        if cell is None:
+            return 0.0
+        score, ref_t, _ = cell
+        return score * math.exp(-self.decay * (now - ref_t))
+
+    def _area_score(self, key, now):
+        r, c = key
+        score = self._cell_score(key, now)
+        for dr, dc in _NEIGHBOURS:
+            score += NEIGHBOUR_WEIGHT * self._cell_score((r + dr, c + dc), now)
+        return score
+
+    def _shift(self, key, delta_at_t, t, count_delta):
+        # add a contribution that was worth delta_at_t at time t
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = [0.0, t, 0]
+        score, ref_t, count = cell
+        if t >= ref_t:
+            score = score * math.exp(-self.decay * (t - ref_t)) + delta_at_t
+            ref_t = t
+        else:
+            score += delta_at_t * math.exp(-self.decay * (ref_t - t))
+        cell[0], cell[1], cell[2] = max(score, 0.0), ref_t, count + count_delta
+        if cell[2] <= 0:
+            del self._cells[key]
+
+    # ---------- WRITES ----------
+    def add(self, issue_id: int, lat: float, lng: float, severity=1, timestamp: float | None = None):
+        if lat is None or lng is None:
+            return
+        t = time.time() if timestamp is None else float(timestamp)
+        key = self._key(float(lat), float(lng))
+        w = severity_weight(severity)
+        with self._lock:
+            if issue_id in self._issues:
+                self.remove(issue_id)
+            self._issues[issue_id] = (key, w, t)
+            self._shift(key, w, t, +1)
+
+            # only this cell and its neighbours changed, so only they can turn hot
+            now = max(time.time(), t)
+            r, c = key
+            for dr, dc in [(0, 0), *_NEIGHBOURS]:
+                k = (r + dr, c + dc)
+                if k in self._cells and self._area_score(k, now) >= ORANGE_THRESHOLD:
+                    self._hot.add(k)
+
+    def upsert(self, issue_id: int, lat: float, lng: float, severity=1, timestamp: float | None = None):
+        # add, or re-add only if the cell, weight or time changed
+        if lat is None or lng is None:
+            self.remove(issue_id)
+            return
+        t = time.time() if timestamp is None else float(timestamp)
+        entry = (self._key(float(lat), float(lng)), severity_weight(severity), t)
+        with self._lock:
+            if self._issues.get(issue_id) != entry:
+                self.add(issue_id, lat, lng, severity, t)
+
+    def remove(self, issue_id: int):
+        with self._lock:
+            entry = self._issues.pop(issue_id, None)
+            if entry is None:
+                return
+            key, w, t = entry
+            self._shift(key, -w, t, -1)
+
+    def update_severity(self, issue_id: int, severity):
+        with self._lock:
+            entry = self._issues.get(issue_id)
+            if entry is None:
+                return
+            key, _, t = entry
+            lat = (key[0] + 0.5) * self.cell_deg
+            lng = (key[1] + 0.5) * self.cell_deg
+            self.add(issue_id, lat, lng, severity, t)
+
+    # ---------- READS ----------
+    def issue_ids(self) -> set:
+        with self._lock:
+            return set(self._issues)
+
+    def score_at(self, lat: float, lng: float, now: float | None = None) -> float:
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._area_score(self._key(lat, lng), now)
+
+    def zones(self, now: float | None = None, bbox=None) -> list[dict]:
+        """
+        Hot-spot clusters sorted by peak risk.
+        bbox = (south, west, north, east) keeps clusters whose centre is inside.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            scores = {}
+            for k in list(self._hot):
+                s = self._area_score(k, now)
+                if s >= ORANGE_THRESHOLD:
+                    scores[k] = s
+                else:
+                    self._hot.discard(k)   # decayed below the core threshold
+
+            clusters, seen = [], set()
+            for start in scores:
+                if start in seen:
+                    continue
+                seen.add(start)
+                stack, members = [start], []
+                while stack:
+                    k = stack.pop()
+                    members.append(k)
+                    for dr, dc in _NEIGHBOURS:
+                        n = (k[0] + dr, k[1] + dc)
+                        if n in scores and n not in seen:
+                            seen.add(n)
+                            stack.append(n)
+                clusters.append(self._describe(members, scores))
+
+        if bbox is not None:
+            south, west, north, east = bbox
+            clusters = [
+                z for z in clusters
+                if south <= z["center"][0] <= north and west <= z["center"][1] <= east
+            ]
+        clusters.sort(key=lambda z: z["risk_score"], reverse=True)
+        return clusters
+
+    def _describe(self, members, scores):
+        d = self.cell_deg
+        total = sum(scores[k] for k in members)
+        lat = sum((k[0] + 0.5) * d * scores[k] for k in members) / total
+        lng = sum((k[1] + 0.5) * d * scores[k] for k in members) / total
+        peak = max(scores[k] for k in members)
+        rows = [k[0] for k in members]
+        cols = [k[1] for k in members]
+        return {
+            "zone": classify_zone(peak),
+            "risk_score": round(peak, 2),
+            "center": [round(lat, 5), round(lng, 5)],
+            "bbox": [min(rows) * d, min(cols) * d, (max(rows) + 1) * d, (max(cols) + 1) * d],
+            "cells": len(members),
+            "issues": sum(self._cells[k][2] for k in members if k in self._cells),
+        }
+
+
+# ---------- PROCESS-WIDE ENGINE ----------
+_engine = RiskEngine()
+
+
+def get_engine() -> RiskEngine:
+    return _engine
+
+
+def build_risk_score(issue: dict) -> float:
+    """
+    Area risk around an issue dict with latitude/longitude.
+    """
+    lat, lng = issue.get("latitude"), issue.get("longitude")
+    if lat is None or lng is None:
+        return 0.0
+    return _engine.score_at(float(lat), float(lng))
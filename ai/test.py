@@ -1,5 +1,5 @@
 # ai/test.py
-from predict_fraud import predict_fraud
+from ai.predict_fraud import predict_fraud
 
 examples = [
     ("Garbage not collected", "Garbage everywhere, people complain"),
@@ -0,0 +1,118 @@
+# ai/text_stats.py
+"""
+One analysis pass per text for every rule-based detector.
+
+analyze() lowercases the text once, pulls out its words and tokens with one
+regex each, counts letters / vowels / spaces and runs the spam patterns as a
+single compiled alternation. The gibberish and spam rules of ai/fraud.py,
+ai/veracity.py and backend/utils/screening.py are written against that
+result instead of re-scanning the string, and it's cached per text, so a
+title or description that several rules look at is analyzed once.
+"""
+import re
+from functools import lru_cache
+
+SPAM_PATTERNS = [
+    r"\bfree\s+money\b",
+    r"\bclick\s+now\b",
+    r"\bwin\s+\$?\d+\b",
+    r"\bclaim\b",
+    r"\bpromo\b",
+    r"\bbonus\b",
+    r"http[s]?://",
+    r"\bwhatsapp\b",
+    r"\btelegram\b",
+    r"\bcall\s+now\b",
+]
+
+SPAM_RE = re.compile("|".join(f"(?:{p})" for p in SPAM_PATTERNS))
+REPEAT_RE = re.compile(r"(.)\1{5,}")           # "aaaaaa", "!!!!!!"
+WORD_RE = re.compile(r"[a-z]+")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+CONSONANTS_RE = re.compile(r"[bcdfghjklmnpqrstvwxyz]+")
+
+VOWELS = "aeiou"
+
+
+class TextStats:
+    __slots__ = (
+        "n_stripped", "n", "words", "tokens", "n_letters", "n_vowels",
+        "max_consonant_run", "n_alpha", "n_nonspace", "repeat", "spam",
+    )
+
+    def __init__(self, text: str):
+        stripped = (text or "").strip()
+        t = stripped.lower()
+        letters = "".join(words := WORD_RE.findall(t))
+
+        self.n_stripped = len(stripped)
+        self.n = len(t)
+        self.words = tuple(words)                                    # [a-z]+ runs
+        self.tokens = tuple(w for w in TOKEN_RE.findall(t) if len(w) >= 3)
+        self.n_letters = len(letters)                                # a-z only
+        self.n_vowels = sum(map(letters.count, VOWELS))
+        self.max_consonant_run = max(map(len, CONSONANTS_RE.findall(letters)), default=0)
+        self.n_alpha = sum(map(str.isalpha, t))                      # any script
+        self.n_nonspace = self.n - sum(map(str.isspace, t))
+        self.repeat = REPEAT_RE.search(t) is not None
+        self.spam = SPAM_RE.search(t) is not None
+
+
+@lru_cache(maxsize=8192)
+def analyze(text: str) -> TextStats:
+    return TextStats(text)
+
+
+# ---------- DETECTORS ----------
+def is_spam_text(text: str) -> bool:
+    """
+    Links / spam keywords, repeated characters, consonant soup, one long
+    meaningless word or a very short unstructured text.
+    """
+    s = analyze(text)
+    if s.n == 0 or s.spam or s.repeat:
+        return True
+    if s.n_letters >= 10 and (s.n_vowels / s.n_letters < 0.25 or s.max_consonant_run >= 7):
+        return True
+    if len(s.words) == 1 and len(s.words[0]) >= 10:
+        return True
+    return s.n < 12 and len(s.words) <= 1
+
+
+def looks_like_junk_word(text: str) -> bool:
+    """
+    Random single-word junk like "fsdhgfsdeh", or mostly symbols; real
+    sentences pass.
+    """
+    s = analyze(text)
+    if s.n == 0:
+        return True
+    if len(s.words) == 1 and len(s.words[0]) >= 9:
+        if s.n_vowels / s.n_letters < 0.22 or s.max_consonant_run >= 6:
+            return True
+    return s.n_nonspace > 0 and s.n_alpha / s.n_nonspace < 0.55
+
+
+def is_short_or_symbolic(text: str) -> bool:
+    """
+    Under 8 characters, a 6+ character repeat, or under 35% letters.
+    """
+    s = analyze(text)
+    if s.n < 8 or s.repeat:
+        return True
+    return s.n_alpha / max(s.n, 1) < 0.35
+
+
+def is_gibberish_field(text: str) -> bool:
+    """
+    A title or description with no real words: too short, no 3+ character
+    tokens, mostly vowel-less tokens, or a 6+ character repeat.
+    """
+    s = analyze(text)
+    if s.n_stripped < 8 or not s.tokens:
+        return True
+    head = s.tokens[:20]
+    bad = sum(1 for tok in head if sum(map(tok.count, VOWELS)) / len(tok) < 0.20)
+    if bad / len(head) >= 0.60:
+        return True
+    return s.repeat
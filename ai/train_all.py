@@ -0,0 +1,276 @@
+# ai/train_all.py
+"""
+Trains the four classifiers of the shared bundle (category, severity, fraud,
+veracity) with a cross-validated search, on a process pool.
+
+Grid: vectorizer settings (n-gram range x max_features) x LogisticRegression
+C. Each (setting, model, C) candidate is one pool task scoring k-fold CV
+accuracy on the training split; the vectorized sets come from
+ai/feature_store.py, so a setting seen before costs no TF-IDF work. Each
+model's best C per setting is then refit on the whole training split
+(again one task per model) and scored on the test split.
+
+The served bundle has one vocabulary, so one setting is picked for all four
+models: the fastest per report (one transform + four predict_proba) among
+the settings where every model's CV accuracy is within --tolerance of its
+best anywhere in the grid (the smallest, among settings within 5% of that
+speed). Its models are saved like ai/train_shared.py.
+
+The report (stdout and ai/artifacts/train_report.json) compares every
+setting: CV / test accuracy, model size and per-prediction latency.
+
+    python -m ai.train_all                          # search, report, save
+    python -m ai.train_all --jobs 4 --folds 5 --tolerance 0.005
+    python -m ai.train_all --report-only            # keep the served models
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import pickle
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import KFold, StratifiedKFold, cross_val_score
+
+from ai import registry
+from ai.features import make_vectorizer
+from ai.train_shared import TRAINING_CSV, VERACITY_CSV, _features, model_sets, save_bundle
+
+NGRAMS = [(1, 1), (1, 2)]
+MAX_FEATURES = [4000, 8000, 16000]
+CS = [0.3, 1.0, 3.0]
+MODELS = ("category", "severity", "fraud", "veracity")
+
+LATENCY_TEXTS = 200
+LATENCY_ROUNDS = 3
+SAME_SPEED = 1.05       # settings this close to the fastest count as equally fast
+
+# filled in the parent before the pool forks; workers read it, never pickle it
+_SETS = {}
+
+
+def _setting_id(ngram, max_features) -> str:
+    return f"ngram{ngram[0]}-{ngram[1]}_max{max_features}"
+
+
+def _vectorizer(ngram, max_features):
+    vect = make_vectorizer()
+    vect.set_params(ngram_range=ngram, max_features=max_features)
+    return vect
+
+
+# ---------- POOL TASKS ----------
+def _cv_task(setting, model, C, folds):
+    X, y, _, _, kwargs = _SETS[setting][model]
+    cv = StratifiedKFold(n_splits=folds, shuffle=True, random_state=42)
+    if np.unique(y, return_counts=True)[1].min() < folds:
+        cv = KFold(n_splits=folds, shuffle=True, random_state=42)    # a class too small to stratify
+    t0 = time.perf_counter()
+    scores = cross_val_score(LogisticRegression(max_iter=2000, C=C, **kwargs), X, y, cv=cv)
+    return setting, model, C, float(scores.mean()), float(scores.std()), time.perf_counter() - t0
+
+
+def _fit_task(setting, model, C):
+    X_tr, y_tr, X_te, y_te, kwargs = _SETS[setting][model]
+    t0 = time.perf_counter()
+    clf = LogisticRegression(max_iter=2000, C=C, **kwargs).fit(X_tr, y_tr)
+    fit_s = time.perf_counter() - t0
+    return setting, model, clf, float(accuracy_score(y_te, clf.predict(X_te))), fit_s
+
+
+def _run(fn, tasks, jobs):
+    if jobs <= 1:
+        return [fn(*t) for t in tasks]
+    # fork: workers inherit _SETS instead of receiving the matrices per task
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork")) as pool:
+        return list(pool.map(fn, *zip(*tasks)))
+
+
+# ---------- MEASUREMENTS ----------
+def _size_kb(obj) -> float:
+    return len(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)) / 1024
+
+
+def _latency_us(vectorizer, models, texts) -> tuple[float, dict]:
+    """
+    Median µs for one report: transform, and predict_proba per model
+    (best of LATENCY_ROUNDS rounds).
+    """
+    best_t, best_p = float("inf"), {name: float("inf") for name in models}
+    for _ in range(LATENCY_ROUNDS):
+        transform, predict = [], {name: [] for name in models}
+        for text in texts:
+            t0 = time.perf_counter()
+            X = vectorizer.transform([text])
+            transform.append(time.perf_counter() - t0)
+            for name, model in models.items():
+                t0 = time.perf_counter()
+                model.predict_proba(X)
+                predict[name].append(time.perf_counter() - t0)
+        best_t = min(best_t, statistics.median(transform) * 1e6)
+        best_p = {name: min(best_p[name], statistics.median(v) * 1e6) for name, v in predict.items()}
+    return best_t, best_p
+
+
+# ---------- SEARCH ----------
+def search(training_csv=TRAINING_CSV, veracity_csv=VERACITY_CSV, ngrams=NGRAMS, max_features=MAX_FEATURES,
+           cs=CS, folds=3, tolerance=0.01, jobs=None, verbose=True) -> tuple[dict, dict]:
+    """
+    Returns (report, {setting: (vectorizer, {model: fitted model})}).
+    """
+    jobs = jobs or os.cpu_count() or 1
+    t_start = time.perf_counter()
+    vectorizers = {}
+    for ngram in ngrams:
+        for mf in max_features:
+            setting = _setting_id(ngram, mf)
+            vect, M, y = _features(training_csv, veracity_csv, vectorizer=_vectorizer(ngram, mf))
+            vectorizers[setting] = vect
+            _SETS[setting] = model_sets(M, y)
+
+    tasks = [(s, m, C, folds) for s in _SETS for m in MODELS for C in cs]
+    if verbose:
+        print(f"→ {len(tasks)} CV candidates ({len(_SETS)} settings x {len(MODELS)} models x {len(cs)} C), "
+              f"{folds} folds, {jobs} process(es)")
+    t0 = time.perf_counter()
+    cv = {}
+    for setting, model, C, mean, std, _ in _run(_cv_task, tasks, jobs):
+        cv.setdefault(setting, {}).setdefault(model, []).append((mean, std, C))
+    cv_s = time.perf_counter() - t0
+
+    best_c = {s: {m: max(cands, key=lambda c: (c[0], -c[2]))[2] for m, cands in models.items()}
+              for s, models in cv.items()}
+    t0 = time.perf_counter()
+    fitted = {}
+    for setting, model, clf, test_acc, fit_s in _run(_fit_task, [(s, m, best_c[s][m]) for s in cv for m in MODELS], jobs):
+        fitted.setdefault(setting, {})[model] = (clf, test_acc, fit_s)
+    fit_s = time.perf_counter() - t0
+
+    df = pd.read_csv(training_csv)
+    texts = (df["title"].fillna("").astype(str) + " " + df["description"].fillna("").astype(str)).tolist()
+    texts = texts[:LATENCY_TEXTS]
+
+    best_cv = {m: max(mean for s in cv for mean, _, _ in cv[s][m]) for m in MODELS}
+    settings = []
+    for ngram in ngrams:
+        for mf in max_features:
+            setting = _setting_id(ngram, mf)
+            vect = vectorizers[setting]
+            models = {m: fitted[setting][m][0] for m in MODELS}
+            transform_us, predict_us = _latency_us(vect, models, texts)
+            row = {
+                "setting": setting,
+                "ngram_range": list(ngram),
+                "max_features": mf,
+                "vocabulary": len(vect.vocabulary_),
+                "vectorizer_kb": round(_size_kb(vect), 1),
+                "transform_us": round(transform_us, 1),
+                "report_us": round(transform_us + sum(predict_us.values()), 1),
+                "models": {},
+            }
+            for m in MODELS:
+                mean, std, C = next(c for c in cv[setting][m] if c[2] == best_c[setting][m])
+                clf, test_acc, fit_s_m = fitted[setting][m]
+                row["models"][m] = {
+                    "C": C,
+                    "cv_accuracy": round(mean, 4),
+                    "cv_std": round(std, 4),
+                    "test_accuracy": round(test_acc, 4),
+                    "size_kb": round(_size_kb(clf), 1),
+                    "predict_us": round(predict_us[m], 1),
+                    "fit_s": round(fit_s_m, 3),
+                }
+            row["size_kb"] = round(row["vectorizer_kb"] + sum(v["size_kb"] for v in row["models"].values()), 1)
+            row["acceptable"] = all(row["models"][m]["cv_accuracy"] >= best_cv[m] - tolerance for m in MODELS)
+            settings.append(row)
+
+    acceptable = [r for r in settings if r["acceptable"]]
+    if acceptable:
+        fastest = min(r["report_us"] for r in acceptable)
+        # within timing noise of the fastest, the smallest artifacts win
+        selected = min((r for r in acceptable if r["report_us"] <= fastest * SAME_SPEED),
+                       key=lambda r: r["size_kb"])["setting"]
+    else:
+        # each model peaks on a different setting and none is within tolerance
+        # for all of them: take the one whose worst shortfall is smallest
+        selected = min(settings, key=lambda r: max(best_cv[m] - r["models"][m]["cv_accuracy"]
+                                                  for m in MODELS))["setting"]
+    report = {
+        "training_csv": training_csv,
+        "veracity_csv": veracity_csv,
+        "folds": folds,
+        "tolerance": tolerance,
+        "grid": {"ngram_range": [list(n) for n in ngrams], "max_features": list(max_features), "C": list(cs)},
+        "jobs": jobs,
+        "cv_s": round(cv_s, 2),
+        "fit_s": round(fit_s, 2),
+        "total_s": round(time.perf_counter() - t_start, 2),
+        "best_cv_accuracy": {m: round(v, 4) for m, v in best_cv.items()},
+        "settings": settings,
+        "selected": selected,
+        "selected_within_tolerance": bool(acceptable),
+        "trained_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    bundles = {s: (vectorizers[s], {m: fitted[s][m][0] for m in MODELS}) for s in vectorizers}
+    _SETS.clear()
+    return report, bundles
+
+
+def print_report(report):
+    print(f"\nCV {report['folds']}-fold in {report['cv_s']}s, refit in {report['fit_s']}s "
+          f"on {report['jobs']} process(es); tolerance {report['tolerance']}")
+    head = "".join(f" {m[:8]:>16}" for m in MODELS)
+    print(f"  {'setting':<20} {'vocab':>6} {'size':>8} {'µs/report':>10}{head}")
+    for r in report["settings"]:
+        cells = "".join(
+            f" {r['models'][m]['cv_accuracy']:>7.3f}/{r['models'][m]['test_accuracy']:.3f}" for m in MODELS
+        )
+        mark = "→" if r["setting"] == report["selected"] else ("✓" if r["acceptable"] else " ")
+        print(f"{mark} {r['setting']:<20} {r['vocabulary']:>6} {r['size_kb']:>6.0f}KB {r['report_us']:>10.0f}{cells}")
+    print("  (cells: CV / test accuracy with each model's best C; ✓ within tolerance, → selected)")
+    if not report["selected_within_tolerance"]:
+        print(f"⚠️ no setting within {report['tolerance']} of every model's best; "
+              f"selected the smallest worst-case shortfall")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parallel CV search and training for the shared models")
+    ap.add_argument("--training-csv", default=TRAINING_CSV)
+    ap.add_argument("--veracity-csv", default=VERACITY_CSV)
+    ap.add_argument("--max-features", type=int, nargs="+", default=MAX_FEATURES)
+    ap.add_argument("--C", type=float, nargs="+", default=CS, dest="cs")
+    ap.add_argument("--unigrams-only", action="store_true", help="skip the (1, 2) n-gram settings")
+    ap.add_argument("--folds", type=int, default=3)
+    ap.add_argument("--tolerance", type=float, default=0.01,
+                    help="max CV accuracy below each model's best for a setting to qualify")
+    ap.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    ap.add_argument("--art-dir", default=registry.ART_DIR)
+    ap.add_argument("--report-only", action="store_true", help="don't save the selected models")
+    args = ap.parse_args()
+
+    report, bundles = search(
+        args.training_csv, args.veracity_csv,
+        ngrams=[(1, 1)] if args.unigrams_only else NGRAMS, max_features=args.max_features, cs=args.cs,
+        folds=args.folds, tolerance=args.tolerance, jobs=args.jobs,
+    )
+    print_report(report)
+
+    os.makedirs(args.art_dir, exist_ok=True)
+    path = os.path.join(args.art_dir, "train_report.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Report written to {path}")
+    if not args.report_only:
+        vectorizer, models = bundles[report["selected"]]
+        save_bundle(vectorizer, models, args.art_dir)
+        print(f"✅ {report['selected']} models saved to {args.art_dir}")
+
+
+if __name__ == "__main__":
+    main()
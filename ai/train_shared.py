@@ -0,0 +1,124 @@
+# ai/train_shared.py
+"""
+Trains category, severity, fraud and veracity models on ONE vectorizer so a
+submission is vectorized once (see ai/features.py).
+
+    python -m ai.train_shared
+
+Inputs are the same CSVs the per-model trainers use:
+  - ai/data/training_data.csv   title, description, category, severity[, label]
+  - ai/data/veracity_1500.csv   text, label (legit | fake | spam)
+The fraud label is `label` when present, else category == "Spam".
+"""
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+
+from ai import feature_store, registry
+from ai.features import make_vectorizer
+
+TRAINING_CSV = "ai/data/training_data.csv"
+VERACITY_CSV = "ai/data/veracity_1500.csv"
+
+VERACITY_LABELS = {"legit": 0, "fake": 1, "spam": 2}
+
+
+def _load_frames(training_csv=TRAINING_CSV, veracity_csv=VERACITY_CSV):
+    df = pd.read_csv(training_csv)
+    df.columns = [c.strip().lower() for c in df.columns]
+    for col in ("title", "description", "category"):
+        df[col] = df[col].fillna("").astype(str)
+    df["text"] = (df["title"] + " " + df["description"]).str.strip()
+    if "label" in df.columns:
+        df["fraud"] = pd.to_numeric(df["label"], errors="coerce").fillna(0).astype(int)
+    else:
+        df["fraud"] = (df["category"].str.lower() == "spam").astype(int)
+
+    ver = pd.read_csv(veracity_csv)
+    ver["text"] = ver["text"].fillna("").astype(str)
+    ver["label"] = ver["label"].astype(str).str.strip().str.lower().map(VERACITY_LABELS)
+    ver = ver.dropna(subset=["label"])
+    ver["label"] = ver["label"].astype(int)
+    return df, ver
+
+
+def _features(training_csv=TRAINING_CSV, veracity_csv=VERACITY_CSV, vectorizer=None):
+    """
+    (vectorizer, matrices, labels), from ai/feature_store.py while the CSVs
+    and the (unfitted) vectorizer's settings are unchanged.
+    """
+    def build(vectorizer):
+        df, ver = _load_frames(training_csv, veracity_csv)
+        df_train, df_test = train_test_split(df, test_size=0.2, random_state=42)
+        ver_train, ver_test = train_test_split(ver, test_size=0.2, random_state=42, stratify=ver["label"])
+
+        # one vocabulary over every training text
+        vectorizer.fit(pd.concat([df_train["text"], ver_train["text"]]))
+        matrices = {
+            "X_train": vectorizer.transform(df_train["text"]),
+            "X_test": vectorizer.transform(df_test["text"]),
+            "V_train": vectorizer.transform(ver_train["text"]),
+            "V_test": vectorizer.transform(ver_test["text"]),
+        }
+        labels = {"veracity_train": ver_train["label"], "veracity_test": ver_test["label"]}
+        for split, part in (("train", df_train), ("test", df_test)):
+            labels[f"category_{split}"] = part["category"]
+            labels[f"severity_{split}"] = part["severity"]     # NaN allowed on spam rows
+            labels[f"fraud_{split}"] = part["fraud"]
+        return matrices, labels
+
+    return feature_store.load_or_build(
+        "shared", [training_csv, veracity_csv], vectorizer or make_vectorizer(), build,
+        params={"test_size": 0.2, "random_state": 42},
+    )
+
+
+def model_sets(M, y) -> dict:
+    """
+    {model: (X_train, y_train, X_test, y_test, LogisticRegression kwargs)}
+    from _features(); category / severity leave out the spam rows.
+    """
+    civic_train = np.array([c.lower() != "spam" for c in y["category_train"]], dtype=bool)
+    civic_test = np.array([c.lower() != "spam" for c in y["category_test"]], dtype=bool)
+    return {
+        "category": (M["X_train"][civic_train], y["category_train"][civic_train],
+                     M["X_test"][civic_test], y["category_test"][civic_test], {"class_weight": "balanced"}),
+        "severity": (M["X_train"][civic_train], y["severity_train"][civic_train].astype(int),
+                     M["X_test"][civic_test], y["severity_test"][civic_test].astype(int), {"class_weight": "balanced"}),
+        "fraud": (M["X_train"], y["fraud_train"], M["X_test"], y["fraud_test"], {"class_weight": "balanced"}),
+        "veracity": (M["V_train"], y["veracity_train"], M["V_test"], y["veracity_test"], {}),
+    }
+
+
+def save_bundle(vectorizer, models, art_dir):
+    # models first, vectorizer last: the registry reloads the bundle once the
+    # newest file has settled, so it never pairs a new vocabulary with old models
+    files = registry.BUNDLES["shared"]
+    for name, model in models.items():
+        joblib.dump(model, os.path.join(art_dir, files[name]))
+    joblib.dump(vectorizer, os.path.join(art_dir, files["vectorizer"]))
+
+
+def train_shared(training_csv=TRAINING_CSV, veracity_csv=VERACITY_CSV, art_dir=None):
+    art_dir = art_dir or registry.ART_DIR
+    os.makedirs(art_dir, exist_ok=True)
+    vectorizer, M, y = _features(training_csv, veracity_csv)
+
+    models = {}
+    for name, (X_tr, y_tr, X_te, y_te, kwargs) in model_sets(M, y).items():
+        model = LogisticRegression(max_iter=2000, **kwargs)
+        model.fit(X_tr, y_tr)
+        print(f"{name:<9} accuracy: {accuracy_score(y_te, model.predict(X_te)):.3f}")
+        models[name] = model
+
+    save_bundle(vectorizer, models, art_dir)
+    print("✅ Shared models saved to", art_dir)
+
+
+if __name__ == "__main__":
+    train_shared()
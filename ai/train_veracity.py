@@ -6,6 +6,8 @@ import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 
+from ai import feature_store
+
 DATA_PATH = "ai/data/veracity_1500.csv"
 ART_DIR = "ai/artifacts"
 
@@ -15,25 +17,28 @@ VECT_PATH  = os.path.join(ART_DIR, "veracity_vectorizer.pkl")
 def train():
     os.makedirs(ART_DIR, exist_ok=True)
 
-    df = pd.read_csv(DATA_PATH)
+    def build(vectorizer):
+        df = pd.read_csv(DATA_PATH)
+
+        # Expecting columns: text,label
+        if "text" not in df.columns or "label" not in df.columns:
+            raise ValueError("CSV must contain columns: text,label")
 
-    # Expecting columns: text,label
-    if "text" not in df.columns or "label" not in df.columns:
-        raise ValueError("CSV must contain columns: text,label")
+        df["text"] = df["text"].astype(str).fillna("")
+        df["label"] = df["label"].astype(str).str.strip().str.lower()
 
-    df["text"] = df["text"].astype(str).fillna("")
-    df["label"] = df["label"].astype(str).str.strip().str.lower()
+        # map labels
+        label_map = {"legit": 0, "fake": 1, "spam": 2}
+        y = df["label"].map(label_map)
 
-    # map labels
-    label_map = {"legit": 0, "fake": 1, "spam": 2}
-    y = df["label"].map(label_map)
+        # Drop bad/unknown labels safely
+        bad = y.isna().sum()
+        if bad > 0:
+            print(f"⚠️ Dropping {bad} rows with unknown labels (not in {list(label_map.keys())})")
+            df = df[~y.isna()].copy()
+            y = y[~y.isna()].astype(int)
 
-    # Drop bad/unknown labels safely
-    bad = y.isna().sum()
-    if bad > 0:
-        print(f"⚠️ Dropping {bad} rows with unknown labels (not in {list(label_map.keys())})")
-        df = df[~y.isna()].copy()
-        y = y[~y.isna()].astype(int)
+        return {"X": vectorizer.fit_transform(df["text"])}, {"y": y}
 
     vectorizer = TfidfVectorizer(
         stop_words="english",
@@ -41,7 +46,9 @@ def train():
         max_features=8000
     )
 
-    X = vectorizer.fit_transform(df["text"])
+    # reused while the CSV is unchanged (ai/feature_store.py)
+    vectorizer, M, labels = feature_store.load_or_build("veracity", [DATA_PATH], vectorizer, build)
+    X, y = M["X"], labels["y"]
 
     # IMPORTANT: remove multi_class (your sklearn build rejects it)
     # We use multinomial behavior by choosing solver that supports multiclass well
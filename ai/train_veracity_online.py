@@ -0,0 +1,180 @@
+# ai/train_veracity_online.py
+"""
+Incremental veracity model, kept fresh from admin decisions.
+
+ai/train_veracity.py refits a TF-IDF vocabulary and a LogisticRegression on
+the whole history, so its cost grows with every label. This trainer uses
+features that need no fitting (a HashingVectorizer) and an SGD logistic
+model updated with partial_fit: each run reads only the approve / reject
+decisions logged since its job watermark (admin_decisions, migration 0008),
+updates the current model with them and publishes it, so a run costs time
+proportional to the new labels.
+
+The first run starts from ai/data/veracity_1500.csv (a few passes of
+partial_fit) when it exists. Labels: approved -> legit (0), rejected ->
+fake (1), as in ai/export_admin_label.py.
+
+Every publish writes ai/artifacts/veracity_online/<version>/ (model +
+meta.json, the last KEEP kept) and then swaps the served
+veracity_online_model.pkl with os.replace; the registry hot-reloads it and
+ai/veracity.py prefers it over the batch model. The watermark is committed
+after the publish, so a run killed in between re-learns those labels once.
+
+    python -m ai.train_veracity_online              # labels since the last run
+    python -m ai.train_veracity_online --restart    # seed again, replay every decision
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+
+from ai import registry
+from ai.veracity import ONLINE_BUNDLE
+from backend.utils import db_utils
+
+JOB = "veracity_online"
+SEED_CSV = "ai/data/veracity_1500.csv"
+SEED_EPOCHS = 5
+KEEP = 5
+
+CLASSES = np.array([0, 1, 2])      # legit | fake | spam, as ai/veracity.py LABEL_INV
+LABELS = {"legit": 0, "fake": 1, "spam": 2}
+
+
+def _paths(art_dir):
+    files = registry.BUNDLES[ONLINE_BUNDLE]
+    return (
+        os.path.join(art_dir, files["model"]),
+        os.path.join(art_dir, files["vectorizer"]),
+        os.path.join(art_dir, "veracity_online"),
+    )
+
+
+def make_online_vectorizer():
+    # stateless: the same text always hashes to the same columns, nothing to refit
+    return HashingVectorizer(
+        stop_words="english", ngram_range=(1, 2), n_features=2 ** 18, alternate_sign=False, norm="l2"
+    )
+
+
+def make_online_model():
+    return SGDClassifier(loss="log_loss", alpha=1e-5, random_state=0)
+
+
+def _texts(rows):
+    return [f"{(t or '').strip()} {(d or '').strip()}".strip() for _, t, d, _ in rows]
+
+
+def _seed(model, vect, csv_path, verbose=True) -> int:
+    df = pd.read_csv(csv_path)
+    df["text"] = df["text"].fillna("").astype(str)
+    y = df["label"].astype(str).str.strip().str.lower().map(LABELS)
+    df, y = df[y.notna()], y[y.notna()].astype(int).to_numpy()
+    X = vect.transform(df["text"])
+    rng = np.random.default_rng(0)
+    for _ in range(SEED_EPOCHS):
+        order = rng.permutation(len(y))
+        model.partial_fit(X[order], y[order], classes=CLASSES)
+    if verbose:
+        print(f"→ seeded from {csv_path} ({len(y)} rows, {SEED_EPOCHS} passes)")
+    return len(y)
+
+
+def publish(model, vect, meta, art_dir=None) -> str:
+    """
+    Writes a new versioned copy and swaps it in as the served model.
+    Returns the version.
+    """
+    art_dir = art_dir or registry.ART_DIR
+    model_path, vect_path, versions_dir = _paths(art_dir)
+    os.makedirs(versions_dir, exist_ok=True)
+    existing = sorted(os.listdir(versions_dir))
+    seq = int(existing[-1].split("-")[0]) + 1 if existing else 1
+    version = f"{seq:06d}-" + time.strftime("%Y%m%d-%H%M%S")
+    version_dir = os.path.join(versions_dir, version)
+    os.makedirs(version_dir)
+    joblib.dump(model, os.path.join(version_dir, "model.pkl"))
+    with open(os.path.join(version_dir, "meta.json"), "w") as f:
+        json.dump(dict(meta, version=version), f, indent=2)
+
+    if not os.path.exists(vect_path):
+        joblib.dump(vect, vect_path + ".tmp")
+        os.replace(vect_path + ".tmp", vect_path)
+    shutil.copyfile(os.path.join(version_dir, "model.pkl"), model_path + ".tmp")
+    os.replace(model_path + ".tmp", model_path)
+
+    for old in sorted(os.listdir(versions_dir))[:-KEEP]:
+        shutil.rmtree(os.path.join(versions_dir, old), ignore_errors=True)
+    return version
+
+
+def update(chunk=1000, restart=False, seed_csv=SEED_CSV, art_dir=None, verbose=True) -> int:
+    """
+    Learns the decisions logged since the watermark and publishes the model.
+    Returns the number of labels learned (0: nothing new, nothing published).
+    """
+    art_dir = art_dir or registry.ART_DIR
+    model_path, vect_path, _ = _paths(art_dir)
+    os.makedirs(art_dir, exist_ok=True)
+
+    vect = make_online_vectorizer()
+    seeded = 0
+    if restart or not os.path.exists(model_path):
+        model, after_id = make_online_model(), 0
+        if seed_csv and os.path.exists(seed_csv):
+            seeded = _seed(model, vect, seed_csv, verbose)
+    else:
+        model, after_id = joblib.load(model_path), db_utils.get_watermark(JOB)
+
+    learned = correct = 0
+    last_id = after_id
+    t0 = time.perf_counter()
+    for rows in db_utils.iter_admin_decisions(after_id=after_id, chunk=chunk):
+        X = vect.transform(_texts(rows))
+        y = np.array([label for *_, label in rows])
+        if hasattr(model, "coef_"):
+            # predict-then-learn: accuracy on labels the model hadn't seen yet
+            correct += int((model.predict(X) == y).sum())
+        model.partial_fit(X, y, classes=CLASSES)
+        learned += len(rows)
+        last_id = rows[-1][0]
+        if verbose:
+            print(f"→ {learned} decisions learned (up to decision {last_id})")
+
+    if not learned and not seeded:
+        return 0
+    meta = {
+        "watermark": last_id,
+        "labels": learned,
+        "seeded": seeded,
+        "prequential_accuracy": round(correct / learned, 4) if learned else None,
+        "train_s": round(time.perf_counter() - t0, 3),
+        "trained_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    version = publish(model, vect, meta, art_dir)
+    db_utils.set_watermark(JOB, last_id)
+    if verbose:
+        print(f"→ published {version}: {json.dumps(meta)}")
+    return learned
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update the online veracity model from admin decisions")
+    parser.add_argument("--chunk", type=int, default=1000)
+    parser.add_argument("--restart", action="store_true", help="start a fresh model and replay every decision")
+    parser.add_argument("--seed", default=SEED_CSV, help="CSV (text,label) for a fresh model; '' to skip")
+    args = parser.parse_args()
+
+    done = update(chunk=args.chunk, restart=args.restart, seed_csv=args.seed)
+    print(f"✅ Learned {done} new decision(s)" if done else "✅ No new decisions")
+
+
+if __name__ == "__main__":
+    main()
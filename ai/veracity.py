@@ -1,73 +1,104 @@
 # ai/veracity.py
 import os
-import re
-import joblib
+
+from ai import registry
+from ai.features import featurize, featurize_batch
+from ai.text_stats import is_short_or_symbolic
 
 ART_DIR = "ai/artifacts"
 MODEL_PATH = os.path.join(ART_DIR, "veracity_model.pkl")
 VECT_PATH  = os.path.join(ART_DIR, "veracity_vectorizer.pkl")
 
-# cache in memory (fast, prevents reloading every request)
-_MODEL = None
-_VECT = None
-
 LABEL_INV = {0: "legit", 1: "fake", 2: "spam"}
 
-def _load():
-    global _MODEL, _VECT
-    if _MODEL is not None and _VECT is not None:
-        return _MODEL, _VECT
+ONLINE_BUNDLE = "veracity_online"
 
-    if not (os.path.exists(MODEL_PATH) and os.path.exists(VECT_PATH)):
+def _load():
+    # shared, hot-reloaded copy from ai/registry.py
+    try:
+        models = registry.get("veracity")
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Veracity model not found. Expected:\n- {MODEL_PATH}\n- {VECT_PATH}"
         )
+    return models["model"], models["vectorizer"]
 
-    _MODEL = joblib.load(MODEL_PATH)
-    _VECT  = joblib.load(VECT_PATH)
-    return _MODEL, _VECT
-
-def _is_gibberish(text: str) -> bool:
-    t = (text or "").strip().lower()
-    if len(t) < 8:
-        return True
-    # repeated same char like "aaaaaaa" "!!!!!"
-    if re.search(r"(.)\1{5,}", t):
-        return True
-    # mostly non-letters
-    letters = sum(ch.isalpha() for ch in t)
-    if letters / max(len(t), 1) < 0.35:
-        return True
-    return False
+def _online():
+    # once ai/train_veracity_online.py has published a model it replaces the
+    # batch-trained one: it has seen every admin decision since
+    try:
+        models = registry.get(ONLINE_BUNDLE)
+    except FileNotFoundError:
+        return None
+    return models["model"], models["vectorizer"]
 
 def predict_veracity_score(title: str, description: str) -> float:
     """
     Returns probability of "fake" (0..1).
     """
-    model, vect = _load()
+    model, vect = _online() or _load()
     text = f"{title or ''} {description or ''}".strip()
-    X = vect.transform([text])
+    with registry.timed("veracity"):
+        X = vect.transform([text])
 
-    # Predict probabilities across 3 classes [legit, fake, spam]
-    proba = model.predict_proba(X)[0]
+        # Predict probabilities across 3 classes [legit, fake, spam]
+        proba = model.predict_proba(X)[0]
 
     # fake class index = 1
     return float(proba[1])
 
-def predict_veracity(title: str, description: str, min_conf: float = 0.55):
+def predict_veracity(title: str, description: str, min_conf: float = 0.55, features=None):
     """
     Returns: (verdict, score_false, is_suspicious)
 
     verdict: legit | fake | spam | unknown
     score_false: probability of fake (0..1)
     is_suspicious: 0/1 for admin attention
+    features: ai.features.featurize() output, reused instead of re-vectorizing
     """
-    model, vect = _load()
+    online = _online()
+    if online is None and features is None:
+        features = featurize(title, description)
+    if online is not None:
+        (model, vect), X = online, None
+    elif features is not None:
+        model, vect, X = features.models["veracity"], None, features.X
+    else:
+        model, vect = _load()
+        X = None
     text = f"{title or ''} {description or ''}".strip()
 
-    X = vect.transform([text])
-    proba = model.predict_proba(X)[0]  # [p_legit, p_fake, p_spam]
+    with registry.timed("veracity"):
+        if X is None:
+            X = vect.transform([text])
+        proba = model.predict_proba(X)[0]  # [p_legit, p_fake, p_spam]
 
+    return _verdict(proba, text, min_conf)
+
+def predict_veracity_batch(pairs, min_conf: float = 0.55, features=None):
+    """
+    [(title, description), ...] -> [(verdict, score_false, is_suspicious), ...]
+    with one transform + predict_proba for the whole batch.
+    features: ai.features.featurize_batch() output for the same pairs
+    """
+    if not pairs:
+        return []
+    online = _online()
+    if online is None and features is None:
+        features = featurize_batch(pairs)
+    texts = [f"{t or ''} {d or ''}".strip() for t, d in pairs]
+    with registry.timed("veracity"):
+        if online is not None:
+            model, vect = online
+            proba = model.predict_proba(vect.transform(texts))
+        elif features is not None:
+            proba = features.models["veracity"].predict_proba(features.X)
+        else:
+            model, vect = _load()
+            proba = model.predict_proba(vect.transform(texts))
+    return [_verdict(p, text, min_conf) for p, text in zip(proba, texts)]
+
+def _verdict(proba, text: str, min_conf: float):
     best_idx = int(proba.argmax())
     best_prob = float(proba[best_idx])
 
@@ -84,7 +115,7 @@ def predict_veracity(title: str, description: str, min_conf: float = 0.55):
     is_susp = 0
     if label in ("fake", "spam"):
         is_susp = 1
-    if _is_gibberish(text):
+    if is_short_or_symbolic(text):
         # junk report -> suspicious even if unknown
         is_susp = 1
         if label == "legit":
@@ -1,16 +1,68 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from ai import registry
+from backend.routes import auth, issues, admin, department, maps
+from backend.utils import db_utils, inference_queue, ingest, prediction_cache, screening
+
+
+# eager: load every model before serving; background: serve /health right away
+# and load in a thread (the first scoring request waits for its bundle);
+# lazy: load each bundle on first use
+AI_WARMUP = os.getenv("AI_WARMUP", "background")
+
+
+def warm_models():
+    loaded = registry.warm()
+    print("✅ AI models loaded:", ", ".join(n for n, ok in loaded.items() if ok) or "none")
 
-from backend.routes import auth, issues, admin, department
 
-app = FastAPI(title="Manipur Issue Mapper API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if AI_WARMUP == "eager":
+        warm_models()
+    elif AI_WARMUP == "background":
+        asyncio.get_running_loop().run_in_executor(None, warm_models)
+    await inference_queue.start()
+    yield
+    await inference_queue.stop()
+    ingest.shutdown()
+
+
+app = FastAPI(title="Manipur Issue Mapper API", lifespan=lifespan)
 
 # ✅ HEALTH FIRST (so it won't be shadowed by the "/" static mount)
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
+@app.get("/health/db")
+def health_db():
+    return {"status": "ok", "pool": db_utils.pool_stats()}
+
+@app.get("/health/inference")
+def health_inference():
+    return {"status": "ok", **inference_queue.stats()}
+
+@app.get("/health/screening")
+def health_screening():
+    return {"status": "ok", **screening.stats()}
+
+@app.get("/health/models")
+def health_models():
+    return {
+        "status": "ok",
+        "warmup": AI_WARMUP,
+        **registry.stats(),
+        "prediction_cache": prediction_cache.stats(),
+    }
+
 # ---------- CORS ----------
 app.add_middleware(
     CORSMiddleware,
@@ -19,12 +71,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # ---------- API Routes ----------
 app.include_router(auth.router)
 app.include_router(issues.router)
 app.include_router(admin.router)
 app.include_router(department.router)
+app.include_router(maps.router)
 
 # ---------- STATIC FILE SERVING ----------
 # ✅ Mount specific paths first, then "/" last (catch-all last)
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, HTTPException, Header
+from fastapi import APIRouter, HTTPException, Header, Query
 from pydantic import BaseModel
 from backend.utils.db_utils import (
-    fetch_issues,
+    fetch_issues_page,
+    parse_fields,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
     get_issue_by_id,
-    get_connection
+    get_admin_by_username,
+    update_admin_decision,
+    resolve_department_id,
+    delete_issues
 )
+from backend.utils import ai_utils, dedupe, spatial
 import bcrypt
 import uuid
 
@@ -21,17 +28,7 @@ class AdminLoginRequest(BaseModel):
 # ---------------- Admin Login ----------------
 @router.post("/login")
 def admin_login(data: AdminLoginRequest):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-
-    cursor.execute(
-        "SELECT * FROM admins WHERE username=%s",
-        (data.username,)
-    )
-    admin = cursor.fetchone()
-
-    cursor.close()
-    conn.close()
+    admin = get_admin_by_username(data.username)
 
     if not admin:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -58,9 +55,18 @@ def verify_admin_token(authorization: str | None):
 
 # ---------------- Get All Issues ----------------
 @router.get("/issues")
-def admin_get_all_issues(authorization: str | None = Header(None)):
+def admin_get_all_issues(
+    authorization: str | None = Header(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+):
     verify_admin_token(authorization)
-    return {"status": "success", "issues": fetch_issues()}
+    try:
+        issues, next_cursor = fetch_issues_page(limit=limit, cursor=cursor, fields=parse_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", "issues": issues, "next_cursor": next_cursor}
 
 # ---------------- Approve / Reject Issue ----------------
 class ApproveIssueRequest(BaseModel):
@@ -68,6 +74,12 @@ class ApproveIssueRequest(BaseModel):
     department: str | None = None
     admin_comment: str | None = None
 
+def _decision_label(approved_by_admin, status):
+    # admin_decisions label an issue is in: 0 approved, 1 rejected, None undecided
+    if approved_by_admin:
+        return 0
+    return 1 if status == "Rejected" else None
+
 @router.post("/issues/{issue_id}/approve")
 def admin_approve_issue(
     issue_id: int,
@@ -87,61 +99,70 @@ def admin_approve_issue(
     elif data.approved is False:
         new_status = "Rejected"
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        UPDATE issues
-        SET
-            approved_by_admin=%s,
-            assigned_department=%s,
-            admin_comment=%s,
-            status=%s
-        WHERE id=%s
-    """, (
-        1 if data.approved else 0 if data.approved is not None else issue["approved_by_admin"],
-        data.department if data.department else issue["assigned_department"],
-        data.admin_comment if data.admin_comment else issue["admin_comment"],
-        new_status,
-        issue_id
-    ))
-
-    conn.commit()
-    cursor.close()
-    conn.close()
+    # Resolve the free-text department to its id once, here, so the
+    # department portal can filter on an indexed column.
+    department_id = issue.get("department_id")
+    if data.department:
+        department_id = resolve_department_id(data.department)
+        if department_id is None:
+            raise HTTPException(status_code=400, detail=f"Unknown department: {data.department}")
+
+    approved_by_admin = 1 if data.approved else 0 if data.approved is not None else issue["approved_by_admin"]
+    label = _decision_label(approved_by_admin, new_status)
+    # re-approving, or editing the comment of a decided issue, is not a new decision
+    if label == _decision_label(issue["approved_by_admin"], issue["status"]):
+        label = None
+
+    update_admin_decision(
+        issue_id,
+        approved_by_admin=approved_by_admin,
+        assigned_department=data.department if data.department else issue["assigned_department"],
+        department_id=department_id,
+        admin_comment=data.admin_comment if data.admin_comment else issue["admin_comment"],
+        status=new_status,
+        label=label,
+    )
+    if new_status == "Rejected":
+        ai_utils.on_issues_removed([issue_id])
 
     return {"status": "success", "message": "Issue updated successfully"}
 
 # ---------------- Cleanup Duplicates ----------------
 @router.delete("/duplicates")
-def delete_duplicates():
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-
-    cursor.execute("""
-        SELECT id, title, description, category, user_id
-        FROM issues ORDER BY id ASC
-    """)
-    rows = cursor.fetchall()
-
-    seen = {}
-    duplicates = []
-
-    for row in rows:
-        key = (row["title"], row["description"], row["category"], row["user_id"])
-        if key in seen:
-            duplicates.append(row["id"])
-        else:
-            seen[key] = row["id"]
-
-    if duplicates:
-        cursor.execute(
-            f"DELETE FROM issues WHERE id IN ({','.join(['%s']*len(duplicates))})",
-            tuple(duplicates)
-        )
-        conn.commit()
-
-    cursor.close()
-    conn.close()
-
-    return {"status": "success", "deleted_count": len(duplicates)}
+def delete_duplicates(
+    dry_run: bool = False,
+    threshold: float = Query(dedupe.CLEANUP_THRESHOLD, ge=0.5, le=1.0),
+):
+    """
+    Streams the issues table through the MinHash/LSH index and removes a
+    reporter's near-identical re-submits (same user + category), keeping the
+    earliest report.
+    """
+    duplicates, pairs = [], []
+    found = deleted = 0
+    for dup_id, original_id, score in dedupe.scan_duplicates(threshold=threshold):
+        found += 1
+        if len(pairs) < 1000:   # sample for the response, memory stays bounded
+            pairs.append({"id": dup_id, "duplicate_of": original_id, "similarity": round(score, 2)})
+        duplicates.append(dup_id)
+        if not dry_run and len(duplicates) >= 500:
+            deleted += _delete_issue_batch(duplicates)
+            duplicates = []
+    if not dry_run:
+        deleted += _delete_issue_batch(duplicates)
+
+    return {
+        "status": "success",
+        "deleted_count": deleted,
+        "duplicate_count": found,
+        "duplicates": pairs,
+    }
+
+
+def _delete_issue_batch(issue_ids):
+    if not issue_ids:
+        return 0
+    delete_issues(issue_ids)
+    spatial.on_issues_deleted(issue_ids)
+    ai_utils.on_issues_removed(issue_ids)
+    return len(issue_ids)
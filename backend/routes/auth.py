@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, EmailStr
 import random, time
 from backend.utils.db_utils import (
-    get_connection, set_user_password, verify_user_password, delete_user, get_user_by_id
+    db_cursor, set_user_password, verify_user_password, delete_user, get_user_by_id
 )
 
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
@@ -40,21 +40,17 @@ def send_otp(data: SendOtpRequest):
     otp_storage[data.mobile] = {"otp": otp, "expiry": time.time() + 300}
 
     # Create user if first-time
-    conn = get_connection()
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id FROM users WHERE mobile=%s", (data.mobile,))
-    user = cur.fetchone()
-    if not user:
-        cur.execute(
-            "INSERT INTO users (mobile, name, email) VALUES (%s, %s, %s)",
-            (data.mobile, data.name, data.email)
-        )
-        conn.commit()
-        user_id = cur.lastrowid
-    else:
-        user_id = user["id"]
-    cur.close()
-    conn.close()
+    with db_cursor(dictionary=True, commit=True) as cur:
+        cur.execute("SELECT id FROM users WHERE mobile=%s", (data.mobile,))
+        user = cur.fetchone()
+        if not user:
+            cur.execute(
+                "INSERT INTO users (mobile, name, email) VALUES (%s, %s, %s)",
+                (data.mobile, data.name, data.email)
+            )
+            user_id = cur.lastrowid
+        else:
+            user_id = user["id"]
 
     return {"status": "success", "otp": otp, "user_id": user_id}
 
@@ -70,28 +66,23 @@ def verify_otp(data: VerifyOtpRequest):
         raise HTTPException(status_code=400, detail="Invalid OTP")
 
     # Fetch user
-    conn = get_connection()
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT id, name, email FROM users WHERE mobile=%s", (data.mobile,))
-    user = cur.fetchone()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Update missing name/email
-    updates, values = [], []
-    if data.name and not user.get("name"):
-        updates.append("name=%s")
-        values.append(data.name)
-    if data.email and not user.get("email"):
-        updates.append("email=%s")
-        values.append(data.email)
-    if updates:
-        values.append(user["id"])
-        cur.execute(f"UPDATE users SET {', '.join(updates)} WHERE id=%s", tuple(values))
-        conn.commit()
-
-    cur.close()
-    conn.close()
+    with db_cursor(dictionary=True, commit=True) as cur:
+        cur.execute("SELECT id, name, email FROM users WHERE mobile=%s", (data.mobile,))
+        user = cur.fetchone()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # Update missing name/email
+        updates, values = [], []
+        if data.name and not user.get("name"):
+            updates.append("name=%s")
+            values.append(data.name)
+        if data.email and not user.get("email"):
+            updates.append("email=%s")
+            values.append(data.email)
+        if updates:
+            values.append(user["id"])
+            cur.execute(f"UPDATE users SET {', '.join(updates)} WHERE id=%s", tuple(values))
     otp_storage.pop(data.mobile)
     return {"status": "success", "user_id": user["id"], "message": "OTP verified, now set your password"}
 
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, HTTPException, Header
+from fastapi import APIRouter, HTTPException, Header, Query
 from pydantic import BaseModel
 from backend.utils.db_utils import (
-    fetch_issues,
+    fetch_issues_page,
+    parse_fields,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
     get_issue_by_id,
     update_issue_status,
-    get_connection
+    get_department_by_username,
+    fetch_departments
 )
 import bcrypt
 import uuid
@@ -22,17 +26,7 @@ class DeptLoginRequest(BaseModel):
 # ---------------- Login ----------------
 @router.post("/login")
 def dept_login(data: DeptLoginRequest):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-
-    cursor.execute(
-        "SELECT * FROM departments WHERE username=%s",
-        (data.username,)
-    )
-    dept = cursor.fetchone()
-
-    cursor.close()
-    conn.close()
+    dept = get_department_by_username(data.username)
 
     if not dept:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -66,29 +60,25 @@ def verify_dept_token(authorization: str | None):
 
 # ---------------- Get Issues ----------------
 @router.get("/issues")
-def dept_get_issues(authorization: str | None = Header(None)):
+def dept_get_issues(
+    authorization: str | None = Header(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+):
     dept = verify_dept_token(authorization)
-
-    all_issues = fetch_issues()
-
-    filtered = []
-    for i in all_issues:
-        assigned = i.get("assigned_department")
-        if not assigned:
-            continue
-            
-        # Flexible Matching: "Sanitation" == "Sanitation Department"
-        # Check if one string is contained in the other
-        is_match = (
-            assigned == dept["department_name"] or 
-            assigned in dept["department_name"] or 
-            dept["department_name"] in assigned
+    try:
+        issues, next_cursor = fetch_issues_page(
+            limit=limit,
+            cursor=cursor,
+            fields=parse_fields(fields),
+            where="department_id=%s AND approved_by_admin=1",
+            params=(dept["id"],),
         )
-        
-        if is_match and i["approved_by_admin"] == 1:
-            filtered.append(i)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return {"status": "success", "issues": filtered}
+    return {"status": "success", "issues": issues, "next_cursor": next_cursor}
 
 # ---------------- Update Status ----------------
 class UpdateStatusRequest(BaseModel):
@@ -107,7 +97,7 @@ def dept_update_issue(
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    if issue["assigned_department"] != dept["department_name"]:
+    if issue.get("department_id") != dept["id"]:
         raise HTTPException(status_code=403, detail="Not your department issue")
 
     update_issue_status(issue_id, data.status)
@@ -116,14 +106,19 @@ def dept_update_issue(
 
 # ---------------- Debug ----------------
 @router.get("/debug")
-def debug_issues():
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM departments")
-    depts = cursor.fetchall()
-    
-    issues = fetch_issues()
-    conn.close()
+def debug_issues(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+):
+    depts = fetch_departments()
+    try:
+        issues, next_cursor = fetch_issues_page(
+            limit=limit,
+            cursor=cursor,
+            fields=["id", "assigned_department", "department_id", "approved_by_admin", "status"],
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return {
         "status": "success",
@@ -132,8 +127,10 @@ def debug_issues():
             {
                 "id": i["id"],
                 "assigned_department": i["assigned_department"],
+                "department_id": i["department_id"],
                 "approved_by_admin": i["approved_by_admin"],
                 "status": i["status"]
             } for i in issues
-        ]
+        ],
+        "next_cursor": next_cursor
     }
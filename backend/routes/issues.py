@@ -1,14 +1,10 @@
 # backend/routes/issues.py
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
-from backend.utils import db_utils
-
-from ai.model import predict_issue
-from ai.fraud import predict_fraud
-from ai.veracity import predict_veracity
-
-import re
+from backend.utils import ai_utils, db_utils, spatial
+from backend.utils.ingest import ingest_issue
+from backend.utils.prediction_cache import predict_issue, predict_issues_batch
 
 router = APIRouter(prefix="/api")
 
@@ -23,218 +19,43 @@ class IssueCreate(BaseModel):
     user_id: int
 
 
-# ---------------------- HELPERS ----------------------
-def safe_predict_veracity(title: str, description: str):
-    """
-    Never crash the API if veracity model is missing/not trained.
-    Returns: (verdict, score_false, is_suspicious)
-    """
-    try:
-        verdict, score_false, is_susp = predict_veracity(title, description)
-        verdict = verdict or "unknown"
-        score_false = float(score_false or 0.0)
-        is_susp = int(is_susp or 0)
-        return verdict, score_false, is_susp
-    except FileNotFoundError:
-        return "unknown", 0.0, 0
-    except Exception:
-        return "unknown", 0.0, 0
-
-
-def safe_predict_spam(title: str, description: str):
-    """
-    Always returns (is_spam: bool, spam_prob: float)
-    Never crashes.
-    """
-    try:
-        is_spam, prob = predict_fraud(title, description)
-        return bool(is_spam), float(prob or 0.0)
-    except Exception:
-        return False, 0.0
-
-
-# ---------------------- MISMATCH / GIBBERISH GUARD ----------------------
-CATEGORY_KEYWORDS = {
-    "Road": {"road", "pothole", "bridge", "traffic", "accident", "highway", "street", "lane", "damaged"},
-    "Water": {"water", "pipe", "leak", "leakage", "supply", "tap", "drain", "drainage", "sewage"},
-    "Electricity": {"power", "electric", "electricity", "voltage", "transformer", "wire", "outage", "cut"},
-    "Sanitation": {"garbage", "waste", "dirty", "smell", "toilet", "sanitation", "drain", "cleanup"},
-    "Law": {"theft", "fight", "violence", "crime", "police", "assault", "harassment", "illegal"},
-}
-
-
-def _normalize_tokens(text: str):
-    text = (text or "").lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    toks = [t for t in text.split() if len(t) >= 3]
-    return toks
-
-
-def _is_gibberish(text: str) -> bool:
-    t = (text or "").strip()
-    if not t:
-        return True
-    if len(t) < 8:
-        return True
-
-    toks = _normalize_tokens(t)
-    if len(toks) == 0:
-        return True
-
-    vowel = set("aeiou")
-
-    def token_vowel_ratio(tok: str):
-        v = sum(1 for c in tok if c in vowel)
-        return v / max(len(tok), 1)
-
-    bad = 0
-    for tok in toks[:20]:
-        if token_vowel_ratio(tok) < 0.20:  # like "fsdhgfsdeh"
-            bad += 1
-
-    if bad / max(len(toks[:20]), 1) >= 0.60:
-        return True
-
-    if re.search(r"(.)\1{5,}", t.lower()):
-        return True
-
-    return False
-
-
-def _title_desc_mismatch(title: str, desc: str) -> bool:
-    t_tokens = set(_normalize_tokens(title))
-    d_tokens = set(_normalize_tokens(desc))
-
-    # Title looks normal but desc is gibberish/empty
-    if (not _is_gibberish(title)) and _is_gibberish(desc):
-        return True
-
-    # Low overlap between title and desc
-    if len(t_tokens) >= 2 and len(d_tokens) >= 4:
-        overlap = len(t_tokens.intersection(d_tokens))
-        if overlap / max(len(t_tokens), 1) < 0.15:
-            return True
-
-    return False
-
-
-def _category_mismatch(category: str, title: str, desc: str) -> bool:
-    cat = (category or "").strip()
-    if not cat or cat not in CATEGORY_KEYWORDS:
-        return False
-
-    tokens = set(_normalize_tokens(f"{title} {desc}"))
-    kws = CATEGORY_KEYWORDS[cat]
-
-    hit = len(tokens.intersection(kws))
-    if hit >= 1:
-        return False
-
-    other_hits = {
-        c: len(tokens.intersection(kw))
-        for c, kw in CATEGORY_KEYWORDS.items()
-        if c != cat
-    }
-    best_other = max(other_hits.values()) if other_hits else 0
-
-    if best_other >= 2:
-        return True
-
-    return False
-
-
-def mismatch_guard(title: str, desc: str, category: str):
-    """
-    Returns: (is_mismatch: bool, reasons: list[str], force_spam: bool)
-
-    force_spam triggers only in high-confidence bot patterns:
-    - gibberish title + meaningful description
-    """
-    reasons = []
-    force_spam = False
-
-    title_gib = _is_gibberish(title)
-    desc_gib = _is_gibberish(desc)
-
-    # ✅ NEW RULE: title gibberish + description real => spam
-    if title_gib and not desc_gib:
-        reasons.append("gibberish_title_real_description")
-        force_spam = True
-        return True, reasons, force_spam
-
-    if _title_desc_mismatch(title, desc):
-        reasons.append("title_desc_mismatch")
-
-    if _category_mismatch(category, title, desc):
-        reasons.append("category_mismatch")
+class PredictText(BaseModel):
+    title: str
+    description: str = ""
 
-    if not title_gib and (desc or "").strip() and len((desc or "").strip()) < 12:
-        reasons.append("description_too_short")
 
-    return (len(reasons) > 0), reasons, force_spam
+class BatchPredictRequest(BaseModel):
+    issue_ids: list[int] = Field(default_factory=list, max_length=1000)
+    items: list[PredictText] = Field(default_factory=list, max_length=1000)
 
 
 # ---------------------- CREATE ISSUE ----------------------
 @router.post("/issues/")
-def create_issue(issue: IssueCreate):
+async def create_issue(issue: IssueCreate):
     """
     Creates a new issue.
     We DO NOT reject automatically.
     We only tag it as suspicious/legit/unknown/spam for admin review.
     """
-
-    # 1) Veracity model
-    verdict, score_false, is_susp = safe_predict_veracity(issue.title, issue.description)
-
-    # 2) Spam detector (optional override)
-    is_spam, spam_prob = safe_predict_spam(issue.title, issue.description)
-    if is_spam:
-        verdict = "spam"
-        is_susp = 1
-
-    # 3) Title/Description/Category mismatch guard
-    is_mismatch, reasons, force_spam = mismatch_guard(issue.title, issue.description, issue.category)
-
-    # ✅ force_spam has priority (but still NO auto-reject, only tag)
-    if force_spam:
-        verdict = "spam"
-        is_susp = 1
-    elif is_mismatch:
-        if verdict != "spam":
-            if verdict == "legit":
-                verdict = "fake"
-            else:
-                verdict = verdict or "unknown"
-        is_susp = 1
-
-    issue_id = db_utils.add_issue(
-        title=issue.title,
-        category=issue.category,
-        description=issue.description,
-        latitude=issue.latitude,
-        longitude=issue.longitude,
-        user_id=issue.user_id,
-        ai_category=None,
-        ai_severity=None,
-        ai_veracity=verdict,
-        is_suspicious=int(is_susp),
-    )
-
-    return {
-        "status": "success",
-        "issue_id": issue_id,
-        "ai_veracity": verdict,
-        "is_suspicious": int(is_susp),
-        "score_false": float(score_false),
-        "spam_prob": float(spam_prob),
-        "mismatch_reasons": reasons,
-    }
+    result = await ingest_issue(issue)
+    return {"status": "success", **result}
 
 
 # ---------------------- GET ALL ISSUES ----------------------
 @router.get("/issues/")
-def get_issues(user_id: Optional[int] = None):
-    return {"status": "success", "data": db_utils.fetch_issues(user_id)}
+def get_issues(
+    user_id: Optional[int] = None,
+    limit: int = Query(db_utils.DEFAULT_PAGE_SIZE, ge=1, le=db_utils.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+):
+    try:
+        rows, next_cursor = db_utils.fetch_issues_page(
+            user_id=user_id, limit=limit, cursor=cursor, fields=db_utils.parse_fields(fields)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", "data": rows, "next_cursor": next_cursor}
 
 
 # ---------------------- GET NEARBY ISSUES ----------------------
@@ -242,9 +63,10 @@ def get_issues(user_id: Optional[int] = None):
 def get_nearby_issues(
     lat: float = Query(..., description="Latitude of user"),
     lng: float = Query(..., description="Longitude of user"),
-    radius: float = Query(0.5, description="Radius in km"),
+    radius: float = Query(0.5, gt=0, le=50, description="Radius in km"),
+    limit: int = Query(5, ge=1, le=100, description="Closest N issues inside the radius"),
 ):
-    nearby = db_utils.fetch_nearby_issues(lat, lng, radius)
+    nearby = spatial.nearby_issues(lat, lng, radius, limit=limit)
     return {
         "status": "success",
         "count": len(nearby),
@@ -253,6 +75,18 @@ def get_nearby_issues(
     }
 
 
+# ---------------------- K-NEAREST ISSUES ----------------------
+@router.get("/issues/nearest")
+def get_nearest_issues(
+    lat: float = Query(..., description="Latitude of user"),
+    lng: float = Query(..., description="Longitude of user"),
+    k: int = Query(5, ge=1, le=100),
+    max_km: Optional[float] = Query(None, gt=0, description="Ignore issues farther than this"),
+):
+    nearest = spatial.nearest_issues(lat, lng, k=k, max_km=max_km)
+    return {"status": "success", "count": len(nearest), "data": nearest}
+
+
 # ---------------------- GET SINGLE ISSUE ----------------------
 @router.get("/issues/{issue_id}")
 def get_issue(issue_id: int):
@@ -296,56 +130,58 @@ def predict_issue_api(issue_id: int):
 
     ai_category, ai_severity = predict_issue(issue["title"], issue["description"])
     db_utils.update_ai_fields(issue_id, ai_category, ai_severity)
+    ai_utils.on_issue_severity(issue_id, ai_severity)
 
     return {"ai_category": ai_category, "ai_severity": ai_severity}
 
 
-# ---------------------- SUBMIT ISSUE (NO AUTO-REJECT) ----------------------
-@router.post("/submit")
-async def submit_issue(issue: IssueCreate):
+# ---------------------- AI PREDICT (BATCH) ----------------------
+@router.post("/issues/predict/batch")
+def predict_batch_api(data: BatchPredictRequest):
     """
-    Same as create_issue but kept for compatibility.
-    IMPORTANT: no auto-reject. Admin will reject if suspicious.
+    Classifies many stored issues (saved back to the DB) and/or free texts
+    (not saved) with one vectorized predict.
     """
+    if not data.issue_ids and not data.items:
+        raise HTTPException(status_code=400, detail="Provide issue_ids and/or items")
 
-    verdict, score_false, is_susp = safe_predict_veracity(issue.title, issue.description)
-
-    is_spam, spam_prob = safe_predict_spam(issue.title, issue.description)
-    if is_spam:
-        verdict = "spam"
-        is_susp = 1
+    rows = db_utils.fetch_issues_by_ids(data.issue_ids, fields=["id", "title", "description"])
+    pairs = [(r["title"], r["description"]) for r in rows] + [(i.title, i.description) for i in data.items]
+    try:
+        preds = predict_issues_batch(pairs)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
-    is_mismatch, reasons, force_spam = mismatch_guard(issue.title, issue.description, issue.category)
+    issue_preds, item_preds = preds[:len(rows)], preds[len(rows):]
+    db_utils.update_ai_fields_many([(cat, sev, r["id"]) for r, (cat, sev, _) in zip(rows, issue_preds)])
+    for r, (_, sev, _) in zip(rows, issue_preds):
+        ai_utils.on_issue_severity(r["id"], sev)
 
-    if force_spam:
-        verdict = "spam"
-        is_susp = 1
-    elif is_mismatch:
-        if verdict != "spam":
-            if verdict == "legit":
-                verdict = "fake"
-        is_susp = 1
+    found = {r["id"] for r in rows}
+    return {
+        "status": "success",
+        "issues": [
+            {"id": r["id"], "ai_category": cat, "ai_severity": sev, "confidence": round(conf, 3)}
+            for r, (cat, sev, conf) in zip(rows, issue_preds)
+        ],
+        "items": [
+            {"ai_category": cat, "ai_severity": sev, "confidence": round(conf, 3)}
+            for cat, sev, conf in item_preds
+        ],
+        "missing_ids": [i for i in data.issue_ids if i not in found],
+    }
 
-    issue_id = db_utils.add_issue(
-        title=issue.title,
-        category=issue.category,
-        description=issue.description,
-        latitude=issue.latitude,
-        longitude=issue.longitude,
-        user_id=issue.user_id,
-        ai_category=None,
-        ai_severity=None,
-        ai_veracity=verdict,
-        is_suspicious=int(is_susp),
-    )
 
+# ---------------------- SUBMIT ISSUE (NO AUTO-REJECT) ----------------------
+@router.post("/submit")
+async def submit_issue(issue: IssueCreate):
+    """
+    Same as create_issue but kept for compatibility.
+    IMPORTANT: no auto-reject. Admin will reject if suspicious.
+    """
+    result = await ingest_issue(issue)
     return {
         "status": "success",
         "message": "Issue submitted successfully",
-        "issue_id": issue_id,
-        "ai_veracity": verdict,
-        "is_suspicious": int(is_susp),
-        "score_false": float(score_false),
-        "spam_prob": float(spam_prob),
-        "mismatch_reasons": reasons,
+        **result,
     }
@@ -0,0 +1,70 @@
+# backend/routes/maps.py
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+from backend.utils import ai_utils, heatmap
+
+router = APIRouter(prefix="/api", tags=["Map"])
+
+
+def _csv(value: Optional[str]):
+    return [v.strip() for v in value.split(",") if v.strip()] if value else None
+
+
+# ---------------------- HEATMAP ----------------------
+@router.get("/heatmap")
+def get_heatmap(
+    bbox: str = Query(..., description="south,west,north,east in degrees"),
+    zoom: int = Query(12, ge=0, le=22),
+    category: Optional[str] = Query(None, description="Comma-separated categories"),
+    status: Optional[str] = Query(None, description="Comma-separated statuses"),
+    since_hours: Optional[int] = Query(None, ge=1, description="Only issues newer than this"),
+):
+    try:
+        south, west, north, east = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be south,west,north,east")
+    if south >= north or west >= east:
+        raise HTTPException(status_code=400, detail="bbox must be south,west,north,east")
+
+    try:
+        data = heatmap.heatmap(
+            south, west, north, east, zoom,
+            categories=_csv(category),
+            statuses=_csv(status),
+            since_hours=since_hours,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"status": "success", **data}
+
+
+# ---------------------- RED ZONES ----------------------
+@router.get("/zones")
+def get_zones(
+    bbox: Optional[str] = Query(None, description="south,west,north,east in degrees"),
+    zone: Optional[str] = Query(None, description="Only this zone: red | orange"),
+):
+    box = None
+    if bbox:
+        try:
+            box = tuple(float(v) for v in bbox.split(","))
+            if len(box) != 4:
+                raise ValueError
+        except ValueError:
+            raise HTTPException(status_code=400, detail="bbox must be south,west,north,east")
+
+    zones = ai_utils.risk_engine().zones(bbox=box)
+    if zone:
+        zones = [z for z in zones if z["zone"] == zone]
+    return {"status": "success", "count": len(zones), "zones": zones}
+
+
+@router.get("/zones/score")
+def get_zone_score(
+    lat: float = Query(..., description="Latitude"),
+    lng: float = Query(..., description="Longitude"),
+):
+    issue = ai_utils.apply_ai_zoning({"latitude": lat, "longitude": lng})
+    return {"status": "success", "risk_score": issue["risk_score"], "zone": issue["zone"]}
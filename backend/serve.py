@@ -0,0 +1,185 @@
+# backend/serve.py
+"""
+Multi-worker server that loads the models once and forks the workers.
+
+`uvicorn --workers N` starts N fresh interpreters and each unpickles its own
+copy of every model. Here the parent imports the app, loads every bundle and
+runs one prediction through each model (so lazily built state exists too),
+freezes the GC so collections in the workers don't write to the inherited
+objects, then forks N workers that accept on one shared socket. The model
+pages stay shared copy-on-write until a worker hot-reloads a bundle.
+
+With AI_RUNTIME=numpy the arrays are file-backed mmaps (ai/linear_runtime.py)
+and are shared through the page cache even across reloads.
+
+    python -m backend.serve --workers 4 --port 8000
+    python -m backend.serve --memory <parent pid>    # per-worker memory report
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+
+# ---------- MEMORY REPORT ----------
+def smaps_rollup(pid) -> dict:
+    """
+    {field: kB} from /proc/<pid>/smaps_rollup (Rss, Pss, Shared_*, Private_*).
+    """
+    out = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                out[parts[0].rstrip(":")] = int(parts[1])
+    return out
+
+
+def child_pids(pid) -> list[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(p) for p in f.read().split()]
+    except FileNotFoundError:
+        return []
+
+
+def memory_report(pid) -> list[dict]:
+    """
+    One row per process in the tree rooted at `pid`, parent first. Pss splits
+    shared pages between the processes that map them, so the Pss column sums
+    to the real footprint of the whole server.
+    """
+    rows, todo = [], [(pid, "parent")]
+    while todo:
+        p, role = todo.pop(0)
+        try:
+            m = smaps_rollup(p)
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+        shared = m.get("Shared_Clean", 0) + m.get("Shared_Dirty", 0)
+        private = m.get("Private_Clean", 0) + m.get("Private_Dirty", 0)
+        rows.append({
+            "pid": p, "role": role,
+            "rss_mb": m.get("Rss", 0) / 1024, "pss_mb": m.get("Pss", 0) / 1024,
+            "shared_mb": shared / 1024, "private_mb": private / 1024,
+        })
+        todo += [(c, "worker") for c in child_pids(p)]
+    return rows
+
+
+def print_memory_report(pid):
+    rows = memory_report(pid)
+    print(f"{'pid':>7} {'role':<7} {'RSS':>8} {'PSS':>8} {'shared':>8} {'private':>8}")
+    for r in rows:
+        print(
+            f"{r['pid']:>7} {r['role']:<7} {r['rss_mb']:>7.1f}M {r['pss_mb']:>7.1f}M"
+            f" {r['shared_mb']:>7.1f}M {r['private_mb']:>7.1f}M"
+        )
+    print(f"{'total':>15} {sum(r['rss_mb'] for r in rows):>7.1f}M {sum(r['pss_mb'] for r in rows):>7.1f}M")
+
+
+# ---------- PRELOAD ----------
+def preload():
+    """
+    Everything a worker would otherwise build on its first request.
+    """
+    from ai import registry
+    from ai.features import featurize
+    from ai.model import predict_issue
+    from backend.main import app
+    from backend.utils.screening import screen_report
+
+    loaded = registry.warm()
+    title, description = "Pothole on the main road", "Big potholes near the market after rain"
+    features = featurize(title, description)
+    screen_report(title, description, "Road", features=features)
+    if loaded.get("issue") or loaded.get("shared"):
+        predict_issue(title, description, features=features)
+    print("✅ AI models preloaded:", ", ".join(n for n, ok in loaded.items() if ok) or "none")
+    return app
+
+
+# ---------- SUPERVISOR ----------
+def _bind(host, port, backlog=2048) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _spawn(app, sock, args) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    # worker: default signal handling so uvicorn installs its own
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    config = uvicorn.Config(app, log_level=args.log_level, timeout_keep_alive=args.keep_alive)
+    uvicorn.Server(config).run(sockets=[sock])
+    os._exit(0)
+
+
+def serve(args):
+    # models are already in memory; the lifespan warm-up has nothing to do
+    os.environ.setdefault("AI_WARMUP", "lazy")
+    sock = _bind(args.host, args.port)
+    app = preload()
+    gc.collect()
+    gc.freeze()
+
+    workers = {_spawn(app, sock, args) for _ in range(args.workers)}
+    print(f"→ serving on http://{args.host}:{args.port} with {len(workers)} worker(s), parent pid {os.getpid()}")
+
+    stopping = False
+
+    def _stop(signum, _frame):
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        workers.discard(pid)
+        if not stopping:
+            print(f"⚠️ worker {pid} exited ({status}); restarting")
+            time.sleep(0.5)
+            workers.add(_spawn(app, sock, args))
+    sock.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Preload-and-fork server for backend.main:app")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "2")))
+    ap.add_argument("--log-level", default="info")
+    ap.add_argument("--keep-alive", type=int, default=5)
+    ap.add_argument("--memory", type=int, metavar="PID",
+                    help="print the memory report for a running server's parent pid and exit")
+    args = ap.parse_args()
+
+    if args.memory:
+        print_memory_report(args.memory)
+        sys.exit(0)
+    serve(args)
+
+
+if __name__ == "__main__":
+    main()
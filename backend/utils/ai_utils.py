@@ -1,7 +1,82 @@
-from ai.preprocess import build_risk_score
-from ai.model import classify_zone
+import threading
+import time
+
+from ai.risk import build_risk_score, classify_zone, get_engine
+from backend.utils import db_utils
+
+REFRESH_S = 5.0     # top-up with rows other workers inserted
+RESYNC_S = 60.0     # full pass that also picks up edits and deletes made elsewhere
+
+_lock = threading.Lock()
+_loaded = False
+_last_sync = 0.0
+_last_resync = 0.0
+_synced_id = 0   # sync watermark; live inserts don't move it so no id is skipped
+
+
+def _counts_for_risk(status, verdict) -> bool:
+    return (status or "") != "Rejected" and (verdict or "") != "spam"
+
+
+def risk_engine():
+    """
+    Process-wide risk engine, loaded from the issues table on first use and
+    topped up every REFRESH_S with rows other workers inserted (id > last
+    seen). Every RESYNC_S it re-reads the whole table instead, so rejects,
+    spam verdicts, AI severities and deletes made through another worker
+    reach this one too; the on_* hooks only cover this worker's own writes.
+    """
+    global _loaded, _last_sync, _last_resync, _synced_id
+    engine = get_engine()
+    if _loaded and time.monotonic() - _last_sync < REFRESH_S:
+        return engine
+    with _lock:
+        now = time.monotonic()
+        if _loaded and now - _last_sync < REFRESH_S:
+            return engine
+        full = not _loaded or now - _last_resync >= RESYNC_S
+        rows = db_utils.iter_issue_points(
+            after_id=0 if full else _synced_id,
+            extra=("severity", "ai_severity", "timestamp", "status", "ai_veracity"),
+        )
+        known = engine.issue_ids() if full else set()
+        scanned = set()
+        for issue_id, lat, lng, sev, ai_sev, ts, status, verdict in rows:
+            if _counts_for_risk(status, verdict):
+                engine.upsert(issue_id, lat, lng, ai_sev or sev, ts.timestamp() if ts else None)
+            else:
+                engine.remove(issue_id)
+            scanned.add(issue_id)
+            _synced_id = max(_synced_id, issue_id)
+        if full:
+            # indexed before the pass but not read by it: deleted elsewhere
+            for issue_id in known - scanned:
+                if issue_id <= _synced_id:
+                    engine.remove(issue_id)
+            _last_resync = now
+        _loaded = True
+        _last_sync = now
+    return engine
+
+
+def on_issue_added(issue_id, lat, lng, severity=1, verdict=None):
+    if _loaded and _counts_for_risk(None, verdict):
+        get_engine().add(issue_id, lat, lng, severity)
+
+
+def on_issue_severity(issue_id, severity):
+    if _loaded:
+        get_engine().update_severity(issue_id, severity)
+
+
+def on_issues_removed(issue_ids):
+    if _loaded:
+        for issue_id in issue_ids:
+            get_engine().remove(issue_id)
+
 
 def apply_ai_zoning(issue: dict) -> dict:
+    risk_engine()
     score = build_risk_score(issue)
     zone = classify_zone(score)
 
@@ -1,7 +1,17 @@
 # backend/utils/db_utils.py
-import mysql.connector
+import base64
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
+
 import bcrypt
+import mysql.connector
+from sqlalchemy import event
+from sqlalchemy.exc import DisconnectionError, TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
 
 db_config = {
     "host": "localhost",
@@ -10,8 +20,132 @@ db_config = {
     "database": "issue_mapper"
 }
 
+# ---------- CONNECTION POOL ----------
+# Every request used to pay a fresh TCP + auth handshake. Connections are now
+# checked out of one process-wide pool and returned on close().
+pool_config = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+    "recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+}
+
+_pool = None
+_pool_lock = threading.Lock()
+
+_pool_metrics = {
+    "checkouts": 0,
+    "checkout_timeouts": 0,
+    "checkout_wait_total_ms": 0.0,
+    "checkout_wait_max_ms": 0.0,
+    "connects": 0,
+    "invalidated": 0,
+}
+_metrics_lock = threading.Lock()
+
+
+def _connect():
+    conn = mysql.connector.connect(**db_config)
+    with _metrics_lock:
+        _pool_metrics["connects"] += 1
+    return conn
+
+
+def _ping_on_checkout(dbapi_conn, conn_record, conn_proxy):
+    """
+    Pessimistic disconnect handling: a stale connection raises
+    DisconnectionError so the pool retries with a fresh one.
+    """
+    try:
+        dbapi_conn.ping(reconnect=False)
+    except mysql.connector.Error as e:
+        with _metrics_lock:
+            _pool_metrics["invalidated"] += 1
+        raise DisconnectionError() from e
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = QueuePool(
+                    _connect,
+                    pool_size=pool_config["pool_size"],
+                    max_overflow=pool_config["max_overflow"],
+                    timeout=pool_config["timeout"],
+                    recycle=pool_config["recycle"],
+                )
+                if pool_config["pre_ping"]:
+                    event.listen(pool, "checkout", _ping_on_checkout)
+                _pool = pool
+    return _pool
+
+
 def get_connection():
-    return mysql.connector.connect(**db_config)
+    """
+    Returns a pooled connection. close() hands it back to the pool.
+    Prefer db_connection()/db_cursor() so it is always returned.
+    """
+    pool = get_pool()
+    start = time.perf_counter()
+    try:
+        conn = pool.connect()
+    except PoolTimeoutError:
+        with _metrics_lock:
+            _pool_metrics["checkout_timeouts"] += 1
+        raise
+    wait_ms = (time.perf_counter() - start) * 1000.0
+    with _metrics_lock:
+        _pool_metrics["checkouts"] += 1
+        _pool_metrics["checkout_wait_total_ms"] += wait_ms
+        _pool_metrics["checkout_wait_max_ms"] = max(_pool_metrics["checkout_wait_max_ms"], wait_ms)
+    return conn
+
+
+@contextmanager
+def db_connection():
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@contextmanager
+def db_cursor(dictionary: bool = False, commit: bool = False):
+    """
+    with db_cursor(dictionary=True) as cur: ...
+    commit=True commits when the block exits cleanly; on error the pool
+    rolls the connection back when it is returned.
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor(dictionary=dictionary)
+        try:
+            yield cursor
+            if commit:
+                conn.commit()
+        finally:
+            cursor.close()
+
+
+def pool_stats() -> dict:
+    pool = get_pool()
+    with _metrics_lock:
+        metrics = dict(_pool_metrics)
+    checkouts = metrics["checkouts"]
+    metrics["checkout_wait_avg_ms"] = (
+        metrics["checkout_wait_total_ms"] / checkouts if checkouts else 0.0
+    )
+    return {
+        "config": dict(pool_config),
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "metrics": metrics,
+    }
 
 # ---------- PASSWORD UTILS ----------
 def hash_password(password: str) -> str:
@@ -23,35 +157,28 @@ def verify_password(password: str, hashed: str) -> bool:
 # ---------- USER AUTH ----------
 def set_user_password(user_id: int, password: str):
     hashed = hash_password(password)
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        REPLACE INTO user_auth (user_id, password_hash, created_at)
-        VALUES (%s, %s, %s)
-        """,
-        (user_id, hashed, datetime.now())
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor(commit=True) as cursor:
+        cursor.execute(
+            """
+            REPLACE INTO user_auth (user_id, password_hash, created_at)
+            VALUES (%s, %s, %s)
+            """,
+            (user_id, hashed, datetime.now())
+        )
 
 def verify_user_password(mobile_or_email: str, password: str) -> dict | None:
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute(
-        """
-        SELECT u.id, u.name, u.email, u.mobile, a.password_hash
-        FROM users u
-        JOIN user_auth a ON u.id = a.user_id
-        WHERE u.mobile=%s OR u.email=%s
-        LIMIT 1
-        """,
-        (mobile_or_email, mobile_or_email)
-    )
-    user = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute(
+            """
+            SELECT u.id, u.name, u.email, u.mobile, a.password_hash
+            FROM users u
+            JOIN user_auth a ON u.id = a.user_id
+            WHERE u.mobile=%s OR u.email=%s
+            LIMIT 1
+            """,
+            (mobile_or_email, mobile_or_email)
+        )
+        user = cursor.fetchone()
 
     if user and verify_password(password, user["password_hash"]):
         return {
@@ -63,190 +190,609 @@ def verify_user_password(mobile_or_email: str, password: str) -> dict | None:
     return None
 
 def delete_user(user_id: int):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM user_auth WHERE user_id=%s", (user_id,))
-    cursor.execute("DELETE FROM issues WHERE user_id=%s", (user_id,))
-    cursor.execute("DELETE FROM users WHERE id=%s", (user_id,))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor(commit=True) as cursor:
+        cursor.execute("DELETE FROM user_auth WHERE user_id=%s", (user_id,))
+        cursor.execute("DELETE FROM issue_lsh_bands WHERE issue_id IN (SELECT issue_id FROM issue_signatures WHERE user_id=%s)", (user_id,))
+        cursor.execute("DELETE FROM issue_signatures WHERE user_id=%s", (user_id,))
+        cursor.execute("DELETE FROM issues WHERE user_id=%s", (user_id,))
+        cursor.execute("DELETE FROM users WHERE id=%s", (user_id,))
 
 def get_user_by_id(user_id: int) -> dict | None:
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT id, name, email, mobile FROM users WHERE id=%s", (user_id,))
-    user = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    return user
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute("SELECT id, name, email, mobile FROM users WHERE id=%s", (user_id,))
+        return cursor.fetchone()
 
 # ---------- ISSUES ----------
-def fetch_issues(user_id=None):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
 
-    if user_id:
-        cursor.execute("SELECT * FROM issues WHERE user_id=%s ORDER BY timestamp DESC", (user_id,))
+# Public issue fields -> how a raw column value is normalised for the API.
+ISSUE_FIELDS = {
+    "id": lambda v: v,
+    "title": lambda v: v,
+    "description": lambda v: v or "",
+    "category": lambda v: v or "",
+    "latitude": lambda v: v,
+    "longitude": lambda v: v,
+    "address": lambda v: v or "",
+    "severity": lambda v: v or 1,
+    "status": lambda v: v or "Pending",
+    "timestamp": lambda v: str(v),
+    "user_id": lambda v: v,
+    "ai_category": lambda v: v or "",
+    "ai_severity": lambda v: v or 1,
+    "assigned_department": lambda v: v or None,
+    "department_id": lambda v: v,
+    "approved_by_admin": lambda v: v or 0,
+    "admin_comment": lambda v: v or "",
+    "ai_veracity": lambda v: v or "unknown",
+    "is_suspicious": lambda v: int(v or 0),
+    "duplicate_of": lambda v: v,
+}
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """
+    "id,title,status" -> ["id", "title", "status"]. None/"" means every field.
+    Raises ValueError on unknown names.
+    """
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in names if f not in ISSUE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {unknown}. Allowed: {list(ISSUE_FIELDS)}")
+    return names
+
+
+def encode_cursor(timestamp, issue_id) -> str:
+    raw = f"{timestamp.isoformat() if hasattr(timestamp, 'isoformat') else timestamp}|{issue_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """
+    Returns (timestamp, id). Raises ValueError on a malformed cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, issue_id = base64.urlsafe_b64decode(padded.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(ts), int(issue_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _issue_row(row: dict, fields) -> dict:
+    return {f: ISSUE_FIELDS[f](row.get(f)) for f in fields}
+
+
+def fetch_issues_page(user_id=None, limit=DEFAULT_PAGE_SIZE, cursor=None, fields=None, where=None, params=()):
+    """
+    Keyset page over issues ordered by (timestamp DESC, id DESC).
+
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    `fields` projects both the SELECT and the returned dicts.
+    `where`/`params` add an extra SQL condition for internal callers.
+    """
+    limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+    if fields:
+        # id + timestamp are always needed to build the next cursor
+        select = ", ".join(dict.fromkeys(["id", "timestamp", *fields]))
     else:
-        cursor.execute("SELECT * FROM issues ORDER BY timestamp DESC")
-
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-
-    data = []
-    for row in rows:
-        data.append({
-            "id": row["id"],
-            "title": row["title"],
-            "description": row.get("description") or "",
-            "category": row.get("category") or "",
-            "latitude": row.get("latitude"),
-            "longitude": row.get("longitude"),
-            "address": row.get("address") or "",
-            "severity": row.get("severity") or 1,
-            "status": row.get("status") or "Pending",
-            "timestamp": str(row.get("timestamp")),
-            "user_id": row.get("user_id"),
-            "ai_category": row.get("ai_category") or "",
-            "ai_severity": row.get("ai_severity") or 1,
-            "assigned_department": row.get("assigned_department") or None,
-            "approved_by_admin": row.get("approved_by_admin") or 0,
-            "admin_comment": row.get("admin_comment") or "",
-            "ai_veracity": row.get("ai_veracity") or "unknown",
-            "is_suspicious": int(row.get("is_suspicious") or 0),
-        })
-
-    return data
+        fields, select = list(ISSUE_FIELDS), "*"
+
+    conditions, values = [], []
+    if user_id:
+        conditions.append("user_id=%s")
+        values.append(user_id)
+    if where:
+        conditions.append(where)
+        values.extend(params)
+    if cursor:
+        ts, last_id = decode_cursor(cursor)
+        conditions.append("(timestamp < %s OR (timestamp = %s AND id < %s))")
+        values.extend([ts, ts, last_id])
+
+    query = f"SELECT {select} FROM issues"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY timestamp DESC, id DESC LIMIT %s"
+    values.append(limit + 1)
+
+    with db_cursor(dictionary=True) as cur:
+        cur.execute(query, tuple(values))
+        rows = cur.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["timestamp"], last["id"])
+
+    return [_issue_row(r, fields) for r in rows], next_cursor
+
+
+def fetch_issues(user_id=None):
+    """
+    Full listing, kept for offline scripts. API routes use fetch_issues_page.
+    """
+    with db_cursor(dictionary=True) as cursor:
+        if user_id:
+            cursor.execute("SELECT * FROM issues WHERE user_id=%s ORDER BY timestamp DESC, id DESC", (user_id,))
+        else:
+            cursor.execute("SELECT * FROM issues ORDER BY timestamp DESC, id DESC")
+        rows = cursor.fetchall()
+
+    return [_issue_row(row, ISSUE_FIELDS) for row in rows]
 
 def get_issue_by_id(issue_id):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
     query = """
         SELECT i.*, u.name as user_name, u.mobile as user_mobile, u.email as user_email 
         FROM issues i 
         LEFT JOIN users u ON i.user_id = u.id 
         WHERE i.id=%s
     """
-    cursor.execute(query, (issue_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    return row
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute(query, (issue_id,))
+        return cursor.fetchone()
 
 def add_issue(
     title, category, description, latitude, longitude, user_id,
     severity=1, status="Pending", ai_category=None, ai_severity=None,
-    ai_veracity=None, is_suspicious=0
+    ai_veracity=None, is_suspicious=0, duplicate_of=None, signature=None, screen_lease_until=None
 ):
-    conn = get_connection()
-    cursor = conn.cursor()
+    """
+    `signature`: (text_hash, signature_bytes, band_keys) from dedupe, stored
+    with the row in the same transaction so no committed issue lacks one.
+    `screen_lease_until`: the inserting worker's claim on a "pending" row it
+    scores itself (see claim_pending_screening).
+    """
     query = """
         INSERT INTO issues
         (title, description, category, latitude, longitude, severity, status, timestamp, user_id,
-         ai_category, ai_severity, ai_veracity, is_suspicious)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-    cursor.execute(query, (
-        title, description, category, latitude, longitude,
-        severity, status, datetime.now(), user_id,
-        ai_category, ai_severity, ai_veracity, int(is_suspicious or 0)
-    ))
-    conn.commit()
-    issue_id = cursor.lastrowid
-    cursor.close()
-    conn.close()
-    return issue_id
+         ai_category, ai_severity, ai_veracity, is_suspicious, duplicate_of, screen_lease_until)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """
+    with db_cursor(commit=True) as cursor:
+        cursor.execute(query, (
+            title, description, category, latitude, longitude,
+            severity, status, datetime.now(), user_id,
+            ai_category, ai_severity, ai_veracity, int(is_suspicious or 0), duplicate_of, screen_lease_until
+        ))
+        issue_id = cursor.lastrowid
+        if signature is not None:
+            add_issue_signatures([(issue_id, user_id, *signature)], cursor)
+        return issue_id
 
 def update_ai_fields(issue_id, ai_category, ai_severity):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE issues SET ai_category=%s, ai_severity=%s WHERE id=%s",
-        (ai_category, ai_severity, issue_id)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor(commit=True) as cursor:
+        cursor.execute(
+            "UPDATE issues SET ai_category=%s, ai_severity=%s WHERE id=%s",
+            (ai_category, ai_severity, issue_id)
+        )
 
-def fetch_nearby_issues(lat, lng, radius_km=0.5):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    offset = (radius_km / 111.0) * 1.5
-    cursor.execute(
-        """
-        SELECT id, title, timestamp, category FROM issues 
-        WHERE latitude BETWEEN %s AND %s 
-        AND longitude BETWEEN %s AND %s
-        ORDER BY timestamp DESC
-        LIMIT 5
-        """,
-        (lat - offset, lat + offset, lng - offset, lng + offset)
-    )
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return rows
+def update_ai_fields_many(rows, job=None, last_id=None):
+    """
+    rows: [(ai_category, ai_severity, issue_id)], one executemany round-trip.
+    With `job`, its watermark moves to `last_id` in the same transaction.
+    """
+    if not rows and job is None:
+        return
+    with db_cursor(commit=True) as cursor:
+        if rows:
+            cursor.executemany("UPDATE issues SET ai_category=%s, ai_severity=%s WHERE id=%s", rows)
+        if job is not None:
+            set_watermark(job, last_id, cursor)
+
+def update_screening_many(rows):
+    """
+    rows: [(ai_veracity, is_suspicious, ai_category, ai_severity, issue_id)]
+    from the inference queue, one executemany round-trip.
+    """
+    if not rows:
+        return
+    with db_cursor(commit=True) as cursor:
+        cursor.executemany(
+            """
+            UPDATE issues
+            SET ai_veracity=%s, is_suspicious=%s,
+                ai_category=COALESCE(%s, ai_category), ai_severity=COALESCE(%s, ai_severity)
+            WHERE id=%s
+            """,
+            rows
+        )
+
+def claim_pending_screening(token, lease_until, now, marker="pending", limit=1000):
+    """
+    Claims up to `limit` submissions still waiting for scoring whose lease is
+    unset or expired before `now`, until `lease_until`, and returns
+    (id, title, description, category) of the rows this call got. The UPDATE
+    re-checks the lease, so workers sweeping at once never share a row.
+    """
+    with db_cursor(commit=True) as cursor:
+        cursor.execute(
+            """
+            SELECT id FROM issues
+            WHERE ai_veracity=%s AND (screen_lease_until IS NULL OR screen_lease_until < %s)
+            ORDER BY id LIMIT %s
+            """,
+            (marker, now, limit)
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(
+            f"""
+            UPDATE issues SET screen_claim=%s, screen_lease_until=%s
+            WHERE id IN ({placeholders}) AND ai_veracity=%s
+              AND (screen_lease_until IS NULL OR screen_lease_until < %s)
+            """,
+            (token, lease_until, *ids, marker, now)
+        )
+        cursor.execute(
+            f"""
+            SELECT id, title, description, category FROM issues
+            WHERE id IN ({placeholders}) AND screen_claim=%s ORDER BY id
+            """,
+            (*ids, token)
+        )
+        return cursor.fetchall()
+
+def release_screening(issue_ids, marker="pending"):
+    """
+    Drops the lease on rows still waiting for scoring, so the next sweep (any
+    worker) takes them at once instead of after the lease runs out.
+    """
+    if not issue_ids:
+        return
+    placeholders = ", ".join(["%s"] * len(issue_ids))
+    with db_cursor(commit=True) as cursor:
+        cursor.execute(
+            f"""
+            UPDATE issues SET screen_claim=NULL, screen_lease_until=NULL
+            WHERE id IN ({placeholders}) AND ai_veracity=%s
+            """,
+            (*issue_ids, marker)
+        )
+
+def iter_unpredicted_issues(after_id=0, chunk=1000):
+    """
+    Yields lists of (id, title, description) with no ai_category yet, id > after_id.
+    """
+    last_id = after_id
+    while True:
+        with db_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT id, title, description FROM issues
+                WHERE id > %s AND ai_category IS NULL
+                ORDER BY id LIMIT %s
+                """,
+                (last_id, chunk)
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+        if len(rows) < chunk:
+            return
+
+def update_admin_decision(issue_id, approved_by_admin, assigned_department, department_id, admin_comment, status,
+                          label=None):
+    """
+    label: 0 (approved) / 1 (rejected) when the admin decided the report in
+    this update; appended to admin_decisions in the same transaction.
+    """
+    with db_cursor(commit=True) as cursor:
+        cursor.execute("""
+            UPDATE issues
+            SET
+                approved_by_admin=%s,
+                assigned_department=%s,
+                department_id=%s,
+                admin_comment=%s,
+                status=%s
+            WHERE id=%s
+        """, (approved_by_admin, assigned_department, department_id, admin_comment, status, issue_id))
+        if label is not None:
+            cursor.execute(
+                "INSERT INTO admin_decisions (issue_id, label, decided_at) VALUES (%s, %s, %s)",
+                (issue_id, label, datetime.now())
+            )
+
+def iter_admin_decisions(after_id=0, chunk=1000):
+    """
+    Yields lists of (decision_id, title, description, label) for decisions
+    logged after `after_id`, in log order, one chunk per round-trip. Decisions
+    on issues deleted since are skipped.
+    """
+    last_id = after_id
+    while True:
+        with db_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT d.id, i.title, i.description, d.label
+                FROM admin_decisions d JOIN issues i ON i.id = d.issue_id
+                WHERE d.id > %s ORDER BY d.id LIMIT %s
+                """,
+                (last_id, chunk)
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+        if len(rows) < chunk:
+            return
+
+def iter_issue_points(after_id=0, chunk=5000, extra=()):
+    """
+    Yields (id, latitude, longitude, *extra) for every issue with id > after_id,
+    in id order, one chunk per round-trip. Feeds the in-process spatial index
+    and risk engine.
+    """
+    columns = ", ".join(["id", "latitude", "longitude", *extra])
+    last_id = after_id
+    while True:
+        with db_cursor() as cursor:
+            cursor.execute(
+                f"SELECT {columns} FROM issues WHERE id > %s ORDER BY id LIMIT %s",
+                (last_id, chunk)
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1][0]
+        if len(rows) < chunk:
+            return
+
+def fetch_issues_by_ids(issue_ids, fields=None):
+    """
+    Projected rows for the given ids (unordered). Missing ids are skipped.
+    """
+    if not issue_ids:
+        return []
+    fields = list(fields or ISSUE_FIELDS)
+    select = ", ".join(dict.fromkeys(["id", *fields]))
+    placeholders = ", ".join(["%s"] * len(issue_ids))
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute(f"SELECT {select} FROM issues WHERE id IN ({placeholders})", tuple(issue_ids))
+        rows = cursor.fetchall()
+    return [_issue_row(r, fields) for r in rows]
+
+def fetch_heat_points(south, west, north, east, categories=None, statuses=None, since=None):
+    """
+    (latitude, longitude, weight) tuples inside the bbox for the heatmap.
+    weight prefers ai_severity over the reporter's severity.
+    """
+    conditions = ["latitude BETWEEN %s AND %s", "longitude BETWEEN %s AND %s"]
+    values = [south, north, west, east]
+    if categories:
+        conditions.append(f"category IN ({', '.join(['%s'] * len(categories))})")
+        values.extend(categories)
+    if statuses:
+        conditions.append(f"status IN ({', '.join(['%s'] * len(statuses))})")
+        values.extend(statuses)
+    if since is not None:
+        conditions.append("timestamp >= %s")
+        values.append(since)
+
+    with db_cursor() as cursor:
+        cursor.execute(
+            "SELECT latitude, longitude, COALESCE(ai_severity, severity, 1) FROM issues WHERE "
+            + " AND ".join(conditions),
+            tuple(values)
+        )
+        return cursor.fetchall()
+
+def iter_issue_texts(after_id=0, chunk=1000):
+    """
+    Yields lists of {id, user_id, title, description, category, latitude,
+    longitude} in id order, one chunk per round-trip.
+    """
+    last_id = after_id
+    while True:
+        with db_cursor(dictionary=True) as cursor:
+            cursor.execute(
+                """
+                SELECT id, user_id, title, description, category, latitude, longitude
+                FROM issues WHERE id > %s ORDER BY id LIMIT %s
+                """,
+                (last_id, chunk)
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1]["id"]
+        if len(rows) < chunk:
+            return
+
+def delete_issues(issue_ids):
+    if not issue_ids:
+        return
+    placeholders = ", ".join(["%s"] * len(issue_ids))
+    with db_cursor(commit=True) as cursor:
+        for table, column in (("issue_lsh_bands", "issue_id"), ("issue_signatures", "issue_id"), ("issues", "id")):
+            cursor.execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", tuple(issue_ids))
 
 def update_issue_status(issue_id, status):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE issues SET status=%s WHERE id=%s", (status, issue_id))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor(commit=True) as cursor:
+        cursor.execute("UPDATE issues SET status=%s WHERE id=%s", (status, issue_id))
+
+# ---------- JOB WATERMARKS ----------
+def get_watermark(job: str) -> int:
+    with db_cursor() as cursor:
+        cursor.execute("SELECT last_id FROM job_watermarks WHERE job=%s", (job,))
+        row = cursor.fetchone()
+    return row[0] if row else 0
+
+def set_watermark(job: str, last_id: int, cursor=None):
+    """
+    Pass `cursor` to commit the watermark with the chunk it covers.
+    """
+    if cursor is None:
+        with db_cursor(commit=True) as cur:
+            return set_watermark(job, last_id, cur)
+    cursor.execute("SELECT 1 FROM job_watermarks WHERE job=%s", (job,))
+    if cursor.fetchone():
+        cursor.execute("UPDATE job_watermarks SET last_id=%s, updated_at=%s WHERE job=%s", (last_id, datetime.now(), job))
+    else:
+        cursor.execute(
+            "INSERT INTO job_watermarks (job, last_id, updated_at) VALUES (%s, %s, %s)",
+            (job, last_id, datetime.now())
+        )
+
+# ---------- NEAR-DUPLICATE INDEX ----------
+def add_issue_signatures(rows, cursor=None):
+    """
+    rows: [(issue_id, user_id, text_hash, signature_bytes, band_keys)]
+    Pass `cursor` to commit them with the issue they belong to.
+    """
+    if not rows:
+        return
+    if cursor is None:
+        with db_cursor(commit=True) as cur:
+            return add_issue_signatures(rows, cur)
+    cursor.executemany(
+        "INSERT INTO issue_signatures (issue_id, user_id, text_hash, signature) VALUES (%s, %s, %s, %s)",
+        [(i, u, h, s) for i, u, h, s, _ in rows]
+    )
+    cursor.executemany(
+        "INSERT INTO issue_lsh_bands (band_key, issue_id) VALUES (%s, %s)",
+        [(k, i) for i, _, _, _, keys in rows for k in keys]
+    )
+
+def fetch_signed_ids(issue_ids):
+    if not issue_ids:
+        return set()
+    placeholders = ", ".join(["%s"] * len(issue_ids))
+    with db_cursor() as cursor:
+        cursor.execute(f"SELECT issue_id FROM issue_signatures WHERE issue_id IN ({placeholders})", tuple(issue_ids))
+        return {row[0] for row in cursor.fetchall()}
+
+def fetch_signature_candidates(band_keys, user_id=None, before_id=None, limit=200):
+    """
+    Issues sharing at least one LSH band with the probe, newest first:
+    [{issue_id, user_id, text_hash, signature, category, latitude, longitude}].
+    """
+    if not band_keys:
+        return []
+    placeholders = ", ".join(["%s"] * len(band_keys))
+    conditions, values = [], list(band_keys)
+    if user_id is not None:
+        conditions.append("s.user_id=%s")
+        values.append(user_id)
+    if before_id is not None:
+        conditions.append("s.issue_id < %s")
+        values.append(before_id)
+    values.append(limit)
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute(
+            f"""
+            SELECT s.issue_id, s.user_id, s.text_hash, s.signature, i.category, i.latitude, i.longitude
+            FROM issue_signatures s JOIN issues i ON i.id = s.issue_id
+            WHERE s.issue_id IN (
+                SELECT DISTINCT issue_id FROM issue_lsh_bands WHERE band_key IN ({placeholders})
+            ){"".join(" AND " + c for c in conditions)}
+            ORDER BY s.issue_id DESC LIMIT %s
+            """,
+            tuple(values)
+        )
+        return cursor.fetchall()
 
 # ---------- DEPARTMENTS ----------
+_DEPT_AFFIX_RE = re.compile(r"^(department|dept) of |( (department|dept))$")
+
+
+def normalize_department(name) -> str:
+    """
+    Canonical alias key: "Sanitation Department" / "Dept. of Sanitation" -> "sanitation".
+    """
+    key = " ".join(re.sub(r"[^a-z0-9]+", " ", (name or "").lower()).split())
+    return _DEPT_AFFIX_RE.sub("", key).strip() or key
+
+
+def resolve_department_id(name):
+    """
+    departments.id for an admin-entered department name, or None.
+    Unknown spellings fall back to the old substring match once and are then
+    remembered in department_aliases.
+    """
+    key = normalize_department(name)
+    if not key:
+        return None
+    known = _department_alias(key)
+    if known is not None:
+        return known
+
+    hits = [
+        d["id"] for d in fetch_departments()
+        if key in normalize_department(d["department_name"])
+        or normalize_department(d["department_name"]) in key
+    ]
+    if len(hits) != 1:
+        return None
+    try:
+        with db_cursor(commit=True) as cursor:
+            cursor.execute(
+                "INSERT INTO department_aliases (alias, department_id) VALUES (%s, %s)",
+                (key, hits[0])
+            )
+    except mysql.connector.IntegrityError:
+        # another request remembered the same spelling first
+        return _department_alias(key)
+    return hits[0]
+
+def _department_alias(key):
+    with db_cursor() as cursor:
+        cursor.execute("SELECT department_id FROM department_aliases WHERE alias=%s", (key,))
+        row = cursor.fetchone()
+    return row[0] if row else None
+
 def get_department_by_username(username):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM departments WHERE username=%s", (username,))
-    dept = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    return dept
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute("SELECT * FROM departments WHERE username=%s", (username,))
+        return cursor.fetchone()
+
+def fetch_departments():
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute("SELECT * FROM departments")
+        return cursor.fetchall()
 
 def add_department(department_name, username, password_hash):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO departments (department_name, username, password_hash, created_at) VALUES (%s,%s,%s,%s)",
-        (department_name, username, password_hash, datetime.now())
-    )
-    conn.commit()
-    dept_id = cursor.lastrowid
-    cursor.close()
-    conn.close()
-    return dept_id
+    with db_cursor(commit=True) as cursor:
+        cursor.execute(
+            "INSERT INTO departments (department_name, username, password_hash, created_at) VALUES (%s,%s,%s,%s)",
+            (department_name, username, password_hash, datetime.now())
+        )
+        dept_id = cursor.lastrowid
+        alias = normalize_department(department_name)
+        cursor.execute("SELECT 1 FROM department_aliases WHERE alias=%s", (alias,))
+        if not cursor.fetchone():
+            cursor.execute(
+                "INSERT INTO department_aliases (alias, department_id) VALUES (%s, %s)",
+                (alias, dept_id)
+            )
+        return dept_id
 
 def update_department_password(dept_id, new_password_hash):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE departments SET password_hash=%s WHERE id=%s", (new_password_hash, dept_id))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with db_cursor(commit=True) as cursor:
+        cursor.execute("UPDATE departments SET password_hash=%s WHERE id=%s", (new_password_hash, dept_id))
 
 # ---------- ADMINS ----------
 def get_admin_by_username(username):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM admins WHERE username=%s", (username,))
-    admin = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    return admin
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute("SELECT * FROM admins WHERE username=%s", (username,))
+        return cursor.fetchone()
 
 def add_admin(username, password_hash, email=None):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO admins (username, password_hash, email, created_at) VALUES (%s,%s,%s,%s)",
-        (username, password_hash, email, datetime.now())
-    )
-    conn.commit()
-    admin_id = cursor.lastrowid
-    cursor.close()
-    conn.close()
-    return admin_id
+    with db_cursor(commit=True) as cursor:
+        cursor.execute(
+            "INSERT INTO admins (username, password_hash, email, created_at) VALUES (%s,%s,%s,%s)",
+            (username, password_hash, email, datetime.now())
+        )
+        return cursor.lastrowid
@@ -0,0 +1,158 @@
+# backend/utils/dedupe.py
+"""
+Near-duplicate detection for issue reports.
+
+Each issue gets a normalised-text hash (exact repeats) and a MinHash signature
+over character shingles of its title + description. The signature is split
+into LSH bands; every band is stored as one hashed key in issue_lsh_bands, so
+finding candidates is an indexed IN (...) lookup whose cost depends on the
+bucket sizes, not on the size of the issues table. Candidates are confirmed by
+the estimated Jaccard similarity of their signatures.
+
+With NUM_PERM=64 split into 16 bands of 4 rows, a pair with similarity s
+becomes a candidate with probability 1 - (1 - s^4)^16: ~99.6% at s=0.8,
+~4% at s=0.3.
+"""
+import hashlib
+import os
+import re
+import zlib
+
+import numpy as np
+
+from backend.utils import db_utils
+from backend.utils.spatial import haversine_km
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE = 5
+
+# submit-time flag: same reporter anywhere, or anyone within DUP_RADIUS_KM
+DUP_THRESHOLD = float(os.getenv("DEDUPE_THRESHOLD", "0.8"))
+DUP_RADIUS_KM = float(os.getenv("DEDUPE_RADIUS_KM", "0.5"))
+# batch cleanup only deletes the same reporter's near-identical re-submits
+CLEANUP_THRESHOLD = float(os.getenv("DEDUPE_CLEANUP_THRESHOLD", "0.9"))
+
+_PRIME = np.uint64(4294967311)   # smallest prime > 2^32
+_rng = np.random.default_rng(0x1D0C)
+_A = _rng.integers(1, 2 ** 31, NUM_PERM, dtype=np.uint64)   # a * x stays < 2^63
+_B = _rng.integers(0, 2 ** 32, NUM_PERM, dtype=np.uint64)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+# ---------- SIGNATURES ----------
+def normalize_text(title, description) -> str:
+    return " ".join(_TOKEN_RE.findall(f"{title or ''} {description or ''}".lower()))
+
+
+def text_hash(normalized: str) -> str:
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+
+def _shingles(normalized: str) -> np.ndarray:
+    if len(normalized) <= SHINGLE:
+        grams = {normalized}
+    else:
+        grams = {normalized[i:i + SHINGLE] for i in range(len(normalized) - SHINGLE + 1)}
+    return np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash(normalized: str) -> np.ndarray:
+    x = _shingles(normalized)
+    return ((_A[:, None] * x[None, :] + _B[:, None]) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+def band_keys(sig: np.ndarray) -> list[int]:
+    keys = []
+    for b in range(BANDS):
+        digest = hashlib.blake2b(
+            bytes([b]) + sig[b * ROWS:(b + 1) * ROWS].tobytes(), digest_size=8
+        ).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+def signature(title, description) -> dict:
+    normalized = normalize_text(title, description)
+    sig = minhash(normalized)
+    return {"text_hash": text_hash(normalized), "minhash": sig, "band_keys": band_keys(sig)}
+
+
+def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """
+    Estimated Jaccard similarity of the two shingle sets.
+    """
+    return float(np.mean(sig_a == sig_b))
+
+
+def _score(sig, candidate) -> float:
+    if candidate["text_hash"] == sig["text_hash"]:
+        return 1.0
+    return similarity(sig["minhash"], np.frombuffer(bytes(candidate["signature"]), dtype=np.uint32))
+
+
+# ---------- SUBMIT TIME ----------
+def find_duplicate(sig, user_id, latitude, longitude):
+    """
+    (issue_id, similarity) of the most similar earlier report by the same
+    user, or by anyone within DUP_RADIUS_KM, or None.
+    """
+    best = None
+    for cand in db_utils.fetch_signature_candidates(sig["band_keys"]):
+        same_user = user_id is not None and cand["user_id"] == user_id
+        if not same_user:
+            if None in (latitude, longitude, cand["latitude"], cand["longitude"]):
+                continue
+            if haversine_km(latitude, longitude, cand["latitude"], cand["longitude"]) > DUP_RADIUS_KM:
+                continue
+        score = _score(sig, cand)
+        if score >= DUP_THRESHOLD and (best is None or score > best[1]):
+            best = (cand["issue_id"], score)
+    return best
+
+
+def stored_signature(sig) -> tuple:
+    """
+    (text_hash, signature_bytes, band_keys) as db_utils.add_issue(signature=) takes it.
+    """
+    return sig["text_hash"], sig["minhash"].tobytes(), sig["band_keys"]
+
+
+# ---------- BATCH CLEANUP ----------
+def scan_duplicates(chunk=1000, threshold=CLEANUP_THRESHOLD):
+    """
+    Streams the issues table in id order and yields (duplicate_id, original_id,
+    similarity) for re-submits by the same user in the same category.
+    Issues without a signature yet are indexed on the way, so memory is one
+    chunk plus its candidate rows (and the ids flagged so far, so a duplicate
+    is never kept as another one's original).
+    """
+    flagged = set()
+    for rows in db_utils.iter_issue_texts(chunk=chunk):
+        sigs = [signature(r["title"], r["description"]) for r in rows]
+        signed = db_utils.fetch_signed_ids([r["id"] for r in rows])
+        db_utils.add_issue_signatures([
+            (r["id"], r["user_id"], sig["text_hash"], sig["minhash"].tobytes(), sig["band_keys"])
+            for r, sig in zip(rows, sigs) if r["id"] not in signed
+        ])
+
+        for row, sig in zip(rows, sigs):
+            best = None
+            candidates = db_utils.fetch_signature_candidates(
+                sig["band_keys"], user_id=row["user_id"], before_id=row["id"]
+            )
+            for cand in candidates:
+                if (
+                    cand["issue_id"] in flagged
+                    or cand["user_id"] != row["user_id"]
+                    or (cand["category"] or "") != (row["category"] or "")
+                ):
+                    continue
+                score = _score(sig, cand)
+                if score >= threshold and (best is None or score > best[1]):
+                    best = (cand["issue_id"], score)
+            if best:
+                flagged.add(row["id"])
+                yield row["id"], best[0], best[1]
@@ -0,0 +1,102 @@
+# backend/utils/heatmap.py
+"""
+Server-side heatmap binning for the live map.
+
+The bbox is snapped outward to a zoom-dependent grid (CELL_PX screen pixels
+per cell at that zoom), issues inside it are binned with one weighted
+np.histogram2d, and only non-empty cells are returned. Results are cached per
+(snapped bbox, zoom, filters) so panning within a cell reuses the same entry.
+"""
+import math
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from backend.utils import db_utils
+from backend.utils.cache import TTLCache
+
+CELL_PX = int(os.getenv("HEATMAP_CELL_PX", "16"))
+MIN_ZOOM, MAX_ZOOM = 3, 18
+MAX_CELLS_PER_AXIS = 1024
+
+_cache = TTLCache(
+    max_entries=int(os.getenv("HEATMAP_CACHE_ENTRIES", "256")),
+    ttl_s=float(os.getenv("HEATMAP_CACHE_TTL_S", "30")),
+)
+
+
+def cell_deg(zoom: int) -> float:
+    """
+    Width of one cell in degrees: a 256px web-mercator tile spans 360/2^z.
+    """
+    return 360.0 / (2 ** zoom) / (256 / CELL_PX)
+
+
+def _snap(south, west, north, east, step):
+    return (
+        math.floor(south / step), math.floor(west / step),
+        math.ceil(north / step), math.ceil(east / step),
+    )
+
+
+def _bin(snapped, step, categories, statuses, since_hours):
+    r0, c0, r1, c1 = snapped
+    south, west, north, east = r0 * step, c0 * step, r1 * step, c1 * step
+    since = datetime.now() - timedelta(hours=since_hours) if since_hours else None
+
+    rows = db_utils.fetch_heat_points(south, west, north, east, categories, statuses, since)
+    if not rows:
+        return {"cell_deg": step, "total": 0, "max_weight": 0.0, "cells": []}
+
+    pts = np.asarray(rows, dtype=np.float64)
+    lat_edges = south + step * np.arange(r1 - r0 + 1)
+    lng_edges = west + step * np.arange(c1 - c0 + 1)
+
+    weights, _, _ = np.histogram2d(pts[:, 0], pts[:, 1], bins=[lat_edges, lng_edges], weights=pts[:, 2])
+    counts, _, _ = np.histogram2d(pts[:, 0], pts[:, 1], bins=[lat_edges, lng_edges])
+
+    ri, ci = np.nonzero(counts)
+    cell_w = weights[ri, ci]
+    lat_c = lat_edges[ri] + step / 2.0
+    lng_c = lng_edges[ci] + step / 2.0
+    max_w = float(cell_w.max())
+
+    # log scale so one report still shows next to a dense ward;
+    # all-zero weights would divide 0 by 0, they just get no intensity
+    if max_w > 0:
+        intensity = np.log1p(cell_w) / np.log1p(max_w)
+    else:
+        intensity = np.zeros_like(cell_w)
+
+    # [lat, lng, intensity 0..1, count] per non-empty cell
+    cells = [
+        list(c) for c in zip(
+            np.round(lat_c, 5).tolist(), np.round(lng_c, 5).tolist(),
+            np.round(intensity, 3).tolist(), counts[ri, ci].astype(np.int64).tolist(),
+        )
+    ]
+    return {
+        "cell_deg": step,
+        "total": int(counts.sum()),
+        "max_weight": max_w,
+        "cells": cells,
+    }
+
+
+def heatmap(south, west, north, east, zoom, categories=None, statuses=None, since_hours=None) -> dict:
+    zoom = max(MIN_ZOOM, min(int(zoom), MAX_ZOOM))
+    step = cell_deg(zoom)
+    snapped = _snap(south, west, north, east, step)
+    if (snapped[2] - snapped[0]) > MAX_CELLS_PER_AXIS or (snapped[3] - snapped[1]) > MAX_CELLS_PER_AXIS:
+        raise ValueError("bbox too large for this zoom level")
+
+    categories = tuple(sorted(categories or ()))
+    statuses = tuple(sorted(statuses or ()))
+    key = (snapped, zoom, categories, statuses, since_hours)
+    result = _cache.get_or_set(key, lambda: _bin(snapped, step, categories, statuses, since_hours))
+    return {"zoom": zoom, **result}
+
+
+def cache_stats() -> dict:
+    return _cache.stats()
@@ -0,0 +1,283 @@
+# backend/utils/inference_queue.py
+"""
+Background micro-batching for submission scoring.
+
+Ingest stores the row with ai_veracity="pending" and enqueues it here; the
+HTTP response goes out as soon as the INSERT commits. One worker task takes
+the first waiting job, keeps collecting until BATCH_MAX jobs or BATCH_WAIT_MS
+have passed, then scores the whole batch with one vectorized call per model
+(screening + category/severity, cache misses only, see prediction_cache.py)
+and writes it back with one executemany.
+
+Every "pending" row is leased by one worker (issues.screen_claim /
+screen_lease_until, migration 0007): ingest inserts it already leased to the
+worker that enqueues it, and a periodic sweep (every SWEEP_S, and at start())
+claims pending rows whose lease has run out: left by a worker that crashed,
+stopped or gave up on them. Under backend/serve.py no two workers load the
+same row, and a restarted worker leaves its siblings' queued rows alone.
+LEASE_S must outlast the longest queue wait, or a sibling scores the row too.
+
+A failed batch is retried up to MAX_RETRIES times with exponential backoff;
+after that its rows wait for their lease to expire and the next sweep.
+"""
+import asyncio
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from backend.utils import ai_utils, db_utils, prediction_cache
+
+BATCH_MAX = int(os.getenv("INFER_BATCH_MAX", "64"))
+BATCH_WAIT_MS = float(os.getenv("INFER_BATCH_WAIT_MS", "5"))
+QUEUE_MAX = int(os.getenv("INFER_QUEUE_MAX", "10000"))
+LEASE_S = float(os.getenv("INFER_LEASE_S", "300"))
+SWEEP_S = float(os.getenv("INFER_SWEEP_S", "60"))
+MAX_RETRIES = int(os.getenv("INFER_MAX_RETRIES", "3"))
+RETRY_BASE_S = float(os.getenv("INFER_RETRY_BASE_S", "1"))
+
+PENDING = "pending"
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="infer-batch")
+_queue: asyncio.Queue | None = None
+_worker: asyncio.Task | None = None
+_sweeper: asyncio.Task | None = None
+_retrying: set[asyncio.Task] = set()
+_inflight: set[int] = set()      # issue ids queued or waiting for a retry here
+
+_metrics = {
+    "enqueued": 0,
+    "scored": 0,
+    "failed": 0,
+    "retried": 0,
+    "gave_up": 0,
+    "claimed": 0,              # stale pending rows picked up by the sweep
+    "batches": 0,
+    "max_depth": 0,
+    "max_batch": 0,
+    "batch_ms_total": 0.0,
+    "last_batch_ms": 0.0,
+    "wait_ms_total": 0.0,      # enqueue -> written back
+    "max_wait_ms": 0.0,
+    "batch_sizes": {},         # size bucket -> batches
+}
+
+
+def running() -> bool:
+    return _worker is not None and not _worker.done()
+
+
+def lease_until() -> datetime:
+    """
+    Lease for a row this worker is about to enqueue.
+    """
+    return datetime.now() + timedelta(seconds=LEASE_S)
+
+
+async def enqueue(issue_id, title, description, category):
+    _inflight.add(issue_id)
+    await _queue.put((issue_id, title, description, category, time.perf_counter(), 0))
+    _metrics["enqueued"] += 1
+    _metrics["max_depth"] = max(_metrics["max_depth"], _queue.qsize())
+
+
+# ---------- SCORING ----------
+def score_batch(jobs) -> list[tuple]:
+    """
+    jobs: [(issue_id, title, description, category, ...)] ->
+    [(issue_id, screen dict, ai_category, ai_severity)]
+    """
+    items = [(j[1], j[2], j[3]) for j in jobs]
+    try:
+        scored = prediction_cache.score_reports(items)
+    except FileNotFoundError:
+        # category/severity models not trained: screen only
+        scored = [(screen, (None, None, 0.0)) for screen, _ in prediction_cache.score_reports(items, issue=False)]
+    return [
+        (job[0], screen, cat, sev)
+        for job, (screen, (cat, sev, _)) in zip(jobs, scored)
+    ]
+
+
+def _score_and_store(jobs):
+    results = score_batch(jobs)
+    db_utils.update_screening_many([
+        (screen["ai_veracity"], screen["is_suspicious"], cat, sev, issue_id)
+        for issue_id, screen, cat, sev in results
+    ])
+    return results
+
+
+def _bucket(n: int) -> str:
+    for edge in (1, 2, 4, 8, 16, 32, 64, 128):
+        if n <= edge:
+            return f"<={edge}"
+    return ">128"
+
+
+# ---------- WORKER ----------
+async def _collect():
+    jobs = [await _queue.get()]
+    deadline = time.perf_counter() + BATCH_WAIT_MS / 1000.0
+    while len(jobs) < BATCH_MAX:
+        timeout = deadline - time.perf_counter()
+        if timeout <= 0:
+            break
+        try:
+            jobs.append(await asyncio.wait_for(_queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return jobs
+
+
+async def _run():
+    loop = asyncio.get_running_loop()
+    while True:
+        jobs = await _collect()
+        t0 = time.perf_counter()
+        try:
+            results = await loop.run_in_executor(_executor, _score_and_store, jobs)
+        except Exception as e:
+            _metrics["failed"] += len(jobs)
+            print(f"⚠️ inference batch of {len(jobs)} failed: {e!r}")
+            _schedule_retries(jobs)
+            results = []
+        finally:
+            for _ in jobs:
+                _queue.task_done()
+        for issue_id, *_ in results:
+            _inflight.discard(issue_id)
+
+        done = time.perf_counter()
+        for issue_id, screen, _, sev in results:
+            if screen["ai_veracity"] == "spam":
+                ai_utils.on_issues_removed([issue_id])
+            elif sev is not None:
+                ai_utils.on_issue_severity(issue_id, sev)
+
+        batch_ms = (done - t0) * 1000
+        _metrics["scored"] += len(results)
+        _metrics["batches"] += 1
+        _metrics["max_batch"] = max(_metrics["max_batch"], len(jobs))
+        _metrics["batch_ms_total"] += batch_ms
+        _metrics["last_batch_ms"] = batch_ms
+        for job in jobs:
+            wait_ms = (done - job[4]) * 1000
+            _metrics["wait_ms_total"] += wait_ms
+            _metrics["max_wait_ms"] = max(_metrics["max_wait_ms"], wait_ms)
+        bucket = _bucket(len(jobs))
+        _metrics["batch_sizes"][bucket] = _metrics["batch_sizes"].get(bucket, 0) + 1
+
+
+# ---------- RETRIES / SWEEP ----------
+def _schedule_retries(jobs):
+    for job in jobs:
+        if job[5] >= MAX_RETRIES:
+            # the lease runs out and a sweep (here or in a sibling) takes it again
+            _inflight.discard(job[0])
+            _metrics["gave_up"] += 1
+            continue
+        task = asyncio.create_task(_retry(job))
+        _retrying.add(task)
+        task.add_done_callback(_retrying.discard)
+
+
+async def _retry(job):
+    await asyncio.sleep(RETRY_BASE_S * 2 ** job[5])
+    _metrics["retried"] += 1
+    await _queue.put((*job[:5], job[5] + 1))
+
+
+async def _sweep():
+    loop = asyncio.get_running_loop()
+    now = datetime.now()
+    try:
+        claimed = await loop.run_in_executor(
+            _executor, db_utils.claim_pending_screening,
+            uuid.uuid4().hex, now + timedelta(seconds=LEASE_S), now, PENDING,
+        )
+    except Exception as e:
+        print(f"⚠️ could not claim pending submissions: {e!r}")
+        return
+    # a row still queued here whose lease ran out is re-claimed, not re-queued
+    fresh = [row for row in claimed if row[0] not in _inflight]
+    for row in fresh:
+        await enqueue(*row)
+    _metrics["claimed"] += len(fresh)
+    if fresh:
+        print(f"→ re-queued {len(fresh)} pending submission(s)")
+
+
+async def _sweep_loop():
+    while True:
+        await _sweep()
+        await asyncio.sleep(SWEEP_S)
+
+
+async def start():
+    """
+    Starts the worker on the running loop and the sweep for stale pending rows.
+    """
+    global _queue, _worker, _sweeper
+    if running():
+        return
+    _queue = asyncio.Queue(maxsize=QUEUE_MAX)
+    _worker = asyncio.create_task(_run(), name="inference-queue")
+    # the first sweep's DB round trip doesn't hold up startup
+    _sweeper = asyncio.create_task(_sweep_loop(), name="inference-sweep")
+
+
+async def stop(timeout: float = 10.0):
+    """
+    Drains what's queued (up to `timeout` seconds), stops the worker and
+    releases the leases of the rows it didn't get to.
+    """
+    global _worker, _sweeper
+    if not running():
+        return
+    _sweeper.cancel()
+    try:
+        await asyncio.wait_for(_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        print(f"⚠️ inference queue stopped with {_queue.qsize()} job(s) left pending")
+    for task in (_worker, *_retrying):
+        task.cancel()
+    for task in (_worker, _sweeper, *_retrying):
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    _worker = _sweeper = None
+    # what's left goes back to the pool for the next sweep in any worker
+    leftover = list(_inflight)
+    _inflight.clear()
+    try:
+        await asyncio.get_running_loop().run_in_executor(_executor, db_utils.release_screening, leftover, PENDING)
+    except Exception as e:
+        print(f"⚠️ could not release {len(leftover)} pending submission(s): {e!r}")
+
+
+def stats() -> dict:
+    m = _metrics
+    return {
+        "running": running(),
+        "depth": _queue.qsize() if _queue is not None else 0,
+        "max_depth": m["max_depth"],
+        "enqueued": m["enqueued"],
+        "scored": m["scored"],
+        "failed": m["failed"],
+        "retried": m["retried"],
+        "gave_up": m["gave_up"],
+        "claimed": m["claimed"],
+        "batches": m["batches"],
+        "mean_batch": round((m["scored"] + m["failed"]) / m["batches"], 2) if m["batches"] else 0.0,
+        "max_batch": m["max_batch"],
+        "batch_sizes": dict(m["batch_sizes"]),
+        "mean_batch_ms": round(m["batch_ms_total"] / m["batches"], 3) if m["batches"] else 0.0,
+        "last_batch_ms": round(m["last_batch_ms"], 3),
+        "mean_wait_ms": round(m["wait_ms_total"] / (m["scored"] + m["failed"]), 3) if m["batches"] else 0.0,
+        "max_wait_ms": round(m["max_wait_ms"], 3),
+        "batch_max": BATCH_MAX,
+        "batch_wait_ms": BATCH_WAIT_MS,
+    }
@@ -0,0 +1,92 @@
+# backend/utils/ingest.py
+"""
+Non-blocking issue ingestion shared by POST /api/issues/ and POST /api/submit.
+
+Model inference and the MySQL insert are both blocking calls, so they run on
+bounded thread pools instead of the event loop. An admission semaphore caps
+how many submissions can be in flight per worker, so a burst queues up in
+front of the pools instead of growing their work queues without limit.
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from backend.utils import ai_utils
+from backend.utils import db_utils
+from backend.utils import dedupe
+from backend.utils import inference_queue
+from backend.utils import prediction_cache
+from backend.utils import spatial
+
+INFER_WORKERS = int(os.getenv("INGEST_INFER_WORKERS", "4"))
+DB_WORKERS = int(os.getenv("INGEST_DB_WORKERS", str(db_utils.pool_config["pool_size"])))
+MAX_IN_FLIGHT = int(os.getenv("INGEST_MAX_IN_FLIGHT", "64"))
+
+_infer_executor = ThreadPoolExecutor(max_workers=INFER_WORKERS, thread_name_prefix="ingest-infer")
+_db_executor = ThreadPoolExecutor(max_workers=DB_WORKERS, thread_name_prefix="ingest-db")
+_admission = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+
+async def run_inference(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_infer_executor, partial(fn, *args, **kwargs))
+
+
+async def run_db(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, partial(fn, *args, **kwargs))
+
+
+async def ingest_issue(issue) -> dict:
+    """
+    Stores one IssueCreate and returns its id plus any likely duplicate.
+    With the inference queue running the row is saved as "pending" and scored
+    in the background; otherwise it's screened inline before the INSERT.
+    """
+    queued = inference_queue.running()
+    async with _admission:
+        if queued:
+            screen = {"ai_veracity": inference_queue.PENDING, "is_suspicious": 0}
+        else:
+            screen = await run_inference(
+                prediction_cache.screen_report, issue.title, issue.description, issue.category
+            )
+        sig = await run_inference(dedupe.signature, issue.title, issue.description)
+        duplicate = await run_db(
+            dedupe.find_duplicate, sig, issue.user_id, issue.latitude, issue.longitude
+        )
+
+        issue_id = await run_db(
+            db_utils.add_issue,
+            title=issue.title,
+            category=issue.category,
+            description=issue.description,
+            latitude=issue.latitude,
+            longitude=issue.longitude,
+            user_id=issue.user_id,
+            ai_category=None,
+            ai_severity=None,
+            ai_veracity=screen["ai_veracity"],
+            is_suspicious=screen["is_suspicious"],
+            duplicate_of=duplicate[0] if duplicate else None,
+            signature=dedupe.stored_signature(sig),
+            screen_lease_until=inference_queue.lease_until() if queued else None,
+        )
+    spatial.on_issue_added(issue_id, issue.latitude, issue.longitude)
+    ai_utils.on_issue_added(issue_id, issue.latitude, issue.longitude, verdict=screen["ai_veracity"])
+    if queued:
+        await inference_queue.enqueue(issue_id, issue.title, issue.description, issue.category)
+
+    return {
+        "issue_id": issue_id,
+        **screen,
+        "ai_status": "pending" if queued else "done",
+        "duplicate_of": duplicate[0] if duplicate else None,
+        "duplicate_similarity": round(duplicate[1], 2) if duplicate else None,
+    }
+
+
+def shutdown():
+    _infer_executor.shutdown(wait=True)
+    _db_executor.shutdown(wait=True)
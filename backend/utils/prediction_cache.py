@@ -0,0 +1,154 @@
+# backend/utils/prediction_cache.py
+"""
+Memoized screening and category/severity predictions.
+
+Spam floods and client retries send the same title + description over and
+over; every copy used to run the veracity and fraud models and the rule
+checks again. Results are cached in one bounded LRU/TTL cache keyed by a
+hash of the normalized text (case and surrounding whitespace removed from
+each field, since every check lowercases) plus the registry version: the
+category for screening, which the mismatch rules read. On a miss the result
+is computed from the normalized text, so every variant of a key gets the
+same answer whichever arrived first.
+
+When the registry reloads a bundle its version changes: old entries can no
+longer be hit and the cache is cleared on the next lookup.
+
+Used by ingest (create_issue / submit_issue), the inference queue and the
+predict endpoints; counters are served at /health/models.
+"""
+import hashlib
+import os
+import threading
+
+from ai import registry
+from ai.features import featurize_batch, select
+from ai.model import predict_issues_batch as _predict_issues_batch
+from backend.utils import screening
+from backend.utils.cache import TTLCache
+
+MAX_ENTRIES = int(os.getenv("PREDICTION_CACHE_MAX", "10000"))
+TTL_S = float(os.getenv("PREDICTION_CACHE_TTL_S", "3600"))
+
+_cache = TTLCache(max_entries=MAX_ENTRIES, ttl_s=TTL_S)
+_lock = threading.Lock()
+_version = None
+_invalidations = 0
+
+
+def _normalize(text) -> str:
+    return (text or "").strip().lower()
+
+
+def _key(kind, version, title, desc, category=None):
+    h = hashlib.blake2b(digest_size=16)
+    for part in (title, desc, category or ""):
+        h.update(part.encode())
+        h.update(b"\0")
+    return kind, version, h.hexdigest()
+
+
+def _current_version() -> str:
+    global _version, _invalidations
+    version = registry.version(refresh=True)
+    if version != _version:
+        with _lock:
+            if version != _version:
+                if _version is not None:
+                    _cache.clear()
+                    # a first lazy load isn't a swap of served models
+                    if any(v != "0" for v in _version.split(".")):
+                        _invalidations += 1
+                _version = version
+    return version
+
+
+# ---------- LOOKUPS ----------
+def score_reports(items, features=None, issue=True) -> list[tuple]:
+    """
+    [(title, desc, category)] -> [(screen dict, (category, severity, confidence) | None)]
+    Only the misses are vectorized (once, shared by both) and scored in one
+    batch. issue=False skips the category/severity prediction.
+    features: ai.features.featurize_batch() output for the same items
+    Raises FileNotFoundError like predict_issues_batch when issue models are missing.
+    """
+    if not items:
+        return []
+    version = _current_version()
+    norm = [(_normalize(t), _normalize(d), (c or "").strip()) for t, d, c in items]
+    screen_keys = [_key("screen", version, t, d, c) for t, d, c in norm]
+    issue_keys = [_key("issue", version, t, d) for t, d, _ in norm]
+
+    screens = [_cache.get(k) for k in screen_keys]
+    preds = [_cache.get(k) for k in issue_keys] if issue else [None] * len(items)
+
+    need = [i for i in range(len(items)) if screens[i] is None or (issue and preds[i] is None)]
+    if need:
+        if features is not None:
+            sub = select(features, need)
+        else:
+            try:
+                sub = featurize_batch([norm[i][:2] for i in need])
+            except Exception:
+                sub = None
+        pos = {i: k for k, i in enumerate(need)}
+
+        todo = [i for i in need if screens[i] is None]
+        if todo:
+            fresh = screening.screen_reports(
+                [norm[i] for i in todo], features=select(sub, [pos[i] for i in todo])
+            )
+            for i, screen in zip(todo, fresh):
+                screens[i] = screen
+                _cache.set(screen_keys[i], screen)
+
+        todo = [i for i in need if issue and preds[i] is None]
+        if todo:
+            fresh = _predict_issues_batch(
+                [norm[i][:2] for i in todo], features=select(sub, [pos[i] for i in todo])
+            )
+            for i, pred in zip(todo, fresh):
+                preds[i] = pred
+                _cache.set(issue_keys[i], pred)
+
+    # callers merge the screen dict into responses; hand out copies
+    return [(dict(s), p) for s, p in zip(screens, preds)]
+
+
+def screen_report(title, desc, category, features=None) -> dict:
+    return score_reports([(title, desc, category)], features, issue=False)[0][0]
+
+
+def predict_issues_batch(pairs, features=None) -> list[tuple]:
+    """
+    ai.model.predict_issues_batch with the issue cache.
+    """
+    if not pairs:
+        return []
+    version = _current_version()
+    norm = [(_normalize(t), _normalize(d)) for t, d in pairs]
+    keys = [_key("issue", version, t, d) for t, d in norm]
+    preds = [_cache.get(k) for k in keys]
+    todo = [i for i, p in enumerate(preds) if p is None]
+    if todo:
+        fresh = _predict_issues_batch([norm[i] for i in todo], features=select(features, todo))
+        for i, pred in zip(todo, fresh):
+            preds[i] = pred
+            _cache.set(keys[i], pred)
+    return preds
+
+
+def predict_issue(title, desc):
+    """
+    (category, severity) like ai.model.predict_issue, through the cache.
+    """
+    category, severity, _ = predict_issues_batch([(title, desc)])[0]
+    return category, severity
+
+
+def stats() -> dict:
+    return {**_cache.stats(), "version": _version, "invalidations": _invalidations}
+
+
+def clear():
+    _cache.clear()
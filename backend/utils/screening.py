@@ -0,0 +1,292 @@
+# backend/utils/screening.py
+"""
+Report screening shared by every ingestion path: veracity model, spam
+detector and the title/description/category mismatch guard.
+
+The checks run as a cascade, cheapest first (SCREEN_STAGES). A stage that
+settles the verdict on its own ends the cascade for that report:
+  mismatch       rules   gibberish title + real description -> spam
+  spam_rules     rules   links / spam keywords / keyboard mash -> spam
+  fraud_model    model   spam probability over the threshold -> spam
+  veracity_model model   legit | fake | spam | unknown
+Any of the first three makes the final verdict "spam" whatever the later
+stages would say, so skipping them gives the same ai_veracity, is_suspicious
+and mismatch_reasons as running everything (SCREEN_EARLY_EXIT=0). Scores of
+skipped models get the defaults used when a model isn't trained (spam_prob
+1.0 after a rule hit, score_false 0.0). Per-stage hit rates and timings are
+served at /health/screening.
+"""
+import os
+import time
+
+from ai.features import featurize_batch, select
+from ai.fraud import predict_fraud_batch
+from ai.text_stats import analyze, is_gibberish_field, is_spam_text
+from ai.veracity import predict_veracity_batch
+
+
+# ---------------------- MISMATCH / GIBBERISH GUARD ----------------------
+CATEGORY_KEYWORDS = {
+    "Road": {"road", "pothole", "bridge", "traffic", "accident", "highway", "street", "lane", "damaged"},
+    "Water": {"water", "pipe", "leak", "leakage", "supply", "tap", "drain", "drainage", "sewage"},
+    "Electricity": {"power", "electric", "electricity", "voltage", "transformer", "wire", "outage", "cut"},
+    "Sanitation": {"garbage", "waste", "dirty", "smell", "toilet", "sanitation", "drain", "cleanup"},
+    "Law": {"theft", "fight", "violence", "crime", "police", "assault", "harassment", "illegal"},
+}
+
+
+def _title_desc_mismatch(title: str, desc: str) -> bool:
+    t_tokens = set(analyze(title).tokens)
+    d_tokens = set(analyze(desc).tokens)
+
+    # Title looks normal but desc is gibberish/empty
+    if (not is_gibberish_field(title)) and is_gibberish_field(desc):
+        return True
+
+    # Low overlap between title and desc
+    if len(t_tokens) >= 2 and len(d_tokens) >= 4:
+        overlap = len(t_tokens.intersection(d_tokens))
+        if overlap / max(len(t_tokens), 1) < 0.15:
+            return True
+
+    return False
+
+
+def _category_mismatch(category: str, title: str, desc: str) -> bool:
+    cat = (category or "").strip()
+    if not cat or cat not in CATEGORY_KEYWORDS:
+        return False
+
+    tokens = set(analyze(f"{title} {desc}").tokens)
+    kws = CATEGORY_KEYWORDS[cat]
+
+    hit = len(tokens.intersection(kws))
+    if hit >= 1:
+        return False
+
+    other_hits = {
+        c: len(tokens.intersection(kw))
+        for c, kw in CATEGORY_KEYWORDS.items()
+        if c != cat
+    }
+    best_other = max(other_hits.values()) if other_hits else 0
+
+    if best_other >= 2:
+        return True
+
+    return False
+
+
+def mismatch_guard(title: str, desc: str, category: str):
+    """
+    Returns: (is_mismatch: bool, reasons: list[str], force_spam: bool)
+
+    force_spam triggers only in high-confidence bot patterns:
+    - gibberish title + meaningful description
+    """
+    reasons = []
+    force_spam = False
+
+    title_gib = is_gibberish_field(title)
+    desc_gib = is_gibberish_field(desc)
+
+    # ✅ NEW RULE: title gibberish + description real => spam
+    if title_gib and not desc_gib:
+        reasons.append("gibberish_title_real_description")
+        force_spam = True
+        return True, reasons, force_spam
+
+    if _title_desc_mismatch(title, desc):
+        reasons.append("title_desc_mismatch")
+
+    if _category_mismatch(category, title, desc):
+        reasons.append("category_mismatch")
+
+    if not title_gib and (desc or "").strip() and len((desc or "").strip()) < 12:
+        reasons.append("description_too_short")
+
+    return (len(reasons) > 0), reasons, force_spam
+
+
+# ---------------------- CASCADE ----------------------
+class _Report:
+    __slots__ = ("title", "desc", "category", "mismatch", "spam_rule", "spam", "veracity", "decided_by")
+
+    def __init__(self, title, desc, category):
+        self.title, self.desc, self.category = title, desc, category
+        self.mismatch = None      # mismatch_guard() result
+        self.spam_rule = None     # is_spam_text() hit
+        self.spam = None          # (is_spam, spam_prob) from the fraud model
+        self.veracity = None      # (verdict, score_false, is_suspicious)
+        self.decided_by = None
+
+
+def _stage_mismatch(reports, features):
+    for r in reports:
+        r.mismatch = mismatch_guard(r.title, r.desc, r.category)
+    return [r.mismatch[2] for r in reports]
+
+
+def _stage_spam_rules(reports, features):
+    for r in reports:
+        r.spam_rule = is_spam_text(f"{r.title or ''} {r.desc or ''}".strip())
+    return [r.spam_rule for r in reports]
+
+
+def _stage_fraud_model(reports, features):
+    pairs = [(r.title, r.desc) for r in reports]
+    try:
+        spam = [(bool(s), float(p or 0.0)) for s, p in predict_fraud_batch(pairs, features=features)]
+    except Exception:
+        spam = [(False, 0.0)] * len(reports)
+    for r, sp in zip(reports, spam):
+        r.spam = sp
+    return [sp[0] for sp in spam]
+
+
+def _stage_veracity_model(reports, features):
+    pairs = [(r.title, r.desc) for r in reports]
+    try:
+        veracity = predict_veracity_batch(pairs, features=features)
+        veracity = [(v or "unknown", float(s or 0.0), int(i or 0)) for v, s, i in veracity]
+    except Exception:
+        veracity = [("unknown", 0.0, 0)] * len(reports)
+    for r, v in zip(reports, veracity):
+        r.veracity = v
+    return [False] * len(reports)     # needs the merge, never final on its own
+
+
+# name -> (function, needs the TF-IDF features)
+STAGE_FUNCS = {
+    "mismatch": (_stage_mismatch, False),
+    "spam_rules": (_stage_spam_rules, False),
+    "fraud_model": (_stage_fraud_model, True),
+    "veracity_model": (_stage_veracity_model, True),
+}
+
+STAGES = [s.strip() for s in os.getenv("SCREEN_STAGES", ",".join(STAGE_FUNCS)).split(",") if s.strip()]
+EARLY_EXIT = os.getenv("SCREEN_EARLY_EXIT", "1") == "1"
+
+_unknown = set(STAGES) - set(STAGE_FUNCS)
+if _unknown:
+    raise ValueError(f"SCREEN_STAGES: unknown stage(s) {sorted(_unknown)}; choose from {list(STAGE_FUNCS)}")
+
+_stats = {name: {"reports": 0, "decided": 0, "ms": 0.0} for name in ["featurize", *STAGE_FUNCS]}
+
+
+def _timed(name, n, fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    s = _stats[name]
+    s["reports"] += n
+    s["ms"] += (time.perf_counter() - t0) * 1000
+    return out
+
+
+def _cascade(reports, features=None):
+    """
+    Runs STAGES over the reports; each stage sees only the ones not decided yet.
+    features: featurize_batch() output for all reports (optional); without it
+    the survivors are vectorized once, at the first model stage.
+    """
+    live = list(range(len(reports)))
+    feature_rows = live if features is not None else None    # report index of each row of X
+    for name in STAGES:
+        if not live:
+            break
+        fn, needs_features = STAGE_FUNCS[name]
+        batch = [reports[i] for i in live]
+
+        if needs_features and feature_rows is None:
+            try:
+                features = _timed("featurize", len(batch), featurize_batch, [(r.title, r.desc) for r in batch])
+            except Exception:
+                features = None
+            feature_rows = live
+        elif needs_features and features is not None and feature_rows != live:
+            pos = {row: k for k, row in enumerate(feature_rows)}
+            features = select(features, [pos[i] for i in live])
+            feature_rows = live
+
+        decided = _timed(name, len(batch), fn, batch, features if needs_features else None)
+        _stats[name]["decided"] += sum(decided)
+        if EARLY_EXIT:
+            for r, done in zip(batch, decided):
+                if done:
+                    r.decided_by = name
+            live = [i for i, done in zip(live, decided) if not done]
+    return [_merge_verdict(r) for r in reports]
+
+
+def _merge_verdict(r: _Report) -> dict:
+    verdict, score_false, is_susp = r.veracity or ("unknown", 0.0, 0)
+    if r.spam is not None:
+        is_spam, spam_prob = r.spam
+    else:
+        is_spam, spam_prob = bool(r.spam_rule), (1.0 if r.spam_rule else 0.0)
+    if is_spam:
+        verdict = "spam"
+        is_susp = 1
+
+    # 3) Title/Description/Category mismatch guard
+    if r.mismatch is None:
+        r.mismatch = mismatch_guard(r.title, r.desc, r.category)
+    is_mismatch, reasons, force_spam = r.mismatch
+
+    # ✅ force_spam has priority (but still NO auto-reject, only tag)
+    if force_spam:
+        verdict = "spam"
+        is_susp = 1
+    elif is_mismatch:
+        if verdict != "spam":
+            if verdict == "legit":
+                verdict = "fake"
+            else:
+                verdict = verdict or "unknown"
+        is_susp = 1
+
+    return {
+        "ai_veracity": verdict,
+        "is_suspicious": int(is_susp),
+        "score_false": float(score_false),
+        "spam_prob": float(spam_prob),
+        "mismatch_reasons": reasons,
+        "screened_by": r.decided_by or "all",
+    }
+
+
+# ---------------------- VERDICT ----------------------
+def screen_report(title: str, desc: str, category: str, features=None) -> dict:
+    """
+    Runs the cascade and merges what ran into one verdict.
+    We DO NOT reject automatically, we only tag for admin review.
+    features: ai.features.featurize() output, shared with later predictions.
+    """
+    return _cascade([_Report(title, desc, category)], features)[0]
+
+
+def screen_reports(items, features=None) -> list[dict]:
+    """
+    screen_report for a batch of (title, desc, category): each model stage runs
+    one vectorized predict over the reports still undecided.
+    features: ai.features.featurize_batch() output for the same (title, desc)
+    """
+    if not items:
+        return []
+    return _cascade([_Report(t, d, c) for t, d, c in items], features)
+
+
+def stats() -> dict:
+    """
+    Per stage: reports seen, share it decided, mean ms per report.
+    """
+    out = {}
+    for name, s in _stats.items():
+        n = s["reports"]
+        out[name] = {
+            "reports": n,
+            "decided": s["decided"],
+            "hit_rate": round(s["decided"] / n, 4) if n else 0.0,
+            "mean_ms": round(s["ms"] / n, 4) if n else 0.0,
+        }
+    return {"stages": STAGES, "early_exit": EARLY_EXIT, **out}
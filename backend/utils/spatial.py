@@ -0,0 +1,301 @@
+# backend/utils/spatial.py
+"""
+In-process spatial index over issue coordinates.
+
+Issues are bucketed into an equal-degree lat/lng grid. A radius query only
+visits the cells that can intersect the circle (the longitude span is widened
+by 1/cos(lat)), then computes exact haversine distances with NumPy over those
+cells. k-nearest queries expand ring by ring until no unvisited cell can hold
+a closer point.
+
+The index lives per worker: it is loaded from MySQL on first use, updated
+directly when this worker inserts an issue, and tops itself up with rows
+inserted by other workers (id > last seen id) every SPATIAL_REFRESH_S seconds.
+Results are hydrated from the DB by id, so deleted issues drop out.
+"""
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = math.pi * EARTH_RADIUS_KM / 180.0
+
+CELL_KM = float(os.getenv("SPATIAL_CELL_KM", "0.25"))
+REFRESH_S = float(os.getenv("SPATIAL_REFRESH_S", "5"))
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """
+    Great-circle distance. Works on scalars or NumPy arrays (degrees in).
+    """
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = (
+        np.sin((lat2 - lat1) / 2.0) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2.0) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class _Cell:
+    __slots__ = ("points", "_arrays")
+
+    def __init__(self):
+        self.points = {}      # issue_id -> (lat, lng)
+        self._arrays = None   # cached (ids, lat_rad, lng_rad, cos_lat), rebuilt after writes
+
+    def arrays(self):
+        if self._arrays is None:
+            n = len(self.points)
+            ids = np.fromiter(self.points.keys(), dtype=np.int64, count=n)
+            coords = np.radians(np.array(list(self.points.values()), dtype=np.float64).reshape(n, 2))
+            self._arrays = (ids, coords[:, 0], coords[:, 1], np.cos(coords[:, 0]))
+        return self._arrays
+
+
+class GridIndex:
+    def __init__(self, cell_km: float = CELL_KM):
+        self.cell_deg = cell_km / KM_PER_DEG_LAT
+        self._cells = {}
+        self._where = {}
+        self._bounds = None   # [min_row, max_row, min_col, max_col], only ever grows
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._where)
+
+    def _key(self, lat, lng):
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    # ---------- WRITES ----------
+    def insert(self, issue_id: int, lat: float, lng: float):
+        if lat is None or lng is None:
+            return
+        lat, lng = float(lat), float(lng)
+        key = self._key(lat, lng)
+        with self._lock:
+            if issue_id in self._where:
+                self.remove(issue_id)
+            cell = self._cells.get(key)
+            if cell is None:
+                cell = self._cells[key] = _Cell()
+            cell.points[issue_id] = (lat, lng)
+            cell._arrays = None
+            self._where[issue_id] = key
+            if self._bounds is None:
+                self._bounds = [key[0], key[0], key[1], key[1]]
+            else:
+                b = self._bounds
+                b[0], b[1] = min(b[0], key[0]), max(b[1], key[0])
+                b[2], b[3] = min(b[2], key[1]), max(b[3], key[1])
+
+    def remove(self, issue_id: int):
+        with self._lock:
+            key = self._where.pop(issue_id, None)
+            if key is None:
+                return
+            cell = self._cells[key]
+            cell.points.pop(issue_id, None)
+            cell._arrays = None
+            if not cell.points:
+                del self._cells[key]
+
+    # ---------- READS ----------
+    def _scan(self, lat, lng, keys):
+        parts = [self._cells[key].arrays() for key in keys if key in self._cells]
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        if len(parts) == 1:
+            ids, lat2, lng2, cos2 = parts[0]
+        else:
+            ids, lat2, lng2, cos2 = (np.concatenate(col) for col in zip(*parts))
+
+        # haversine with the per-point radians/cos cached on the cell
+        lat1, lng1 = math.radians(lat), math.radians(lng)
+        a = np.sin((lat2 - lat1) * 0.5) ** 2 + math.cos(lat1) * cos2 * np.sin((lng2 - lng1) * 0.5) ** 2
+        return ids, 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    @staticmethod
+    def _top(ids, dists, limit):
+        if limit is not None and len(dists) > limit:
+            part = np.argpartition(dists, limit - 1)[:limit]
+            ids, dists = ids[part], dists[part]
+        order = np.argsort(dists, kind="stable")
+        return [(int(i), float(d)) for i, d in zip(ids[order], dists[order])]
+
+    def _lng_cells(self, lat, radius_km):
+        # widen the longitude span by 1/cos(lat) at the circle's widest latitude
+        lat_edge = min(abs(lat) + radius_km / KM_PER_DEG_LAT, 89.9)
+        return radius_km / (KM_PER_DEG_LAT * math.cos(math.radians(lat_edge)))
+
+    def within(self, lat: float, lng: float, radius_km: float, limit: int | None = None):
+        """
+        Exact haversine radius query.
+        Returns [(issue_id, distance_km)] sorted by distance.
+        """
+        dlat = radius_km / KM_PER_DEG_LAT
+        dlng = self._lng_cells(lat, radius_km)
+        r0, c0 = self._key(lat - dlat, lng - dlng)
+        r1, c1 = self._key(lat + dlat, lng + dlng)
+        keys = [(r, c) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+        with self._lock:
+            ids, dists = self._scan(lat, lng, keys)
+
+        mask = dists <= radius_km
+        return self._top(ids[mask], dists[mask], limit)
+
+    def nearest(self, lat: float, lng: float, k: int = 5, max_km: float | None = None):
+        """
+        k nearest issues by haversine distance, optionally capped at max_km.
+        Returns [(issue_id, distance_km)] sorted by distance.
+        """
+        if k <= 0:
+            return []
+        r_c, c_c = self._key(lat, lng)
+        max_ring = None
+        if max_km is not None:
+            max_ring = int(math.ceil(self._lng_cells(lat, max_km) / self.cell_deg)) + 1
+
+        with self._lock:
+            if not self._where:
+                return []
+            # beyond this ring there are no occupied cells at all
+            min_r, max_r, min_c, max_c = self._bounds
+            span = max(abs(max_r - r_c), abs(min_r - r_c), abs(max_c - c_c), abs(min_c - c_c))
+            if max_ring is not None:
+                span = min(span, max_ring)
+
+            ids_acc, dists_acc = [], []
+            ring = 0
+            while ring <= span:
+                if (2 * ring + 1) ** 2 > 4 * len(self._cells):
+                    # sparse data: cheaper to scan every occupied cell once
+                    ids, dists = self._scan(lat, lng, list(self._cells))
+                    ids_acc, dists_acc = [ids], [dists]
+                    break
+                if ring == 0:
+                    keys = [(r_c, c_c)]
+                else:
+                    keys = [(r_c + dr, c_c + dc)
+                            for dr in range(-ring, ring + 1)
+                            for dc in range(-ring, ring + 1)
+                            if max(abs(dr), abs(dc)) == ring]
+                ids, dists = self._scan(lat, lng, keys)
+                if len(ids):
+                    ids_acc.append(ids)
+                    dists_acc.append(dists)
+
+                found = sum(len(a) for a in ids_acc)
+                if found >= k:
+                    all_d = np.concatenate(dists_acc)
+                    kth = np.partition(all_d, k - 1)[k - 1]
+                    # closest possible point in the next ring: `ring` full cells away
+                    # (lng cells are narrower by cos(lat), so use the narrower side)
+                    edge_lat = min(abs(lat) + (ring + 1) * self.cell_deg, 89.9)
+                    cell_km = self.cell_deg * KM_PER_DEG_LAT * math.cos(math.radians(edge_lat))
+                    if kth <= ring * cell_km:
+                        break
+                ring += 1
+
+        if not ids_acc:
+            return []
+        ids = np.concatenate(ids_acc)
+        dists = np.concatenate(dists_acc)
+        if max_km is not None:
+            mask = dists <= max_km
+            ids, dists = ids[mask], dists[mask]
+        return self._top(ids, dists, k)
+
+
+# ---------- PROCESS-WIDE INDEX ----------
+_index = None
+_index_lock = threading.Lock()
+_last_sync = 0.0
+_synced_id = 0   # sync watermark; live inserts don't move it so no id is skipped
+
+
+def _sync(index: GridIndex):
+    global _synced_id
+    from backend.utils import db_utils
+
+    for issue_id, lat, lng in db_utils.iter_issue_points(after_id=_synced_id):
+        index.insert(issue_id, lat, lng)
+        _synced_id = issue_id
+
+
+def get_index() -> GridIndex:
+    """
+    Loads the index on first use and pulls rows other workers inserted
+    at most every REFRESH_S seconds.
+    """
+    global _index, _last_sync
+    now = time.monotonic()
+    if _index is not None and now - _last_sync < REFRESH_S:
+        return _index
+    with _index_lock:
+        if _index is None:
+            index = GridIndex()
+            _sync(index)
+            _index = index
+        elif now - _last_sync >= REFRESH_S:
+            _sync(_index)
+        _last_sync = time.monotonic()
+    return _index
+
+
+def on_issue_added(issue_id: int, lat: float, lng: float):
+    if _index is not None:
+        _index.insert(issue_id, lat, lng)
+
+
+def on_issues_deleted(issue_ids):
+    if _index is not None:
+        for issue_id in issue_ids:
+            _index.remove(issue_id)
+
+
+def _hydrate(hits):
+    """
+    Rows for the hits, in hit order, plus the hit ids the issues table no
+    longer has (deleted, possibly through another worker).
+    """
+    from backend.utils import db_utils
+
+    if not hits:
+        return [], []
+    rows = db_utils.fetch_issues_by_ids(
+        [issue_id for issue_id, _ in hits], fields=["id", "title", "timestamp", "category"]
+    )
+    by_id = {r["id"]: r for r in rows}
+    out, gone = [], []
+    for issue_id, dist in hits:
+        row = by_id.get(issue_id)
+        if row is None:
+            gone.append(issue_id)
+            continue
+        row["distance_km"] = round(dist, 4)
+        out.append(row)
+    return out, gone
+
+
+def _live(query):
+    # deletes only reach the worker that served them; drop the stale ids here
+    # and ask again so the caller still gets up to its limit of live rows
+    index = get_index()
+    while True:
+        rows, gone = _hydrate(query(index))
+        if not gone:
+            return rows
+        for issue_id in gone:
+            index.remove(issue_id)
+
+
+def nearby_issues(lat: float, lng: float, radius_km: float, limit: int = 5):
+    return _live(lambda index: index.within(lat, lng, radius_km, limit=limit))
+
+
+def nearest_issues(lat: float, lng: float, k: int = 5, max_km: float | None = None):
+    return _live(lambda index: index.nearest(lat, lng, k=k, max_km=max_km))
@@ -0,0 +1,141 @@
+# benchmarks/corpus.py
+"""
+Synthetic report corpora for the AI benchmarks, shaped like real submissions:
+civic reports per category with a severity, plus spam and keyboard-mash junk.
+"""
+import numpy as np
+
+PLACES = [
+    "Keishamthong", "Thangmeiband", "Singjamei", "Uripok", "Sagolband", "Khurai",
+    "Lamphel", "Kwakeithel", "Paona Bazar", "Nagamapal", "Wangkhei", "Thoubal",
+]
+
+CIVIC = {
+    "Road": (
+        ["Pothole on {p} road", "Road damaged near {p}", "Broken bridge at {p}", "Traffic jam at {p} crossing"],
+        ["Big potholes on the main road near {p} are causing accidents every day.",
+         "The street near {p} is badly damaged after the rain and two-wheelers keep slipping.",
+         "Bridge railing at {p} has broken and the lane is unsafe for school children."],
+    ),
+    "Water": (
+        ["No water supply in {p}", "Pipe leakage at {p}", "Drain overflowing in {p}"],
+        ["There has been no water supply in {p} for three days, the tap is dry.",
+         "A pipe is leaking near {p} market and water is wasted on the road.",
+         "Drainage is blocked near {p} and sewage water is flowing into houses."],
+    ),
+    "Electricity": (
+        ["Power cut in {p}", "Transformer fault near {p}", "Loose wire at {p}"],
+        ["Power outage in {p} since last night, voltage keeps fluctuating.",
+         "The transformer near {p} sparked and the whole area has no electricity.",
+         "A live electric wire is hanging low near {p}, very dangerous."],
+    ),
+    "Sanitation": (
+        ["Garbage not collected in {p}", "Dirty public toilet at {p}", "Waste dumped near {p}"],
+        ["Garbage has not been collected in {p} for a week and the smell is unbearable.",
+         "The public toilet at {p} is dirty and has not been cleaned for days.",
+         "People are dumping waste near {p} school, cleanup needed urgently."],
+    ),
+    "Law & Order": (
+        ["Theft reported in {p}", "Fight near {p} market", "Illegal parking at {p}"],
+        ["Two bikes were stolen from {p} last night, police should patrol the area.",
+         "A violent fight broke out near {p} market and shops were damaged.",
+         "Illegal parking near {p} is blocking the ambulance route."],
+    ),
+}
+
+SPAM = [
+    ("Free money click now", "Win $500 bonus, claim your promo on whatsapp http://spam.example"),
+    ("Call now for offer", "Join our telegram channel for free money and bonus rewards"),
+    ("Claim promo", "click now click now win 1000 free"),
+]
+
+_CONSONANTS = "bcdfghjklmnpqrstvwxyz"
+
+
+def _mash(rng, n):
+    return "".join(rng.choice(list(_CONSONANTS), n))
+
+
+def make_reports(n: int, seed: int = 5, spam_ratio: float = 0.1, junk_ratio: float = 0.05) -> list[dict]:
+    """
+    [{title, description, category, severity, label}] with label 1 = spam/junk.
+    """
+    rng = np.random.default_rng(seed)
+    cats = list(CIVIC)
+    out = []
+    for _ in range(n):
+        r = rng.random()
+        if r < spam_ratio:
+            t, d = SPAM[rng.integers(len(SPAM))]
+            out.append({"title": t, "description": d, "category": "Spam", "severity": 1, "label": 1})
+        elif r < spam_ratio + junk_ratio:
+            out.append({"title": _mash(rng, 10), "description": _mash(rng, 14), "category": "Spam",
+                        "severity": 1, "label": 1})
+        else:
+            cat = cats[rng.integers(len(cats))]
+            titles, descs = CIVIC[cat]
+            p = PLACES[rng.integers(len(PLACES))]
+            desc = descs[rng.integers(len(descs))].format(p=p)
+            if rng.random() < 0.5:   # vary the wording a little
+                desc += " " + descs[rng.integers(len(descs))].format(p=PLACES[rng.integers(len(PLACES))])
+            out.append({
+                "title": titles[rng.integers(len(titles))].format(p=p),
+                "description": desc,
+                "category": cat,
+                "severity": int(rng.integers(1, 6)),
+                "label": 0,
+            })
+    return out
+
+
+def veracity_rows(reports: list[dict], seed: int = 9) -> list[dict]:
+    """
+    text,label rows for the veracity model: civic -> legit, spam -> spam and a
+    share of civic text with another category's title -> fake.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r in reports:
+        text = f"{r['title']} {r['description']}"
+        if r["label"]:
+            rows.append({"text": text, "label": "spam"})
+        elif rng.random() < 0.25:
+            other = reports[rng.integers(len(reports))]
+            rows.append({"text": f"{other['title']} {r['description']}", "label": "fake"})
+        else:
+            rows.append({"text": text, "label": "legit"})
+    return rows
+
+
+# spam written to get past the rules: spaced / dotted links and handles, civic
+# words as cover, look-alike letters, emoji, repeats and oversized bodies
+_ADVERSARIAL = [
+    ("Road repair update {p}", "Pothole fund claim here w w w . f r e e - m o n e y . example bonus"),
+    ("Water supply {p}", "Tap water problem solved, msg on w.h.a.t.s.a.p.p 98xx for promo"),
+    ("Ꮲothole on {p} rοad", "Bіg pοtholes nеar {p}, clаim yοur rеward nοw"),
+    ("Power cut {p} 🔥🔥🔥", "💰💰💰 win 5000 now 💰💰💰 join telegram t.me/offer"),
+    ("Garbage at {p}!!!!!!!!", "cleanup cleanup cleanup cleanup cleanup cleanup cleanup"),
+    ("{p}", "hxxp://bit[.]ly/claim-{p} free recharge for all citizens"),
+    ("Theft in {p}", ""),
+    ("qwrtzpsdfg {p}", "Garbage has not been collected in {p} for a week and the smell is unbearable."),
+]
+
+
+def make_adversarial(n: int, seed: int = 7, long_ratio: float = 0.1) -> list[dict]:
+    """
+    Spam reports (label 1) shaped to dodge the screening rules, same keys as
+    make_reports(); a share of them carries a ~4KB description.
+    """
+    rng = np.random.default_rng(seed)
+    cats = list(CIVIC)
+    out = []
+    for _ in range(n):
+        t, d = _ADVERSARIAL[rng.integers(len(_ADVERSARIAL))]
+        p = PLACES[rng.integers(len(PLACES))]
+        t, d = t.format(p=p), d.format(p=p)
+        if rng.random() < long_ratio:
+            civic = CIVIC[cats[rng.integers(len(cats))]][1]
+            d = " ".join([d, *(civic[rng.integers(len(civic))].format(p=p) for _ in range(50))])
+        out.append({"title": t, "description": d, "category": cats[rng.integers(len(cats))],
+                    "severity": 1, "label": 1})
+    return out
@@ -0,0 +1,213 @@
+# benchmarks/hotpath.py
+"""
+Micro-benchmarks for the pure-Python work done on every submission, each
+function timed on its own over synthetic corpora (benchmarks/corpus.py):
+civic reports from make_reports() and rule-dodging spam from
+make_adversarial().
+
+  mismatch_guard       backend/utils/screening.py, whole guard
+  is_gibberish_field   ai/text_stats.py, per title / description
+  _title_desc_mismatch backend/utils/screening.py
+  _category_mismatch   backend/utils/screening.py
+  issue_row            db_utils._issue_row over raw rows, as fetch_issues maps them
+  IssueCreate          request body validation, from a dict and from JSON
+
+Each case runs --repeat passes over its corpus (looped until a pass takes
+~50ms) with the text_stats.analyze cache cleared before each loop and gc
+off; the best pass gives ns per call.
+
+Baselines are machine-specific and stay local (benchmarks/baselines/ is not
+committed): --save-baseline records the current numbers, later runs compare
+against them and exit non-zero when a case is more than --threshold slower,
+and still is after --retries re-timings.
+
+    python -m benchmarks.hotpath --save-baseline
+    python -m benchmarks.hotpath --threshold 0.2     # after a change
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from ai import text_stats
+from backend.routes.issues import IssueCreate
+from backend.utils import db_utils, screening
+from benchmarks.corpus import make_adversarial, make_reports
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "hotpath.json")
+THRESHOLD = 0.25
+MIN_PASS_S = 0.05       # fast cases loop over their corpus until a pass takes this long
+
+
+# ---------- INPUTS ----------
+def _db_rows(reports, seed_ts=datetime(2025, 1, 1)):
+    # what SELECT * hands back: datetimes, NULLs in the optional columns
+    rows = []
+    for i, r in enumerate(reports):
+        rows.append({
+            "id": i + 1, "title": r["title"], "description": r["description"], "category": r["category"],
+            "latitude": 24.8 + i % 100 / 1000, "longitude": 93.9 + i % 100 / 1000,
+            "address": None if i % 3 else "Imphal West", "severity": r["severity"],
+            "status": None if i % 4 else "Pending", "timestamp": seed_ts + timedelta(minutes=i),
+            "user_id": i % 50 + 1, "ai_category": r["category"], "ai_severity": None,
+            "assigned_department": None, "department_id": None, "approved_by_admin": 0,
+            "admin_comment": None, "ai_veracity": "legit" if not r["label"] else "spam",
+            "is_suspicious": r["label"], "duplicate_of": None,
+        })
+    return rows
+
+
+def _payloads(reports):
+    return [{
+        "title": r["title"], "category": r["category"], "description": r["description"],
+        "latitude": 24.8 + i % 100 / 1000, "longitude": 93.9 + i % 100 / 1000, "user_id": i % 50 + 1,
+    } for i, r in enumerate(reports)]
+
+
+def cases(n_civic, n_adversarial) -> dict:
+    """
+    {case name: (fn, [args tuple per call])}
+    """
+    corpora = {"civic": make_reports(n_civic, seed=21, spam_ratio=0.0, junk_ratio=0.0),
+               "adversarial": make_adversarial(n_adversarial, seed=22)}
+    out = {}
+    for label, reports in corpora.items():
+        tdc = [(r["title"], r["description"], r["category"]) for r in reports]
+        payloads = _payloads(reports)
+        out[f"mismatch_guard/{label}"] = (screening.mismatch_guard, tdc)
+        out[f"is_gibberish_field/{label}"] = (
+            text_stats.is_gibberish_field, [(t,) for t, _, _ in tdc] + [(d,) for _, d, _ in tdc])
+        out[f"_title_desc_mismatch/{label}"] = (screening._title_desc_mismatch, [(t, d) for t, d, _ in tdc])
+        out[f"_category_mismatch/{label}"] = (screening._category_mismatch, [(c, t, d) for t, d, c in tdc])
+        out[f"issue_row/{label}"] = (db_utils._issue_row, [(row, db_utils.ISSUE_FIELDS) for row in _db_rows(reports)])
+        out[f"IssueCreate/{label}"] = (IssueCreate.model_validate, [(p,) for p in payloads])
+        out[f"IssueCreate_json/{label}"] = (IssueCreate.model_validate_json, [(json.dumps(p),) for p in payloads])
+    return out
+
+
+# ---------- TIMING ----------
+def _pass(fn, calls, loops) -> float:
+    t0 = time.perf_counter_ns()
+    for _ in range(loops):
+        text_stats.analyze.cache_clear()
+        for args in calls:
+            fn(*args)
+    return (time.perf_counter_ns() - t0) / (loops * len(calls))
+
+
+def _time_case(fn, calls, repeat) -> dict:
+    passes = []
+    gc_was_on = gc.isenabled()
+    gc.disable()
+    try:
+        loops = max(1, round(MIN_PASS_S * 1e9 / (_pass(fn, calls, 1) * len(calls))))
+        for _ in range(repeat):
+            passes.append(_pass(fn, calls, loops))
+    finally:
+        if gc_was_on:
+            gc.enable()
+    return {"calls": len(calls) * loops, "best_ns": round(min(passes), 1),
+            "median_ns": round(statistics.median(passes), 1)}
+
+
+def machine() -> dict:
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(), "cpus": os.cpu_count()}
+
+
+def run(all_cases, repeat=7, only=None) -> dict:
+    results = {}
+    for name, (fn, calls) in all_cases.items():
+        if only and not any(o in name for o in only):
+            continue
+        fn(*calls[0])       # imports / first-call setup outside the timings
+        results[name] = _time_case(fn, calls, repeat)
+    return {"created_at": time.strftime("%Y-%m-%d %H:%M:%S"), "machine": machine(), "repeat": repeat,
+            "results": results}
+
+
+# ---------- BASELINE ----------
+def compare(baseline, current, threshold) -> list[str]:
+    """
+    Cases whose best time grew by more than threshold; prints the table.
+    """
+    regressions = []
+    print(f"\n{'case':<36} {'baseline':>11} {'now':>11} {'ratio':>7}")
+    for name, r in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            print(f"{name:<36} {'-':>11} {r['best_ns'] / 1000:>9.2f}µs {'new':>7}")
+            continue
+        ratio = r["best_ns"] / base["best_ns"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  ⚠️ regression"
+        print(f"{name:<36} {base['best_ns'] / 1000:>9.2f}µs {r['best_ns'] / 1000:>9.2f}µs {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Micro-benchmarks for the submission hot path")
+    ap.add_argument("--civic", type=int, default=2000, help="civic reports in the corpus")
+    ap.add_argument("--adversarial", type=int, default=500, help="adversarial spam reports in the corpus")
+    ap.add_argument("--repeat", type=int, default=7, help="passes per case, best one counts")
+    ap.add_argument("--only", nargs="+", help="cases whose name contains any of these")
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--save-baseline", action="store_true", help="record this run as the baseline")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD,
+                    help="allowed slowdown vs the baseline before a case is flagged (0.25 = 25%%)")
+    ap.add_argument("--retries", type=int, default=2, help="re-timings of a flagged case before it counts")
+    args = ap.parse_args()
+
+    all_cases = cases(args.civic, args.adversarial)
+    current = run(all_cases, args.repeat, args.only)
+    print(f"{'case':<36} {'calls':>6} {'best':>11} {'median':>11}")
+    for name, r in current["results"].items():
+        print(f"{name:<36} {r['calls']:>6} {r['best_ns'] / 1000:>9.2f}µs {r['median_ns'] / 1000:>9.2f}µs")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        if os.path.exists(args.baseline) and args.only:
+            # a partial run updates its cases, keeps the rest
+            with open(args.baseline) as f:
+                kept = json.load(f)["results"]
+            current["results"] = {**kept, **current["results"]}
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"\n✅ Baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; record one with --save-baseline")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["machine"] != current["machine"]:
+        print(f"⚠️ baseline recorded on {baseline['machine']}, now {current['machine']}; "
+              f"ratios mix hardware/interpreter changes with code changes")
+    regressions = compare(baseline, current, args.threshold)
+    for _ in range(args.retries):
+        if not regressions:
+            break
+        # a slow pass on a shared machine looks like a regression; it has to show up again
+        print(f"\n→ re-timing {len(regressions)} flagged case(s)")
+        again = run({name: all_cases[name] for name in regressions}, args.repeat)
+        for name, r in again["results"].items():
+            if r["best_ns"] < current["results"][name]["best_ns"]:
+                current["results"][name] = r
+        current["results"] = {name: current["results"][name] for name in regressions}
+        regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n⚠️ {len(regressions)} case(s) more than {args.threshold:.0%} slower than the baseline")
+        sys.exit(1)
+    print(f"\n✅ No case more than {args.threshold:.0%} slower than the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/inference_pipeline.py
+"""
+Per-submission AI latency: separate vectorizers vs the shared feature stage.
+
+"before" = screen_report (veracity + fraud) + predict_issue with the per-model
+artifacts, i.e. three TF-IDF transforms of the same text; "after" = the same
+calls once ai.train_shared has produced the shared bundle (one transform).
+Both sets of artifacts are trained on a synthetic corpus in a temp dir.
+
+    python -m benchmarks.inference_pipeline --reports 3000 --submissions 500
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ART_DIR = tempfile.mkdtemp(prefix="bench_artifacts_")
+os.environ["AI_ARTIFACT_DIR"] = ART_DIR      # before ai.registry is imported
+os.environ["AI_RELOAD_CHECK_S"] = "0"
+os.environ["AI_RELOAD_SETTLE_S"] = "0"
+
+import joblib  # noqa: E402
+from sklearn.linear_model import LogisticRegression  # noqa: E402
+
+from ai import registry  # noqa: E402
+from ai.features import featurize, make_vectorizer  # noqa: E402
+from ai.model import predict_issue  # noqa: E402
+from ai.train_shared import train_shared  # noqa: E402
+from backend.utils.screening import screen_report  # noqa: E402
+from benchmarks.corpus import make_reports, veracity_rows  # noqa: E402
+
+
+def _train_legacy(df, ver):
+    """
+    The per-model artifacts as ai.model / ai.train_fraud / ai.train_veracity write them.
+    """
+    civic = df[df["category"] != "Spam"]
+    text = lambda d: d["title"] + " " + d["description"]   # noqa: E731
+    files = registry.BUNDLES
+
+    v = make_vectorizer().fit(text(civic))
+    X = v.transform(text(civic))
+    joblib.dump(v, os.path.join(ART_DIR, files["issue"]["vectorizer"]))
+    joblib.dump(LogisticRegression(max_iter=1500).fit(X, civic["category"]), os.path.join(ART_DIR, files["issue"]["category"]))
+    joblib.dump(LogisticRegression(max_iter=1500).fit(X, civic["severity"]), os.path.join(ART_DIR, files["issue"]["severity"]))
+
+    v = make_vectorizer().fit(text(df))
+    joblib.dump(v, os.path.join(ART_DIR, files["fraud"]["vectorizer"]))
+    joblib.dump(LogisticRegression(max_iter=1500).fit(v.transform(text(df)), df["label"]), os.path.join(ART_DIR, files["fraud"]["model"]))
+
+    v = make_vectorizer().fit(ver["text"])
+    y = ver["label"].map({"legit": 0, "fake": 1, "spam": 2})
+    joblib.dump(v, os.path.join(ART_DIR, files["veracity"]["vectorizer"]))
+    joblib.dump(LogisticRegression(max_iter=2000).fit(v.transform(ver["text"]), y), os.path.join(ART_DIR, files["veracity"]["model"]))
+
+
+def _submit(r):
+    features = featurize(r["title"], r["description"])   # None before train_shared
+    screen = screen_report(r["title"], r["description"], r["category"], features)
+    cat, sev = predict_issue(r["title"], r["description"], features)
+    return screen, cat, sev
+
+
+def _run(submissions):
+    for r in submissions[:20]:   # warm the registry + sklearn code paths
+        _submit(r)
+
+    samples, results = [], []
+    for r in submissions:
+        t = time.perf_counter()
+        screen, cat, sev = _submit(r)
+        samples.append(time.perf_counter() - t)
+        results.append((screen["ai_veracity"], cat, sev))
+    return np.array(samples) * 1000.0, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=3000, help="training corpus size")
+    parser.add_argument("--submissions", type=int, default=500)
+    args = parser.parse_args()
+
+    df = pd.DataFrame(make_reports(args.reports))
+    ver = pd.DataFrame(veracity_rows(df.to_dict("records")))
+    submissions = make_reports(args.submissions, seed=77)
+
+    _train_legacy(df, ver)
+    before, _ = _run(submissions)
+
+    data_dir = tempfile.mkdtemp(prefix="bench_data_")
+    df.to_csv(os.path.join(data_dir, "training_data.csv"), index=False)
+    ver.to_csv(os.path.join(data_dir, "veracity_1500.csv"), index=False)
+    train_shared(os.path.join(data_dir, "training_data.csv"), os.path.join(data_dir, "veracity_1500.csv"), ART_DIR)
+    after, _ = _run(submissions)
+
+    print(f"\nsubmissions={len(submissions)} training reports={args.reports}")
+    print(f"{'pipeline':<34} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, a in [("per-model vectorizers (before)", before), ("shared feature stage (after)", after)]:
+        print(f"{name:<34} {np.percentile(a, 50):>8.3f} {np.percentile(a, 95):>8.3f} {np.percentile(a, 99):>8.3f}")
+    print(f"\nspeedup p50: {np.percentile(before, 50) / np.percentile(after, 50):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
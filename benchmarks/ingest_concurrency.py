@@ -0,0 +1,132 @@
+# benchmarks/ingest_concurrency.py
+"""
+Concurrency benchmark for the issue ingestion path.
+
+Compares the old shape of submit_issue (blocking screening + insert called
+straight from the coroutine) with backend.utils.ingest.ingest_issue, and
+reports throughput plus how long the event loop was stalled.
+
+    python -m benchmarks.ingest_concurrency --requests 200 --infer-ms 15 --db-ms 20
+    python -m benchmarks.ingest_concurrency --live    # real models + MySQL
+
+Without --live, screening and the insert are replaced by sleeps of the given
+length so the numbers only reflect scheduling, not model or DB speed.
+"""
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from backend.utils import db_utils, ingest, prediction_cache, screening
+
+
+def _make_issue(i: int):
+    return SimpleNamespace(
+        title=f"Pothole near Keishampat junction #{i}",
+        description="Large pothole in the middle of the road, two-wheelers are skidding at night.",
+        category="Road",
+        latitude=24.80 + i * 1e-5,
+        longitude=93.93,
+        user_id=1,
+    )
+
+
+async def _blocking_ingest(issue):
+    # What submit_issue did before: everything on the event loop.
+    screen = screening.screen_report(issue.title, issue.description, issue.category)
+    return db_utils.add_issue(
+        title=issue.title,
+        category=issue.category,
+        description=issue.description,
+        latitude=issue.latitude,
+        longitude=issue.longitude,
+        user_id=issue.user_id,
+        ai_veracity=screen["ai_veracity"],
+        is_suspicious=screen["is_suspicious"],
+    )
+
+
+async def _probe_loop_lag(stop: asyncio.Event, samples: list):
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(0.005)
+        samples.append(time.perf_counter() - t0 - 0.005)
+
+
+async def _run(fn, n_requests: int, concurrency: int):
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with sem:
+            await fn(_make_issue(i))
+
+    stop = asyncio.Event()
+    lag = []
+    probe = asyncio.create_task(_probe_loop_lag(stop, lag))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n_requests)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return {
+        "seconds": elapsed,
+        "req_per_s": n_requests / elapsed,
+        "max_loop_stall_ms": (max(lag) if lag else 0.0) * 1000.0,
+    }
+
+
+def _simulate(infer_ms: float, db_ms: float):
+    def fake_screen(title, desc, category):
+        time.sleep(infer_ms / 1000.0)
+        return {
+            "ai_veracity": "legit",
+            "is_suspicious": 0,
+            "score_false": 0.0,
+            "spam_prob": 0.0,
+            "mismatch_reasons": [],
+        }
+
+    def fake_add_issue(**kwargs):
+        time.sleep(db_ms / 1000.0)
+        return 1
+
+    screening.screen_report = fake_screen
+    prediction_cache.screen_report = fake_screen
+    db_utils.add_issue = fake_add_issue
+
+
+async def main_async(args):
+    results = {}
+    results["blocking (before)"] = await _run(_blocking_ingest, args.requests, args.concurrency)
+    results["ingest_issue"] = await _run(ingest.ingest_issue, args.requests, args.concurrency)
+
+    print(f"{'path':<20} {'seconds':>9} {'req/s':>9} {'max stall ms':>13}")
+    for name, r in results.items():
+        print(f"{name:<20} {r['seconds']:>9.3f} {r['req_per_s']:>9.1f} {r['max_loop_stall_ms']:>13.1f}")
+
+    base = results["blocking (before)"]["req_per_s"]
+    print(f"\nThroughput gain: {results['ingest_issue']['req_per_s'] / base:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--infer-ms", type=float, default=15.0)
+    parser.add_argument("--db-ms", type=float, default=20.0)
+    parser.add_argument("--live", action="store_true", help="use the real models and MySQL (writes rows!)")
+    args = parser.parse_args()
+
+    if not args.live:
+        _simulate(args.infer_ms, args.db_ms)
+
+    try:
+        asyncio.run(main_async(args))
+    finally:
+        ingest.shutdown()
+
+
+if __name__ == "__main__":
+    main()
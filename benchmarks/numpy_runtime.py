@@ -0,0 +1,97 @@
+# benchmarks/numpy_runtime.py
+"""
+Cold start, RSS and per-submission latency of one worker with the pickled
+scikit-learn bundles vs the NumPy runtime (AI_RUNTIME=numpy, arrays from
+ai/export_linear.py). Each runtime is measured in a fresh interpreter that
+imports the scoring path, warms the registry and scores --submissions
+reports; artifacts are trained on a synthetic corpus in a temp dir.
+
+    python -m benchmarks.numpy_runtime --reports 3000 --submissions 500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+WORKER = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from ai import registry
+from backend.utils.screening import screen_report
+from ai.model import predict_issue
+from ai.features import featurize
+warm = registry.warm()
+t_ready = time.perf_counter() - t0
+
+from benchmarks.corpus import make_reports
+reports = make_reports(int(sys.argv[1]), seed=11)
+t1 = time.perf_counter()
+for r in reports:
+    f = featurize(r["title"], r["description"])
+    screen_report(r["title"], r["description"], r["category"], features=f)
+    predict_issue(r["title"], r["description"], features=f)
+per_ms = (time.perf_counter() - t1) * 1000 / len(reports)
+
+def peak_rss_mb():
+    # VmHWM starts over at exec; ru_maxrss would include the forking parent
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+print(json.dumps({
+    "cold_start_s": t_ready,
+    "per_submission_ms": per_ms,
+    "max_rss_mb": peak_rss_mb(),
+    "sklearn_loaded": "sklearn" in sys.modules,
+    "scipy_loaded": "scipy" in sys.modules,
+    "bundles": warm,
+}))
+"""
+
+
+def _worker(runtime, art_dir, submissions) -> dict:
+    env = dict(os.environ, AI_ARTIFACT_DIR=art_dir, AI_RUNTIME=runtime)
+    out = subprocess.run(
+        [sys.executable, "-c", WORKER, str(submissions)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reports", type=int, default=3000)
+    ap.add_argument("--submissions", type=int, default=500)
+    args = ap.parse_args()
+
+    import pandas as pd
+
+    from ai.export_linear import export_all
+    from ai.train_shared import train_shared
+    from benchmarks.corpus import make_reports, veracity_rows
+
+    art_dir = tempfile.mkdtemp(prefix="bench_artifacts_")
+    data_dir = tempfile.mkdtemp(prefix="bench_data_")
+    reports = make_reports(args.reports)
+    pd.DataFrame(reports).to_csv(os.path.join(data_dir, "training_data.csv"), index=False)
+    pd.DataFrame(veracity_rows(reports)).to_csv(os.path.join(data_dir, "veracity_1500.csv"), index=False)
+    train_shared(
+        os.path.join(data_dir, "training_data.csv"),
+        os.path.join(data_dir, "veracity_1500.csv"),
+        art_dir=art_dir,
+    )
+    export_all(art_dir, os.path.join(art_dir, "numpy"))
+
+    results = {rt: _worker(rt, art_dir, args.submissions) for rt in ("sklearn", "numpy")}
+    print(f"\n{'runtime':<9} {'cold start':>11} {'max RSS':>9} {'per submission':>15}  sklearn/scipy imported")
+    for rt, r in results.items():
+        print(
+            f"{rt:<9} {r['cold_start_s']:>10.2f}s {r['max_rss_mb']:>7.0f}MB {r['per_submission_ms']:>13.2f}ms"
+            f"  {r['sklearn_loaded']}/{r['scipy_loaded']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
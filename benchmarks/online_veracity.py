@@ -0,0 +1,71 @@
+# benchmarks/online_veracity.py
+"""
+Cost of keeping the veracity model fresh as admin decisions pile up: a full
+refit on the whole history (TF-IDF vocabulary + LogisticRegression, as
+ai/train_veracity.py) vs one incremental update with only the new labels
+(hashing features + SGD partial_fit, as ai/train_veracity_online.py).
+
+For each history size the incremental model has learned the history in
+--new sized steps; both are then scored on a held-out slice. No database:
+labels are synthetic reports (approved = civic report, rejected = spam/junk).
+
+    python -m benchmarks.online_veracity --history 1000 5000 20000 --new 200
+"""
+import argparse
+import time
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+from ai.features import make_vectorizer
+from ai.train_veracity_online import CLASSES, make_online_model, make_online_vectorizer
+from benchmarks.corpus import make_reports
+
+
+def _labeled(n, seed):
+    reports = make_reports(n, seed=seed)
+    texts = [f"{r['title']} {r['description']}".strip() for r in reports]
+    y = np.array([1 if r["category"] == "Spam" else 0 for r in reports])
+    return texts, y
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--history", type=int, nargs="+", default=[1000, 5000, 20000])
+    ap.add_argument("--new", type=int, default=200, help="labels per incremental update")
+    args = ap.parse_args()
+
+    texts, y = _labeled(max(args.history) + args.new, seed=11)
+    test_texts, y_test = _labeled(2000, seed=12)
+
+    vect = make_online_vectorizer()
+    model = make_online_model()
+    learned = 0
+
+    print(f"{'history':>8} {'full refit':>11} {'incremental':>12} {'speedup':>8} {'acc full':>9} {'acc online':>11}")
+    for n in sorted(args.history):
+        # bring the online model up to n labels, in --new sized steps
+        while learned < n:
+            step = slice(learned, min(learned + args.new, n))
+            model.partial_fit(vect.transform(texts[step]), y[step], classes=CLASSES)
+            learned = step.stop
+
+        t0 = time.perf_counter()
+        tfidf = make_vectorizer()
+        full = LogisticRegression(max_iter=2000).fit(tfidf.fit_transform(texts[:n + args.new]), y[:n + args.new])
+        full_s = time.perf_counter() - t0
+
+        new = slice(n, n + args.new)
+        t0 = time.perf_counter()
+        model.partial_fit(vect.transform(texts[new]), y[new], classes=CLASSES)
+        inc_s = time.perf_counter() - t0
+        learned = new.stop
+
+        acc_full = float((full.predict(tfidf.transform(test_texts)) == y_test).mean())
+        acc_online = float((model.predict(vect.transform(test_texts)) == y_test).mean())
+        print(f"{n:>8} {full_s * 1000:>9.0f}ms {inc_s * 1000:>10.1f}ms {full_s / inc_s:>7.0f}x "
+              f"{acc_full:>9.3f} {acc_online:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
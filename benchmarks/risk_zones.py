@@ -0,0 +1,85 @@
+# benchmarks/risk_zones.py
+"""
+Benchmark ai/risk.RiskEngine: incremental inserts vs rebuilding from scratch.
+
+The "before" path rebuilds the engine from every issue on each new report
+(what a batch recompute over the issues table costs); the "after" path applies
+one incremental add and reads the zones.
+
+    python -m benchmarks.risk_zones --points 100000 --updates 200
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ai.risk import RiskEngine
+from benchmarks.spatial_index import make_points
+
+
+def _percentiles(samples):
+    a = np.array(samples) * 1000.0
+    return np.percentile(a, 50), np.percentile(a, 95), np.percentile(a, 99)
+
+
+def _build(pts, sev, ts):
+    engine = RiskEngine()
+    for i, (lat, lng) in enumerate(pts.tolist()):
+        engine.add(i + 1, lat, lng, int(sev[i]), float(ts[i]))
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--rebuilds", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    pts = make_points(args.points)
+    sev = rng.integers(1, 6, len(pts))
+    now = time.time()
+    ts = now - rng.uniform(0, 60 * 86400, len(pts))   # last 60 days
+
+    # ---- before: full rebuild per new report ----
+    rebuild_t = []
+    for _ in range(args.rebuilds):
+        t = time.perf_counter()
+        engine = _build(pts, sev, ts)
+        engine.zones(now=now)
+        rebuild_t.append(time.perf_counter() - t)
+
+    # ---- after: incremental add + zones ----
+    new = make_points(args.updates, seed=19)
+    add_t, zones_t, score_t = [], [], []
+    for j, (lat, lng) in enumerate(new.tolist()):
+        t = time.perf_counter()
+        engine.add(len(pts) + j + 1, lat, lng, 3, now)
+        add_t.append(time.perf_counter() - t)
+
+        t = time.perf_counter()
+        zones = engine.zones(now=now)
+        zones_t.append(time.perf_counter() - t)
+
+        t = time.perf_counter()
+        engine.score_at(lat, lng, now=now)
+        score_t.append(time.perf_counter() - t)
+
+    red = sum(1 for z in zones if z["zone"] == "red")
+    print(f"issues={len(engine):,} updates={args.updates} hot clusters={len(zones)} (red={red})\n")
+    print(f"{'operation':<34} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for name, samples in [
+        ("full rebuild + zones (before)", rebuild_t),
+        ("incremental add", add_t),
+        ("zones() read", zones_t),
+        ("score_at", score_t),
+    ]:
+        p50, p95, p99 = _percentiles(samples)
+        print(f"{name:<34} {p50:>10.3f} {p95:>10.3f} {p99:>10.3f}")
+    per_update = np.median(add_t) + np.median(zones_t)
+    print(f"\nper-report refresh speedup: {np.median(rebuild_t) / per_update:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# benchmarks/screening_golden.py
+"""
+Golden check for the screening cascade (backend/utils/screening.py).
+
+1. GOLDEN: hand-picked reports with the exact ai_veracity / is_suspicious /
+   mismatch_reasons they must get. The first ones are settled by a rule
+   whatever the models say; the rest get past the rules to fraud_model or
+   veracity_model, with the values screen_report gave before the cascade
+   (every stage run) on models trained from the same synthetic corpus.
+2. Parity: on a synthetic corpus (civic reports, spam, keyboard mash) the
+   early-exit cascade must give the same verdict fields as running every
+   stage (SCREEN_EARLY_EXIT=0), one report at a time and in batches.
+
+Prints per-stage hit rates and the time per report of both modes. Exits
+non-zero on any difference.
+
+    python -m benchmarks.screening_golden --reports 3000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ART_DIR = tempfile.mkdtemp(prefix="bench_artifacts_")
+os.environ["AI_ARTIFACT_DIR"] = ART_DIR      # before ai.registry is imported
+
+from benchmarks.startup import _train_artifacts  # noqa: E402
+
+VERDICT_FIELDS = ("ai_veracity", "is_suspicious", "mismatch_reasons")
+
+# (title, description, category) -> (ai_veracity, is_suspicious, mismatch_reasons)
+GOLDEN = [
+    (("xkcdqwrtzp", "There is a deep pothole on the main road near the market", "Road"),
+     ("spam", 1, ["gibberish_title_real_description"])),
+    (("sdfghjklqw", "Water supply has been cut in our locality for three days", "Water"),
+     ("spam", 1, ["gibberish_title_real_description"])),
+    (("Free money offer", "Click now to claim your bonus at http://win.example", "Road"),
+     ("spam", 1, ["title_desc_mismatch"])),
+    (("Join our group", "Message us on whatsapp for the promo code", "Water"),
+     ("spam", 1, ["title_desc_mismatch"])),
+    (("Pothole on road", "Road damaged!!!!!!!! please fix the pothole", "Road"),
+     ("spam", 1, ["title_desc_mismatch"])),
+    (("", "", "Road"),
+     ("spam", 1, [])),
+    # past the rules: decided by fraud_model
+    (("Free rewards offer", "Win free rewards money offer for everyone today", "Water"),
+     ("spam", 1, [])),
+    (("Join now", "Join our channel and win free rewards", "Sanitation"),
+     ("spam", 1, [])),
+    (("Rewards for citizens", "Join the channel for money and rewards offer", "Law & Order"),
+     ("spam", 1, [])),
+    (("Win money", "Win money now join our channel free offer", "Water"),
+     ("spam", 1, [])),
+    # through veracity_model, merged with the mismatch guard
+    (("Pothole on Uripok road", "Big potholes on the main road near Uripok are causing accidents every day.", "Water"),
+     ("fake", 1, ["category_mismatch"])),
+    (("Power cut in Lamphel", "Power outage in Lamphel since last night, voltage keeps fluctuating.", "Sanitation"),
+     ("fake", 1, ["category_mismatch"])),
+    (("Pothole on Uripok road", "Big potholes on the main road near Uripok are causing accidents every day.", "Road"),
+     ("legit", 0, [])),
+    (("No water supply in Khurai", "There has been no water supply in Khurai for three days, the tap is dry.", "Water"),
+     ("legit", 0, [])),
+]
+
+
+def _verdict(result):
+    return tuple(result[f] for f in VERDICT_FIELDS)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reports", type=int, default=3000)
+    ap.add_argument("--batch", type=int, default=64)
+    args = ap.parse_args()
+
+    _train_artifacts(ART_DIR)
+
+    from backend.utils import screening
+    from benchmarks.corpus import make_reports
+
+    failures = 0
+    for (title, desc, cat), expected in GOLDEN:
+        got = screening.screen_report(title, desc, cat)
+        if _verdict(got) != (expected[0], expected[1], expected[2]):
+            failures += 1
+            print(f"⚠️ golden {title!r}: expected {expected}, got {_verdict(got)}")
+    print(f"golden: {len(GOLDEN) - failures}/{len(GOLDEN)} match")
+
+    items = [(t, d, c) for (t, d, c), _ in GOLDEN]
+    items += [(r["title"], r["description"], r["category"]) for r in make_reports(args.reports, seed=21)]
+
+    def run(early_exit):
+        screening.EARLY_EXIT = early_exit
+        t0 = time.perf_counter()
+        single = [screening.screen_report(*it) for it in items]
+        single_ms = (time.perf_counter() - t0) * 1000 / len(items)
+        t0 = time.perf_counter()
+        batched = []
+        for i in range(0, len(items), args.batch):
+            batched += screening.screen_reports(items[i:i + args.batch])
+        batch_ms = (time.perf_counter() - t0) * 1000 / len(items)
+        return single, batched, single_ms, batch_ms
+
+    full, full_b, full_ms, full_b_ms = run(False)
+    for s in screening._stats.values():
+        s.update(reports=0, decided=0, ms=0.0)
+    fast, fast_b, fast_ms, fast_b_ms = run(True)
+
+    for label, a, b in (("single", full, fast), ("batch", full_b, fast_b), ("single vs batch", fast, fast_b)):
+        diff = [i for i, (x, y) in enumerate(zip(a, b)) if _verdict(x) != _verdict(y)]
+        failures += len(diff)
+        print(f"parity ({label}): {len(items) - len(diff)}/{len(items)} identical")
+        for i in diff[:5]:
+            print(f"  ⚠️ {items[i]!r}: {_verdict(a[i])} vs {_verdict(b[i])}")
+
+    print(f"\nper report: all stages {full_ms:.3f}ms single / {full_b_ms:.3f}ms batched, "
+          f"cascade {fast_ms:.3f}ms / {fast_b_ms:.3f}ms")
+    st = screening.stats()
+    print(f"{'stage':<15} {'reports':>8} {'decided':>8} {'hit rate':>9} {'ms/report':>10}")
+    for name in ["featurize", *st["stages"]]:
+        s = st[name]
+        print(f"{name:<15} {s['reports']:>8} {s['decided']:>8} {s['hit_rate']:>9.1%} {s['mean_ms']:>10.4f}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# benchmarks/spatial_index.py
+"""
+Benchmark backend/utils/spatial.GridIndex against the old nearby query.
+
+The "before" path is the previous fetch_nearby_issues SQL (1.5x padded square
+bbox without cos(lat) correction, newest 5 first) run on an in-memory SQLite
+copy of the same points with the (latitude, longitude) index from 0002.
+Exactness is checked against a brute-force haversine over every point.
+
+    python -m benchmarks.spatial_index --points 300000 --queries 2000
+"""
+import argparse
+import sqlite3
+import time
+
+import numpy as np
+
+from backend.utils.spatial import GridIndex, haversine_km
+
+IMPHAL = (24.8170, 93.9368)
+
+
+def make_points(n: int, seed: int = 7):
+    """
+    Clustered like real reports: most around Imphal wards, a tail across the valley.
+    """
+    rng = np.random.default_rng(seed)
+    n_city = int(n * 0.8)
+    centers = np.column_stack([
+        IMPHAL[0] + rng.normal(0, 0.03, 40),
+        IMPHAL[1] + rng.normal(0, 0.03, 40),
+    ])
+    pick = rng.integers(0, len(centers), n_city)
+    city = centers[pick] + rng.normal(0, 0.004, (n_city, 2))
+    valley = np.column_stack([
+        rng.uniform(24.3, 25.3, n - n_city),
+        rng.uniform(93.5, 94.3, n - n_city),
+    ])
+    return np.vstack([city, valley])
+
+
+def _percentiles(samples):
+    a = np.array(samples) * 1000.0
+    return np.percentile(a, 50), np.percentile(a, 95), np.percentile(a, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=300_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--radius", type=float, default=0.5)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    pts = make_points(args.points)
+    ids = np.arange(1, len(pts) + 1)
+    rng = np.random.default_rng(11)
+    queries = pts[rng.integers(0, len(pts), args.queries)] + rng.normal(0, 0.002, (args.queries, 2))
+
+    # ---- build ----
+    t0 = time.perf_counter()
+    index = GridIndex()
+    for i, (lat, lng) in zip(ids.tolist(), pts.tolist()):
+        index.insert(i, lat, lng)
+    build_s = time.perf_counter() - t0
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE issues (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL, timestamp REAL)")
+    conn.executemany(
+        "INSERT INTO issues VALUES (?, ?, ?, ?)",
+        ((int(i), float(a), float(b), float(i)) for i, (a, b) in zip(ids, pts)),
+    )
+    conn.execute("CREATE INDEX ix_issues_lat_lng ON issues (latitude, longitude)")
+
+    # ---- warm NumPy caches once so timings are steady-state ----
+    for lat, lng in queries[:50].tolist():
+        index.within(lat, lng, args.radius)
+
+    # ---- before: bbox SQL ----
+    before = []
+    offset = (args.radius / 111.0) * 1.5
+    for lat, lng in queries.tolist():
+        t = time.perf_counter()
+        conn.execute(
+            """
+            SELECT id FROM issues
+            WHERE latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?
+            ORDER BY timestamp DESC LIMIT 5
+            """,
+            (lat - offset, lat + offset, lng - offset, lng + offset),
+        ).fetchall()
+        before.append(time.perf_counter() - t)
+
+    # ---- after: radius + kNN ----
+    radius_t, radius_all_t, knn_t = [], [], []
+    mismatches = 0
+    check_every = max(1, args.queries // 100)
+    for qi, (lat, lng) in enumerate(queries.tolist()):
+        t = time.perf_counter()
+        index.within(lat, lng, args.radius, limit=args.k)
+        radius_t.append(time.perf_counter() - t)
+
+        t = time.perf_counter()
+        hits = index.within(lat, lng, args.radius)
+        radius_all_t.append(time.perf_counter() - t)
+
+        t = time.perf_counter()
+        nn = index.nearest(lat, lng, k=args.k)
+        knn_t.append(time.perf_counter() - t)
+
+        if qi % check_every == 0:
+            d = haversine_km(lat, lng, pts[:, 0], pts[:, 1])
+            exact_radius = set(ids[d <= args.radius].tolist())
+            exact_knn = np.sort(d)[: args.k]
+            if set(h[0] for h in hits) != exact_radius:
+                mismatches += 1
+            if not np.allclose([h[1] for h in nn], exact_knn):
+                mismatches += 1
+
+    print(f"points={len(pts):,} queries={args.queries:,} radius={args.radius}km k={args.k}")
+    print(f"GridIndex build: {build_s:.2f}s ({len(pts) / build_s:,.0f} inserts/s)\n")
+    print(f"{'query':<32} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, samples in [
+        ("bbox SQL (before, SQLite)", before),
+        (f"GridIndex.within limit={args.k}", radius_t),
+        ("GridIndex.within all hits", radius_all_t),
+        (f"GridIndex.nearest k={args.k}", knn_t),
+    ]:
+        p50, p95, p99 = _percentiles(samples)
+        print(f"{name:<32} {p50:>8.3f} {p95:>8.3f} {p99:>8.3f}")
+    print(f"\nExactness vs brute-force haversine: {'OK' if mismatches == 0 else f'{mismatches} mismatches'}")
+
+
+if __name__ == "__main__":
+    main()
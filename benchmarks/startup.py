@@ -0,0 +1,176 @@
+# benchmarks/startup.py
+"""
+API worker startup: an import-time report for `import backend.main`, and the
+wall time from spawning uvicorn to the first /health 200 and to the first
+scored prediction for each AI_WARMUP mode (eager | background | lazy).
+Models are trained on a synthetic corpus in a temp dir; no database is
+needed (the free-text /api/issues/predict/batch path doesn't touch it).
+
+    python -m benchmarks.startup                     # both reports
+    python -m benchmarks.startup --imports-only --top 20
+
+Exits non-zero if a training-only dependency is imported at serve time.
+"""
+import argparse
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+# never needed to serve; ai/linear_runtime.py covers inference without them
+TRAINING_ONLY = ("sklearn", "scipy", "pandas", "joblib")
+
+MODES = ("eager", "background", "lazy")
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+# ---------- IMPORT TIME ----------
+def import_report(top=15, env=None) -> dict:
+    """
+    Runs `python -X importtime -c "import backend.main"` in a fresh interpreter.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.main"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3))))
+
+    by_package = {}
+    for name, self_us, _, _ in rows:
+        pkg = name.split(".")[0]
+        by_package[pkg] = by_package.get(pkg, 0) + self_us
+    total_us = next(cum for name, _, cum, _ in rows if name == "backend.main")
+    return {
+        "total_ms": total_us / 1000,
+        "modules": len(rows),
+        "packages": sorted(by_package.items(), key=lambda kv: -kv[1])[:top],
+        "training_only": sorted({n.split(".")[0] for n, *_ in rows} & set(TRAINING_ONLY)),
+    }
+
+
+# ---------- SERVER STARTUP ----------
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _request(url, body=None, timeout=30.0):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, json.loads(resp.read())
+
+
+def _wait_health(base, t0, deadline_s=60.0) -> float:
+    while time.perf_counter() - t0 < deadline_s:
+        try:
+            if _request(f"{base}/health", timeout=1.0)[0] == 200:
+                return time.perf_counter() - t0
+        except OSError:
+            time.sleep(0.02)
+    raise RuntimeError("server didn't answer /health")
+
+
+def _rss_mb(pid) -> float:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def startup_run(mode, env) -> dict:
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port), "--log-level", "warning"],
+        env=dict(env, AI_WARMUP=mode), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        health_s = _wait_health(base, t0)
+        rss_at_health = _rss_mb(proc.pid)
+        t1 = time.perf_counter()
+        status, _ = _request(
+            f"{base}/api/issues/predict/batch",
+            {"items": [{"title": "Pothole on main road", "description": "Big potholes near Uripok"}]},
+        )
+        predict_ms = (time.perf_counter() - t1) * 1000
+        first_predict_s = time.perf_counter() - t0
+        if status != 200:
+            raise RuntimeError(f"predict returned {status}")
+        return {
+            "mode": mode,
+            "health_s": health_s,
+            "first_predict_s": first_predict_s,
+            "first_predict_ms": predict_ms,
+            "rss_at_health_mb": rss_at_health,
+            "rss_after_predict_mb": _rss_mb(proc.pid),
+        }
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _train_artifacts(art_dir=None) -> str:
+    import pandas as pd
+
+    from ai.export_linear import export_all
+    from ai.train_shared import train_shared
+    from benchmarks.corpus import make_reports, veracity_rows
+
+    art_dir = art_dir or tempfile.mkdtemp(prefix="bench_artifacts_")
+    reports = make_reports(3000)
+    train_csv = os.path.join(art_dir, "training_data.csv")
+    ver_csv = os.path.join(art_dir, "veracity.csv")
+    pd.DataFrame(reports).to_csv(train_csv, index=False)
+    pd.DataFrame(veracity_rows(reports)).to_csv(ver_csv, index=False)
+    train_shared(train_csv, ver_csv, art_dir=art_dir)
+    export_all(art_dir, os.path.join(art_dir, "numpy"))
+    return art_dir
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--top", type=int, default=12, help="packages in the import report")
+    ap.add_argument("--imports-only", action="store_true")
+    ap.add_argument("--runtime", choices=("sklearn", "numpy"), default="sklearn",
+                    help="AI_RUNTIME for the startup runs")
+    args = ap.parse_args()
+
+    rep = import_report(args.top)
+    print(f"import backend.main: {rep['total_ms']:.0f}ms over {rep['modules']} modules")
+    for pkg, us in rep["packages"]:
+        print(f"  {pkg:<24} {us / 1000:>8.1f}ms")
+    if rep["training_only"]:
+        print(f"⚠️ training-only packages imported at serve time: {', '.join(rep['training_only'])}")
+    else:
+        print(f"✅ none of {', '.join(TRAINING_ONLY)} imported at serve time")
+
+    if not args.imports_only:
+        env = dict(os.environ, AI_ARTIFACT_DIR=_train_artifacts(), AI_RUNTIME=args.runtime)
+        print(f"\nAI_RUNTIME={args.runtime}")
+        print(f"{'AI_WARMUP':<11} {'/health':>9} {'1st predict':>12} {'(request)':>10} {'RSS@health':>11} {'RSS after':>10}")
+        for mode in MODES:
+            r = startup_run(mode, env)
+            print(
+                f"{mode:<11} {r['health_s']:>8.2f}s {r['first_predict_s']:>11.2f}s {r['first_predict_ms']:>8.0f}ms"
+                f" {r['rss_at_health_mb']:>9.0f}MB {r['rss_after_predict_mb']:>8.0f}MB"
+            )
+
+    sys.exit(1 if rep["training_only"] else 0)
+
+
+if __name__ == "__main__":
+    main()
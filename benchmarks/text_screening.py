@@ -0,0 +1,179 @@
+# benchmarks/text_screening.py
+"""
+Per-report cost of the rule-based screening checks: the previous detectors
+(reproduced below, one re.search per pattern and a fresh lowercase /
+tokenize / vowel count in every function) vs ai/text_stats.py (one cached
+analysis per text, spam patterns as one compiled alternation).
+
+A "report" is what screening runs on each submission: mismatch_guard over
+title and description, the spam heuristic and the veracity gibberish rule
+over title + description. Also checks that every detector agrees with its
+previous version on the whole corpus.
+
+    python -m benchmarks.text_screening --reports 5000
+"""
+import argparse
+import re
+import time
+
+from ai import text_stats
+from backend.utils import screening
+from benchmarks.corpus import make_reports
+
+
+# ---------- PREVIOUS DETECTORS ----------
+def _old_basic_spam_heuristic(text):
+    t = (text or "").lower().strip()
+    if not t:
+        return True
+    for pat in text_stats.SPAM_PATTERNS:
+        if re.search(pat, t):
+            return True
+    if re.search(r"(.)\1{5,}", t):
+        return True
+    letters = re.sub(r"[^a-z]", "", t)
+    if len(letters) >= 10:
+        vowels = sum(1 for c in letters if c in "aeiou")
+        if vowels / len(letters) < 0.25:
+            return True
+        if re.search(r"[bcdfghjklmnpqrstvwxyz]{7,}", letters):
+            return True
+    words = re.findall(r"[a-z]+", t)
+    if len(words) == 1 and len(words[0]) >= 10:
+        return True
+    if len(t) < 12 and len(words) <= 1:
+        return True
+    return False
+
+
+def _old_looks_like_gibberish(text):
+    t = (text or "").strip().lower()
+    if not t:
+        return True
+    tokens = re.findall(r"[a-zA-Z]+", t)
+    if len(tokens) == 1:
+        w = tokens[0]
+        if len(w) >= 9:
+            vowels = sum(1 for c in w if c in "aeiou")
+            if vowels / max(len(w), 1) < 0.22:
+                return True
+            if re.search(r"[bcdfghjklmnpqrstvwxyz]{6,}", w):
+                return True
+    letters = sum(ch.isalpha() for ch in t)
+    nonspace = sum(not ch.isspace() for ch in t)
+    if nonspace > 0 and letters / nonspace < 0.55:
+        return True
+    return False
+
+
+def _old_veracity_gibberish(text):
+    t = (text or "").strip().lower()
+    if len(t) < 8:
+        return True
+    if re.search(r"(.)\1{5,}", t):
+        return True
+    letters = sum(ch.isalpha() for ch in t)
+    if letters / max(len(t), 1) < 0.35:
+        return True
+    return False
+
+
+def _old_normalize_tokens(text):
+    text = (text or "").lower()
+    text = re.sub(r"[^a-z0-9\s]", " ", text)
+    return [t for t in text.split() if len(t) >= 3]
+
+
+def _old_screen_gibberish(text):
+    t = (text or "").strip()
+    if not t or len(t) < 8:
+        return True
+    toks = _old_normalize_tokens(t)
+    if len(toks) == 0:
+        return True
+    bad = 0
+    for tok in toks[:20]:
+        if sum(1 for c in tok if c in "aeiou") / max(len(tok), 1) < 0.20:
+            bad += 1
+    if bad / max(len(toks[:20]), 1) >= 0.60:
+        return True
+    if re.search(r"(.)\1{5,}", t.lower()):
+        return True
+    return False
+
+
+def _old_mismatch_guard(title, desc, category):
+    reasons = []
+    title_gib, desc_gib = _old_screen_gibberish(title), _old_screen_gibberish(desc)
+    if title_gib and not desc_gib:
+        return True, ["gibberish_title_real_description"], True
+    t_tokens, d_tokens = set(_old_normalize_tokens(title)), set(_old_normalize_tokens(desc))
+    if (not _old_screen_gibberish(title)) and _old_screen_gibberish(desc):
+        reasons.append("title_desc_mismatch")
+    elif len(t_tokens) >= 2 and len(d_tokens) >= 4 and len(t_tokens & d_tokens) / len(t_tokens) < 0.15:
+        reasons.append("title_desc_mismatch")
+    cat = (category or "").strip()
+    if cat in screening.CATEGORY_KEYWORDS:
+        tokens = set(_old_normalize_tokens(f"{title} {desc}"))
+        if not tokens & screening.CATEGORY_KEYWORDS[cat]:
+            best = max(len(tokens & kw) for c, kw in screening.CATEGORY_KEYWORDS.items() if c != cat)
+            if best >= 2:
+                reasons.append("category_mismatch")
+    if not title_gib and (desc or "").strip() and len((desc or "").strip()) < 12:
+        reasons.append("description_too_short")
+    return bool(reasons), reasons, False
+
+
+# ---------- RUN ----------
+def _old_report(t, d, c):
+    text = f"{t} {d}".strip()
+    return _old_mismatch_guard(t, d, c), _old_basic_spam_heuristic(text), _old_veracity_gibberish(text)
+
+
+def _new_report(t, d, c):
+    text = f"{t} {d}".strip()
+    return screening.mismatch_guard(t, d, c), text_stats.is_spam_text(text), text_stats.is_short_or_symbolic(text)
+
+
+def _time(fn, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        text_stats.analyze.cache_clear()
+        t0 = time.perf_counter()
+        for it in items:
+            fn(*it)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e6 / len(items)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reports", type=int, default=5000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    items = [(r["title"], r["description"], r["category"]) for r in make_reports(args.reports, seed=3)]
+    texts = [f"{t} {d}".strip() for t, d, _ in items] + [t for t, _, _ in items] + [d for _, d, _ in items]
+
+    mismatches = 0
+    for old, new in (
+        (_old_basic_spam_heuristic, text_stats.is_spam_text),
+        (_old_looks_like_gibberish, text_stats.looks_like_junk_word),
+        (_old_veracity_gibberish, text_stats.is_short_or_symbolic),
+        (_old_screen_gibberish, text_stats.is_gibberish_field),
+    ):
+        diff = sum(old(t) != new(t) for t in texts)
+        mismatches += diff
+        print(f"{new.__name__:<22} {len(texts) - diff}/{len(texts)} agree with the previous detector")
+    diff = sum(_old_report(*it) != _new_report(*it) for it in items)
+    mismatches += diff
+    print(f"{'full report':<22} {len(items) - diff}/{len(items)} agree")
+
+    old_us = _time(_old_report, items, args.repeat)
+    new_us = _time(_new_report, items, args.repeat)
+    print(f"\nper report: previous {old_us:.1f}µs, one-pass {new_us:.1f}µs ({old_us / new_us:.1f}x)")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
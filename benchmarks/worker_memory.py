@@ -0,0 +1,66 @@
+# benchmarks/worker_memory.py
+"""
+Memory of an N-worker server: `uvicorn --workers N` (every worker loads its
+own models) vs `python -m backend.serve --workers N` (loaded once, forked),
+for both AI_RUNTIME=sklearn and AI_RUNTIME=numpy. After startup each server
+answers --requests predictions, then the whole process tree is summed from
+/proc/<pid>/smaps_rollup; PSS counts each shared page once.
+
+    python -m benchmarks.worker_memory --workers 4
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from backend.serve import memory_report
+from benchmarks.startup import _free_port, _request, _train_artifacts, _wait_health
+
+
+def _run(kind, runtime, workers, requests, art_dir) -> list[dict]:
+    port = _free_port()
+    if kind == "uvicorn":
+        cmd = [sys.executable, "-m", "uvicorn", "backend.main:app", "--workers", str(workers)]
+    else:
+        cmd = [sys.executable, "-m", "backend.serve", "--workers", str(workers)]
+    cmd += ["--port", str(port), "--log-level", "warning"]
+    env = dict(os.environ, AI_ARTIFACT_DIR=art_dir, AI_RUNTIME=runtime, AI_WARMUP="eager")
+    base = f"http://127.0.0.1:{port}"
+
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_health(base, t0)
+        body = {"items": [{"title": "Pothole on main road", "description": "Big potholes near Uripok"}]}
+        for _ in range(requests):
+            _request(f"{base}/api/issues/predict/batch", body)
+        time.sleep(0.5)
+        return memory_report(proc.pid)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=15)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--requests", type=int, default=200)
+    args = ap.parse_args()
+
+    art_dir = _train_artifacts()
+    print(f"\n{args.workers} workers, {args.requests} predictions each run")
+    print(f"{'runtime':<8} {'server':<14} {'procs':>5} {'RSS sum':>9} {'PSS sum':>9} {'worker private':>15}")
+    for runtime in ("sklearn", "numpy"):
+        for kind in ("uvicorn", "backend.serve"):
+            rows = _run(kind, runtime, args.workers, args.requests, art_dir)
+            workers = [r for r in rows if r["role"] == "worker"]
+            private = sum(r["private_mb"] for r in workers) / max(len(workers), 1)
+            print(
+                f"{runtime:<8} {kind:<14} {len(rows):>5} {sum(r['rss_mb'] for r in rows):>8.0f}M"
+                f" {sum(r['pss_mb'] for r in rows):>8.0f}M {private:>13.0f}M"
+            )
+
+
+if __name__ == "__main__":
+    main()
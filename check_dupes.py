@@ -1,28 +1,25 @@
-from backend.utils import db_utils
+import argparse
 
-def check_duplicates():
-    issues = db_utils.fetch_issues()
-    seen = {}
+from backend.utils import db_utils, dedupe
+
+def check_duplicates(threshold=dedupe.CLEANUP_THRESHOLD, delete=False):
+    # Streams the table through the MinHash/LSH index (indexing unsigned issues
+    # on the way) instead of loading every issue into memory.
     duplicates = []
-    
-    for issue in issues:
-        # Key by title + description to find duplicates
-        key = (issue['title'], issue['description'], issue['category'])
-        if key in seen:
-            duplicates.append(issue)
-        else:
-            seen[key] = issue
-            
-    print(f"Total Issues: {len(issues)}")
+    for dup_id, original_id, score in dedupe.scan_duplicates(threshold=threshold):
+        duplicates.append(dup_id)
+        print(f"Duplicate: ID {dup_id} ~ ID {original_id} (similarity {score:.2f})")
+
     print(f"Duplicates Found: {len(duplicates)}")
-    
-    if duplicates:
-        print("Duplicate IDs:", [d['id'] for d in duplicates])
-        
-        # Determine if we should delete them
-        # For now just list them
-        for d in duplicates:
-             print(f"Duplicate: ID {d['id']} - {d['title']}")
+
+    if duplicates and delete:
+        for i in range(0, len(duplicates), 500):
+            db_utils.delete_issues(duplicates[i:i + 500])
+        print(f"Deleted {len(duplicates)} duplicate issue(s)")
 
 if __name__ == "__main__":
-    check_duplicates()
+    parser = argparse.ArgumentParser(description="Find near-duplicate issue reports")
+    parser.add_argument("--threshold", type=float, default=dedupe.CLEANUP_THRESHOLD)
+    parser.add_argument("--delete", action="store_true", help="delete the duplicates found")
+    args = parser.parse_args()
+    check_duplicates(args.threshold, args.delete)
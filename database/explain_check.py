@@ -0,0 +1,199 @@
+# database/explain_check.py
+"""
+EXPLAIN every query issued by backend/utils/db_utils.py (and the inline SQL
+left in the routes) and fail if any of them falls back to a full table scan.
+
+    python -m database.explain_check                    # MySQL
+    python -m database.explain_check --dialect sqlite   # database/issues.db
+
+Keep QUERIES in sync when a helper's SQL changes.
+"""
+import argparse
+import sys
+
+from database.migrate import SQLITE_PATH, connect, migrate
+
+TS = "2025-01-01 00:00:00"
+
+# (helper, sql, params)
+QUERIES = [
+    ("verify_user_password", """
+        SELECT u.id, u.name, u.email, u.mobile, a.password_hash
+        FROM users u JOIN user_auth a ON u.id = a.user_id
+        WHERE u.mobile=%s OR u.email=%s LIMIT 1
+     """, ("9876543210", "a@b.c")),
+    ("delete_user/user_auth", "DELETE FROM user_auth WHERE user_id=%s", (1,)),
+    ("delete_user/issues", "DELETE FROM issues WHERE user_id=%s", (1,)),
+    ("delete_user/users", "DELETE FROM users WHERE id=%s", (1,)),
+    ("get_user_by_id", "SELECT id, name, email, mobile FROM users WHERE id=%s", (1,)),
+    ("fetch_issues_page", "SELECT * FROM issues ORDER BY timestamp DESC, id DESC LIMIT %s", (101,)),
+    ("fetch_issues_page/cursor", """
+        SELECT * FROM issues
+        WHERE (timestamp < %s OR (timestamp = %s AND id < %s))
+        ORDER BY timestamp DESC, id DESC LIMIT %s
+     """, (TS, TS, 50, 101)),
+    ("fetch_issues_page/user", """
+        SELECT * FROM issues WHERE user_id=%s
+        ORDER BY timestamp DESC, id DESC LIMIT %s
+     """, (1, 101)),
+    ("fetch_issues_page/department", """
+        SELECT * FROM issues
+        WHERE department_id=%s AND approved_by_admin=1
+        ORDER BY timestamp DESC, id DESC LIMIT %s
+     """, (1, 101)),
+    ("fetch_issues_page/department/cursor", """
+        SELECT * FROM issues
+        WHERE department_id=%s AND approved_by_admin=1
+        AND (timestamp < %s OR (timestamp = %s AND id < %s))
+        ORDER BY timestamp DESC, id DESC LIMIT %s
+     """, (1, TS, TS, 50, 101)),
+    ("fetch_issues", "SELECT * FROM issues ORDER BY timestamp DESC, id DESC", ()),
+    ("fetch_issues/user", "SELECT * FROM issues WHERE user_id=%s ORDER BY timestamp DESC, id DESC", (1,)),
+    ("get_issue_by_id", """
+        SELECT i.*, u.name as user_name, u.mobile as user_mobile, u.email as user_email
+        FROM issues i LEFT JOIN users u ON i.user_id = u.id WHERE i.id=%s
+     """, (1,)),
+    ("update_ai_fields", "UPDATE issues SET ai_category=%s, ai_severity=%s WHERE id=%s", ("Road", 3, 1)),
+    ("update_admin_decision", """
+        UPDATE issues SET approved_by_admin=%s, assigned_department=%s, department_id=%s,
+        admin_comment=%s, status=%s WHERE id=%s
+     """, (1, "PWD", 2, "", "In Progress", 1)),
+    ("update_admin_decision/log", """
+        INSERT INTO admin_decisions (issue_id, label, decided_at) VALUES (%s, %s, %s)
+     """, (1, 0, TS)),
+    ("iter_admin_decisions", """
+        SELECT d.id, i.title, i.description, d.label
+        FROM admin_decisions d JOIN issues i ON i.id = d.issue_id
+        WHERE d.id > %s ORDER BY d.id LIMIT %s
+     """, (0, 1000)),
+    ("iter_issue_points", "SELECT id, latitude, longitude FROM issues WHERE id > %s ORDER BY id LIMIT %s", (0, 5000)),
+    ("fetch_issues_by_ids", "SELECT id, title, timestamp, category FROM issues WHERE id IN (%s, %s, %s)", (1, 2, 3)),
+    ("fetch_heat_points", """
+        SELECT latitude, longitude, COALESCE(ai_severity, severity, 1) FROM issues
+        WHERE latitude BETWEEN %s AND %s AND longitude BETWEEN %s AND %s
+        AND category IN (%s) AND status IN (%s, %s) AND timestamp >= %s
+     """, (24.7, 24.9, 93.8, 94.0, "Road", "Pending", "In Progress", TS)),
+    ("iter_issue_texts", """
+        SELECT id, user_id, title, description, category, latitude, longitude
+        FROM issues WHERE id > %s ORDER BY id LIMIT %s
+     """, (0, 1000)),
+    ("delete_issues/bands", "DELETE FROM issue_lsh_bands WHERE issue_id IN (%s, %s)", (1, 2)),
+    ("delete_issues/signatures", "DELETE FROM issue_signatures WHERE issue_id IN (%s, %s)", (1, 2)),
+    ("delete_issues/issues", "DELETE FROM issues WHERE id IN (%s, %s)", (1, 2)),
+    ("delete_user/bands", """
+        DELETE FROM issue_lsh_bands WHERE issue_id IN (SELECT issue_id FROM issue_signatures WHERE user_id=%s)
+     """, (1,)),
+    ("fetch_signed_ids", "SELECT issue_id FROM issue_signatures WHERE issue_id IN (%s, %s)", (1, 2)),
+    ("fetch_signature_candidates", """
+        SELECT s.issue_id, s.user_id, s.text_hash, s.signature, i.category, i.latitude, i.longitude
+        FROM issue_signatures s JOIN issues i ON i.id = s.issue_id
+        WHERE s.issue_id IN (
+            SELECT DISTINCT issue_id FROM issue_lsh_bands WHERE band_key IN (%s, %s, %s)
+        ) AND s.user_id=%s AND s.issue_id < %s
+        ORDER BY s.issue_id DESC LIMIT %s
+     """, (1, 2, 3, 1, 100, 200)),
+    ("update_ai_fields_many", "UPDATE issues SET ai_category=%s, ai_severity=%s WHERE id=%s", ("Road", 3, 1)),
+    ("iter_unpredicted_issues", """
+        SELECT id, title, description FROM issues
+        WHERE id > %s AND ai_category IS NULL ORDER BY id LIMIT %s
+     """, (0, 1000)),
+    ("get_watermark", "SELECT last_id FROM job_watermarks WHERE job=%s", ("ai_predictions",)),
+    ("set_watermark", "UPDATE job_watermarks SET last_id=%s, updated_at=%s WHERE job=%s", (1, TS, "ai_predictions")),
+    ("update_screening_many", """
+        UPDATE issues SET ai_veracity=%s, is_suspicious=%s,
+            ai_category=COALESCE(%s, ai_category), ai_severity=COALESCE(%s, ai_severity)
+        WHERE id=%s
+     """, ("legit", 0, "Road", 3, 1)),
+    ("claim_pending_screening/select", """
+        SELECT id FROM issues
+        WHERE ai_veracity=%s AND (screen_lease_until IS NULL OR screen_lease_until < %s)
+        ORDER BY id LIMIT %s
+     """, ("pending", TS, 1000)),
+    ("claim_pending_screening/claim", """
+        UPDATE issues SET screen_claim=%s, screen_lease_until=%s
+        WHERE id IN (%s, %s) AND ai_veracity=%s AND (screen_lease_until IS NULL OR screen_lease_until < %s)
+     """, ("token", TS, 1, 2, "pending", TS)),
+    ("claim_pending_screening/rows", """
+        SELECT id, title, description, category FROM issues WHERE id IN (%s, %s) AND screen_claim=%s ORDER BY id
+     """, (1, 2, "token")),
+    ("release_screening", """
+        UPDATE issues SET screen_claim=NULL, screen_lease_until=NULL WHERE id IN (%s, %s) AND ai_veracity=%s
+     """, (1, 2, "pending")),
+    ("update_issue_status", "UPDATE issues SET status=%s WHERE id=%s", ("Resolved", 1)),
+    ("get_department_by_username", "SELECT * FROM departments WHERE username=%s", ("pwd",)),
+    ("fetch_departments", "SELECT * FROM departments", ()),
+    ("resolve_department_id", "SELECT department_id FROM department_aliases WHERE alias=%s", ("sanitation",)),
+    ("get_admin_by_username", "SELECT * FROM admins WHERE username=%s", ("admin",)),
+    ("auth.send_otp", "SELECT id FROM users WHERE mobile=%s", ("9876543210",)),
+]
+
+# Deliberate full reads of small lookup tables.
+ALLOW_FULL_SCAN = {
+    "fetch_departments",
+}
+
+
+def _explain_sqlite(cur, sql, params):
+    cur.execute("EXPLAIN QUERY PLAN " + sql.replace("%s", "?"), params)
+    details = [row[-1] for row in cur.fetchall()]
+    problems = [
+        d for d in details
+        if d.startswith("SCAN ") and "USING INDEX" not in d
+        and "USING COVERING INDEX" not in d and "USING INTEGER PRIMARY KEY" not in d
+    ]
+    return details, problems
+
+
+def _explain_mysql(cur, sql, params):
+    cur.execute("EXPLAIN " + sql, params)
+    cols = [c[0] for c in cur.description]
+    rows = [dict(zip(cols, r)) for r in cur.fetchall()]
+    details = [
+        f"{r.get('table')}: type={r.get('type')} possible_keys={r.get('possible_keys')} "
+        f"key={r.get('key')} extra={r.get('Extra')}"
+        for r in rows
+    ]
+    # a full scan fails whether or not the optimizer had candidate keys to reject
+    problems = [d for d, r in zip(details, rows) if r.get("type") == "ALL"]
+    return details, problems
+
+
+def check(conn, dialect: str, verbose: bool = True) -> list[str]:
+    explain = _explain_sqlite if dialect == "sqlite" else _explain_mysql
+    cur = conn.cursor()
+    failures = []
+    for name, sql, params in QUERIES:
+        details, problems = explain(cur, " ".join(sql.split()), params)
+        ok = not problems or name in ALLOW_FULL_SCAN
+        if verbose:
+            print(f"{'✅' if ok else '❌'} {name}")
+            for d in details:
+                print(f"     {d}")
+        if not ok:
+            failures.append(name)
+    cur.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that db_utils queries use indexes")
+    parser.add_argument("--dialect", choices=["mysql", "sqlite"], default="mysql")
+    parser.add_argument("--sqlite-path", default=SQLITE_PATH)
+    args = parser.parse_args()
+
+    conn = connect(args.dialect, args.sqlite_path)
+    try:
+        if args.dialect == "sqlite":
+            migrate(conn, args.dialect, verbose=False)
+        failures = check(conn, args.dialect)
+    finally:
+        conn.close()
+
+    if failures:
+        print(f"\n❌ {len(failures)} query(s) without an index: {failures}")
+        sys.exit(1)
+    print(f"\n✅ All {len(QUERIES)} queries use an index")
+
+
+if __name__ == "__main__":
+    main()
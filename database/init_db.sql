@@ -0,0 +1,65 @@
+-- database/init_db.sql
+-- Base schema for a fresh MySQL database:
+--   mysql -u root -p issue_mapper < database/init_db.sql
+-- then bring it up to date (indexes and later changes):
+--   python -m database.migrate
+-- Mirrors database/migrations/mysql/0001_initial_schema.sql.
+
+CREATE TABLE IF NOT EXISTS users (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100),
+    email VARCHAR(255),
+    mobile VARCHAR(20)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS user_auth (
+    user_id INT PRIMARY KEY,
+    password_hash VARCHAR(255) NOT NULL,
+    created_at DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS admins (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    username VARCHAR(100) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    email VARCHAR(255),
+    created_at DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS departments (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    department_name VARCHAR(150) NOT NULL,
+    username VARCHAR(100) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    created_at DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS issues (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    category VARCHAR(50),
+    latitude DOUBLE,
+    longitude DOUBLE,
+    address VARCHAR(255),
+    severity INT DEFAULT 1,
+    status VARCHAR(30) DEFAULT 'Pending',
+    timestamp DATETIME NOT NULL,
+    user_id INT,
+    ai_category VARCHAR(50),
+    ai_severity INT,
+    assigned_department VARCHAR(150),
+    approved_by_admin TINYINT DEFAULT 0,
+    admin_comment TEXT,
+    ai_veracity VARCHAR(20),
+    is_suspicious TINYINT DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    applied_at DATETIME NOT NULL
+);
+
+INSERT IGNORE INTO schema_migrations (version, name, applied_at)
+VALUES (1, 'initial_schema', NOW());
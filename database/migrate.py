@@ -0,0 +1,203 @@
+# database/migrate.py
+"""
+Versioned schema migrations for MySQL and the SQLite stand-in.
+
+Migrations live in database/migrations/:
+  - <dialect>/NNNN_name.sql   plain DDL, one file per dialect
+  - NNNN_name.py              shared, defines upgrade(ctx) (see MigrationContext)
+
+Applied versions are recorded in schema_migrations.
+
+    python -m database.migrate                       # MySQL from db_utils.db_config
+    python -m database.migrate --dialect sqlite      # database/issues.db
+    python -m database.migrate --status
+"""
+import argparse
+import importlib.util
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+SQLITE_PATH = os.path.join(os.path.dirname(__file__), "issues.db")
+
+_NAME_RE = re.compile(r"^(\d{4})_([a-z0-9_]+)\.(sql|py)$")
+
+
+# ---------- DISCOVERY ----------
+def discover(dialect: str) -> list[tuple[int, str, str]]:
+    """
+    Returns [(version, name, path)] sorted by version.
+    A version may be either shared .py or per-dialect .sql, never both.
+    """
+    found = {}
+    for folder in (MIGRATIONS_DIR, os.path.join(MIGRATIONS_DIR, dialect)):
+        for fname in os.listdir(folder):
+            m = _NAME_RE.match(fname)
+            if not m:
+                continue
+            if m.group(3) == "sql" and folder == MIGRATIONS_DIR:
+                continue
+            version = int(m.group(1))
+            if version in found:
+                raise RuntimeError(f"Duplicate migration version {version}: {fname}")
+            found[version] = (version, m.group(2), os.path.join(folder, fname))
+    return [found[v] for v in sorted(found)]
+
+
+# ---------- CONTEXT ----------
+class MigrationContext:
+    """
+    What a .py migration gets: a cursor plus dialect-aware helpers.
+    SQL is written with %s placeholders and translated for SQLite.
+    """
+
+    def __init__(self, conn, dialect: str):
+        self.conn = conn
+        self.dialect = dialect
+        self.cursor = conn.cursor()
+
+    def execute(self, sql: str, params=()):
+        if self.dialect == "sqlite":
+            sql = sql.replace("%s", "?")
+        self.cursor.execute(sql, tuple(params))
+        return self.cursor
+
+    def executemany(self, sql: str, rows):
+        if self.dialect == "sqlite":
+            sql = sql.replace("%s", "?")
+        self.cursor.executemany(sql, rows)
+
+    def fetchall(self, sql: str, params=()):
+        return self.execute(sql, params).fetchall()
+
+    def column_exists(self, table: str, column: str) -> bool:
+        if self.dialect == "sqlite":
+            return any(row[1] == column for row in self.fetchall(f"PRAGMA table_info({table})"))
+        rows = self.fetchall(
+            """
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+            """,
+            (table, column),
+        )
+        return bool(rows)
+
+    def index_exists(self, table: str, name: str) -> bool:
+        if self.dialect == "sqlite":
+            return any(row[1] == name for row in self.fetchall(f"PRAGMA index_list({table})"))
+        rows = self.fetchall(
+            """
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+            """,
+            (table, name),
+        )
+        return bool(rows)
+
+    def add_column(self, table: str, column: str, mysql_type: str, sqlite_type: str):
+        if self.column_exists(table, column):
+            return
+        col_type = sqlite_type if self.dialect == "sqlite" else mysql_type
+        self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}")
+
+    def create_index(self, table: str, name: str, columns: list[str], unique: bool = False):
+        if self.index_exists(table, name):
+            return
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        self.execute(f"CREATE {kind} {name} ON {table} ({', '.join(columns)})")
+
+
+# ---------- RUNNER ----------
+def _split_sql(script: str) -> list[str]:
+    lines = [l for l in script.splitlines() if not l.strip().startswith("--")]
+    return [s.strip() for s in "\n".join(lines).split(";") if s.strip()]
+
+
+def _ensure_version_table(ctx: MigrationContext):
+    ctx.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            applied_at DATETIME NOT NULL
+        )
+        """
+    )
+    ctx.conn.commit()
+
+
+def applied_versions(ctx: MigrationContext) -> set[int]:
+    _ensure_version_table(ctx)
+    return {row[0] for row in ctx.fetchall("SELECT version FROM schema_migrations")}
+
+
+def _apply(ctx: MigrationContext, version: int, name: str, path: str):
+    if path.endswith(".sql"):
+        with open(path, encoding="utf-8") as f:
+            for statement in _split_sql(f.read()):
+                ctx.execute(statement)
+    else:
+        spec = importlib.util.spec_from_file_location(f"migration_{version:04d}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.upgrade(ctx)
+
+    ctx.execute(
+        "INSERT INTO schema_migrations (version, name, applied_at) VALUES (%s, %s, %s)",
+        (version, name, datetime.now()),
+    )
+    ctx.conn.commit()
+
+
+def migrate(conn, dialect: str, target: int | None = None, verbose: bool = True) -> list[int]:
+    """
+    Applies every pending migration up to `target` (inclusive).
+    Returns the versions that were applied.
+    """
+    ctx = MigrationContext(conn, dialect)
+    done = applied_versions(ctx)
+    applied = []
+    for version, name, path in discover(dialect):
+        if version in done or (target is not None and version > target):
+            continue
+        if verbose:
+            print(f"→ applying {version:04d}_{name}")
+        _apply(ctx, version, name, path)
+        applied.append(version)
+    return applied
+
+
+def connect(dialect: str, sqlite_path: str = SQLITE_PATH):
+    if dialect == "sqlite":
+        return sqlite3.connect(sqlite_path)
+    import mysql.connector
+    from backend.utils.db_utils import db_config
+    return mysql.connector.connect(**db_config)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply database migrations")
+    parser.add_argument("--dialect", choices=["mysql", "sqlite"], default="mysql")
+    parser.add_argument("--sqlite-path", default=SQLITE_PATH)
+    parser.add_argument("--target", type=int, default=None)
+    parser.add_argument("--status", action="store_true", help="list migrations without applying")
+    args = parser.parse_args()
+
+    conn = connect(args.dialect, args.sqlite_path)
+    try:
+        if args.status:
+            done = applied_versions(MigrationContext(conn, args.dialect))
+            for version, name, _ in discover(args.dialect):
+                mark = "✅" if version in done else "  "
+                print(f"{mark} {version:04d}_{name}")
+            return
+        applied = migrate(conn, args.dialect, target=args.target)
+        print(f"✅ Applied {len(applied)} migration(s)" if applied else "✅ Schema up to date")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+# 0002: secondary indexes for the lookups in backend/utils/db_utils.py.
+# Written as a .py migration so it also indexes tables that predate 0001.
+
+INDEXES = [
+    # (table, index name, columns)
+    ("issues", "ix_issues_user_ts", ["user_id", "timestamp", "id"]),   # citizen dashboard page
+    ("issues", "ix_issues_ts", ["timestamp", "id"]),                    # keyset listing
+    ("issues", "ix_issues_dept_approved", ["assigned_department", "approved_by_admin"]),
+    ("issues", "ix_issues_lat_lng", ["latitude", "longitude"]),         # nearby bbox
+    ("users", "ix_users_mobile", ["mobile"]),
+    ("users", "ix_users_email", ["email"]),
+    ("departments", "ix_departments_username", ["username"]),
+    ("admins", "ix_admins_username", ["username"]),
+]
+
+
+def upgrade(ctx):
+    for table, name, columns in INDEXES:
+        ctx.create_index(table, name, columns)
@@ -0,0 +1,77 @@
+# 0003: normalise issue -> department assignment to a department id.
+# department_aliases maps a normalised name ("sanitation") to departments.id so
+# "Sanitation" vs "Sanitation Department" is resolved once, when an admin
+# assigns the issue, instead of by substring matching on every portal request.
+# Existing assignments are backfilled with the old matching rule.
+
+import re
+
+# frozen copy of db_utils.normalize_department as of this migration: later
+# edits to the app helper must not change what 0003 does on a fresh database
+_AFFIX_RE = re.compile(r"^(department|dept) of |( (department|dept))$")
+
+
+def normalize_department(name) -> str:
+    key = " ".join(re.sub(r"[^a-z0-9]+", " ", (name or "").lower()).split())
+    return _AFFIX_RE.sub("", key).strip() or key
+
+ALIAS_TABLE = {
+    "mysql": """
+        CREATE TABLE IF NOT EXISTS department_aliases (
+            alias VARCHAR(150) PRIMARY KEY,
+            department_id INT NOT NULL
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    "sqlite": """
+        CREATE TABLE IF NOT EXISTS department_aliases (
+            alias TEXT PRIMARY KEY,
+            department_id INTEGER NOT NULL
+        )
+    """,
+}
+
+
+def _legacy_match(assigned, departments):
+    # the substring rule department.dept_get_issues used to apply per request
+    hits = [
+        dept_id for dept_id, name in departments
+        if assigned == name or assigned in name or name in assigned
+    ]
+    return hits[0] if len(hits) == 1 else None
+
+
+def upgrade(ctx):
+    ctx.execute(ALIAS_TABLE[ctx.dialect])
+    ctx.add_column("issues", "department_id", "INT NULL", "INTEGER")
+
+    departments = ctx.fetchall("SELECT id, department_name FROM departments ORDER BY id")
+    aliases = {}
+    for dept_id, name in departments:
+        aliases.setdefault(normalize_department(name), dept_id)
+
+    assigned = ctx.fetchall(
+        "SELECT DISTINCT assigned_department FROM issues WHERE assigned_department IS NOT NULL"
+    )
+    for (name,) in assigned:
+        key = normalize_department(name)
+        if not key:
+            continue
+        dept_id = aliases.get(key) or _legacy_match(name, departments)
+        if dept_id is None:
+            print(f"   ⚠️ no department for assigned_department={name!r}, left unlinked")
+            continue
+        aliases.setdefault(key, dept_id)
+        ctx.execute(
+            "UPDATE issues SET department_id=%s WHERE assigned_department=%s",
+            (dept_id, name),
+        )
+
+    existing = {row[0] for row in ctx.fetchall("SELECT alias FROM department_aliases")}
+    ctx.executemany(
+        "INSERT INTO department_aliases (alias, department_id) VALUES (%s, %s)",
+        [(k, v) for k, v in aliases.items() if k not in existing],
+    )
+
+    # the department portal list: WHERE department_id=? AND approved_by_admin=1
+    # ORDER BY timestamp DESC, id DESC
+    ctx.create_index("issues", "ix_issues_dept_ts", ["department_id", "approved_by_admin", "timestamp", "id"])
@@ -0,0 +1,51 @@
+# 0004: near-duplicate index used by backend/utils/dedupe.py.
+# issue_signatures holds one MinHash signature + normalised-text hash per issue;
+# issue_lsh_bands holds one row per LSH band so candidates are an indexed
+# lookup instead of a scan. issues.duplicate_of records the submit-time flag.
+# Existing issues are indexed by `python check_dupes.py` / the admin cleanup.
+
+TABLES = {
+    "mysql": [
+        """
+        CREATE TABLE IF NOT EXISTS issue_signatures (
+            issue_id INT PRIMARY KEY,
+            user_id INT,
+            text_hash CHAR(16) NOT NULL,
+            signature VARBINARY(512) NOT NULL
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS issue_lsh_bands (
+            band_key BIGINT NOT NULL,
+            issue_id INT NOT NULL,
+            PRIMARY KEY (band_key, issue_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """,
+    ],
+    "sqlite": [
+        """
+        CREATE TABLE IF NOT EXISTS issue_signatures (
+            issue_id INTEGER PRIMARY KEY,
+            user_id INTEGER,
+            text_hash TEXT NOT NULL,
+            signature BLOB NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS issue_lsh_bands (
+            band_key INTEGER NOT NULL,
+            issue_id INTEGER NOT NULL,
+            PRIMARY KEY (band_key, issue_id)
+        )
+        """,
+    ],
+}
+
+
+def upgrade(ctx):
+    for ddl in TABLES[ctx.dialect]:
+        ctx.execute(ddl)
+    ctx.create_index("issue_signatures", "ix_issue_signatures_hash", ["text_hash"])
+    ctx.create_index("issue_signatures", "ix_issue_signatures_user", ["user_id"])
+    ctx.create_index("issue_lsh_bands", "ix_issue_lsh_bands_issue", ["issue_id"])
+    ctx.add_column("issues", "duplicate_of", "INT NULL", "INTEGER")
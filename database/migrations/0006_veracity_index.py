@@ -0,0 +1,6 @@
+# 0006: lets backend/utils/inference_queue.py find submissions left "pending"
+# by a restart without scanning the issues table.
+
+
+def upgrade(ctx):
+    ctx.create_index("issues", "ix_issues_veracity", ["ai_veracity", "id"])
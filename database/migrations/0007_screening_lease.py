@@ -0,0 +1,11 @@
+# 0007: claims on submissions waiting for background scoring.
+# With several workers (backend/serve.py) each one's inference queue must
+# only reload "pending" rows nobody is scoring: a worker claims rows by
+# writing its token and a lease expiry, and the others skip them until the
+# lease runs out (the claiming worker died or gave up on them).
+# The sweep reads WHERE ai_veracity='pending', served by ix_issues_veracity.
+
+
+def upgrade(ctx):
+    ctx.add_column("issues", "screen_claim", "VARCHAR(32) NULL", "TEXT")
+    ctx.add_column("issues", "screen_lease_until", "DATETIME NULL", "DATETIME")
@@ -0,0 +1,38 @@
+# 0008: append-only log of admin approve / reject decisions.
+# Issue ids say nothing about when a report was decided, so the online
+# veracity trainer (ai/train_veracity_online.py) keeps its job watermark on
+# this log's id and reads only the labels added since its last run.
+# Decisions already recorded on issues are copied in once, in id order.
+
+TABLES = {
+    "mysql": """
+        CREATE TABLE IF NOT EXISTS admin_decisions (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            issue_id INT NOT NULL,
+            label TINYINT NOT NULL,
+            decided_at DATETIME
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    "sqlite": """
+        CREATE TABLE IF NOT EXISTS admin_decisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            issue_id INTEGER NOT NULL,
+            label INTEGER NOT NULL,
+            decided_at DATETIME
+        )
+    """,
+}
+
+
+def upgrade(ctx):
+    ctx.execute(TABLES[ctx.dialect])
+    # label: 0 = approved (legit), 1 = rejected (fake), as in ai/export_admin_label.py
+    ctx.execute(
+        """
+        INSERT INTO admin_decisions (issue_id, label, decided_at)
+        SELECT id, CASE WHEN approved_by_admin = 1 THEN 0 ELSE 1 END, NULL
+        FROM issues
+        WHERE approved_by_admin = 1 OR status = 'Rejected'
+        ORDER BY id
+        """
+    )
@@ -0,0 +1,52 @@
+-- 0001: base tables used by backend/utils/db_utils.py and the routes.
+-- Secondary indexes live in 0002 so they are also added to pre-existing tables.
+
+CREATE TABLE IF NOT EXISTS users (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100),
+    email VARCHAR(255),
+    mobile VARCHAR(20)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS user_auth (
+    user_id INT PRIMARY KEY,
+    password_hash VARCHAR(255) NOT NULL,
+    created_at DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS admins (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    username VARCHAR(100) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    email VARCHAR(255),
+    created_at DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS departments (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    department_name VARCHAR(150) NOT NULL,
+    username VARCHAR(100) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    created_at DATETIME
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS issues (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    category VARCHAR(50),
+    latitude DOUBLE,
+    longitude DOUBLE,
+    address VARCHAR(255),
+    severity INT DEFAULT 1,
+    status VARCHAR(30) DEFAULT 'Pending',
+    timestamp DATETIME NOT NULL,
+    user_id INT,
+    ai_category VARCHAR(50),
+    ai_severity INT,
+    assigned_department VARCHAR(150),
+    approved_by_admin TINYINT DEFAULT 0,
+    admin_comment TEXT,
+    ai_veracity VARCHAR(20),
+    is_suspicious TINYINT DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -0,0 +1,51 @@
+-- 0001: base tables (SQLite stand-in for the MySQL schema).
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    email TEXT,
+    mobile TEXT
+);
+
+CREATE TABLE IF NOT EXISTS user_auth (
+    user_id INTEGER PRIMARY KEY,
+    password_hash TEXT NOT NULL,
+    created_at DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS admins (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    email TEXT,
+    created_at DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS departments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    department_name TEXT NOT NULL,
+    username TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    created_at DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT,
+    category TEXT,
+    latitude REAL,
+    longitude REAL,
+    address TEXT,
+    severity INTEGER DEFAULT 1,
+    status TEXT DEFAULT 'Pending',
+    timestamp DATETIME NOT NULL,
+    user_id INTEGER,
+    ai_category TEXT,
+    ai_severity INTEGER,
+    assigned_department TEXT,
+    approved_by_admin INTEGER DEFAULT 0,
+    admin_comment TEXT,
+    ai_veracity TEXT,
+    is_suspicious INTEGER DEFAULT 0
+);
@@ -0,0 +1,7 @@
+-- 0005: resume points for batch jobs (ai/backfill_predictions.py, ...).
+
+CREATE TABLE IF NOT EXISTS job_watermarks (
+    job TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME
+);
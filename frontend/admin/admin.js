@@ -5,33 +5,36 @@ if (!token) {
 
 // ----- Filter Globals -----
 let allIssues = [];
+let nextCursor = null;   // next page of /api/admin/issues, null on the last one
 const dateFilter = document.getElementById("dateFilter");
 const categoryFilter = document.getElementById("categoryFilter");
 
 // ----- Fetch Issues -----
-async function loadIssues() {
+// more=true appends the next page to the ones already shown
+async function loadIssues(more = false) {
     console.log("Admin: Loading issues...");
     try {
-        const res = await fetch('http://127.0.0.1:8000/api/admin/issues', {
+        const data = await fetchPage('http://127.0.0.1:8000/api/admin/issues', more ? nextCursor : null, {
             headers: { "Authorization": `Bearer ${token}` }
         });
 
-        if (res.status === 401) {
+        if (data.status_code === 401) {
             console.warn("Unauthorized, redirecting...");
             localStorage.removeItem("admin_token");
             window.location.href = "../login.html";
             return;
         }
 
-        const data = await res.json();
-
         const tableBody = document.querySelector("#issueTableBody");
-        if (tableBody) tableBody.innerHTML = "";
+        if (tableBody && !more) tableBody.innerHTML = "";
 
         if (data.status === 'success') {
-            allIssues = data.issues || [];
+            allIssues = more ? allIssues.concat(data.issues || []) : (data.issues || []);
+            nextCursor = data.next_cursor;
             console.log(`Loaded ${allIssues.length} issues.`);
-            renderTable(allIssues);
+            if (more) applyFilters();
+            else renderTable(allIssues);
+            showLoadMore(tableBody && tableBody.closest("table"), nextCursor, () => loadIssues(true));
         } else {
             console.error("API returned error:", data.message);
             if (tableBody) tableBody.innerHTML =
@@ -123,6 +126,8 @@ function renderTable(issuesToRender) {
             } else if (aiVerdict === "legit") {
                 aiBadgeText = "Legit";
                 aiBadgeStyle = "background:#dcfce7; color:#166534; border:1px solid #bbf7d0;";
+            } else if (aiVerdict === "pending") {
+                aiBadgeText = "Scoring…";
             } else if (aiVerdict === "low_quality") {
                 aiBadgeText = "Low Quality";
                 aiBadgeStyle = "background:#fef9c3; color:#854d0e; border:1px solid #fde68a;";
@@ -30,27 +30,31 @@ function getStatusText(issue) {
 
 // ----- Filter Globals -----
 let allIssues = [];
+let nextCursor = null;   // next page of the user's issues, null on the last one
 const dateFilter = document.getElementById("dateFilter");
 const categoryFilter = document.getElementById("categoryFilter");
 
 // ----- Fetch and render issues -----
-async function loadIssues() {
+// more=true appends the next page to the ones already shown
+async function loadIssues(more = false) {
     const tableBody = document.getElementById("issueTableBody");
-    tableBody.innerHTML = "<tr><td colspan='7' style='text-align:center; padding: 40px;'>Loading issues...</td></tr>";
+    if (!more) tableBody.innerHTML = "<tr><td colspan='7' style='text-align:center; padding: 40px;'>Loading issues...</td></tr>";
 
     try {
         // Get user ID from localStorage or default to 1 (fallback)
         const userId = localStorage.getItem('user_id') || 1;
-        const res = await fetch(`http://127.0.0.1:8000/api/issues/?user_id=${userId}`);
-        const data = await res.json();
+        const data = await fetchPage(`http://127.0.0.1:8000/api/issues/?user_id=${userId}`, more ? nextCursor : null);
 
-        if (data.status !== "success" || !data.data.length) {
+        if (data.status !== "success" || (!more && !data.data.length)) {
             tableBody.innerHTML = "<tr><td colspan='7' style='text-align:center; padding: 40px; color: var(--text-muted);'>No issues reported yet</td></tr>";
             return;
         }
 
-        allIssues = data.data; // Store for filtering
-        renderTable(allIssues);
+        allIssues = more ? allIssues.concat(data.data) : data.data; // Store for filtering
+        nextCursor = data.next_cursor;
+        if (more) applyFilters();
+        else renderTable(allIssues);
+        showLoadMore(tableBody.closest("table"), nextCursor, () => loadIssues(true));
 
     } catch (err) {
         console.error("Error fetching issues:", err);
@@ -22,30 +22,33 @@ if (deptName) {
 
 // ----- Globals -----
 let allIssues = [];
+let nextCursor = null;   // next page of /api/department/issues, null on the last one
 const dateFilter = document.getElementById("dateFilter");
 
 // ----- Fetch Issues -----
-async function loadIssues() {
+// more=true appends the next page to the ones already shown
+async function loadIssues(more = false) {
     try {
-        const res = await fetch('http://127.0.0.1:8000/api/department/issues', {
+        const result = await fetchPage('http://127.0.0.1:8000/api/department/issues', more ? nextCursor : null, {
             headers: { "Authorization": `Bearer ${token}` }
         });
 
-        if (res.status === 401) {
+        if (result.status_code === 401) {
             alert("Session expired");
             localStorage.removeItem("dept_token");
             window.location.href = "../login.html";
             return;
         }
 
-        const result = await res.json();
-
         const tableBody = document.getElementById("issueTableBody");
-        if (tableBody) tableBody.innerHTML = "";
+        if (tableBody && !more) tableBody.innerHTML = "";
 
         if (result.status === 'success') {
-            allIssues = result.issues || [];
-            renderTable(allIssues);
+            allIssues = more ? allIssues.concat(result.issues || []) : (result.issues || []);
+            nextCursor = result.next_cursor;
+            if (more) applyFilters();
+            else renderTable(allIssues);
+            showLoadMore(tableBody && tableBody.closest("table"), nextCursor, () => loadIssues(true));
         } else {
             console.error("Failed to load issues");
         }
@@ -29,13 +29,17 @@ async function loadIssue() {
 
         // Checking `backend/routes/issues.py`... I didn't verify it has GET /{id}. 
         // Admin route has. Let's try fetching from /api/department/issues and finding it.
-        const res = await fetch('http://127.0.0.1:8000/api/department/issues', {
-            headers: { "Authorization": `Bearer ${token}` }
-        });
-        const result = await res.json();
-        if (result.status !== 'success') throw new Error("Failed to load");
-
-        const issue = result.issues.find(i => i.id == issueId);
+        // Pages are read one at a time and the walk stops at the page that has it.
+        let issue = null;
+        let cursor = null;
+        do {
+            const result = await fetchPage('http://127.0.0.1:8000/api/department/issues', cursor, {
+                headers: { "Authorization": `Bearer ${token}` }
+            });
+            if (result.status !== 'success') throw new Error("Failed to load");
+            issue = (result.issues || []).find(i => i.id == issueId);
+            cursor = result.next_cursor;
+        } while (!issue && cursor);
         if (!issue) throw new Error("Issue not found or access denied");
 
         // Render
@@ -61,3 +61,41 @@ function timeAgo(dateString) {
     return date.toLocaleDateString();
 }
 window.timeAgo = timeAgo;
+
+// List endpoints are cursor-paginated: fetch one page at a time, passing the
+// previous page's next_cursor (null for the first). The HTTP status is kept
+// on the result as status_code.
+async function fetchPage(url, cursor = null, options = {}) {
+    const pageUrl = new URL(url);
+    if (cursor) pageUrl.searchParams.set('cursor', cursor);
+    const res = await fetch(pageUrl, options);
+    const data = await res.json();
+    data.status_code = res.status;
+    return data;
+}
+
+// "Load more" button right after `anchor` (the issues table), shown while
+// there is a next page; onClick fetches and renders it.
+function showLoadMore(anchor, nextCursor, onClick) {
+    if (!anchor) return;
+    let btn = anchor.nextElementSibling;
+    if (!btn || !btn.classList.contains('load-more')) {
+        btn = document.createElement('button');
+        btn.className = 'btn btn-secondary load-more';
+        btn.style.cssText = 'display: block; margin: 16px auto;';
+        anchor.after(btn);
+    }
+    btn.textContent = 'Load more';
+    btn.disabled = false;
+    btn.style.display = nextCursor ? 'block' : 'none';
+    btn.onclick = async () => {
+        btn.disabled = true;
+        btn.textContent = 'Loading...';
+        try {
+            await onClick();
+        } finally {
+            btn.disabled = false;
+            btn.textContent = 'Load more';
+        }
+    };
+}